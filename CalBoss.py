@@ -25,1148 +25,5249 @@
 #     Changes  :
 #
 
+import io
 import sys
-import pytz
+import json
+import time
 import pickle
 import random
+import socket
+import sqlite3
 import os.path
+import re
+import heapq
+import bisect
 import argparse
+import functools
+import threading
+import contextlib
 
 from datetime import datetime, timedelta, timezone
-from dateutil.relativedelta import relativedelta
 
-from googleapiclient.discovery      import build
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow      import InstalledAppFlow
+#
+# pytz, dateutil and the google client stack are imported inside the
+# functions that need them: --help, --version and daemon-answered commands
+# never pay for them.
+#
 
-VERSION = '1.01'
-SCOPES  = ['https://www.googleapis.com/auth/calendar']
+VERSION    = '1.01'
+SCOPES     = ['https://www.googleapis.com/auth/calendar']
+CACHE_FILE = 'calboss-cache.db'
+
+# bump when the stored event shape (EVENT_FIELDS) or a table derived from
+# it changes
+CACHE_VERSION = 6
+
+# a full sync is written under this prefix + calendarId and swapped in with
+# the sync token, so a failed one never leaves a truncated copy behind
+SYNC_STAGING = '\0staging:'
+
+# optional local copy of the Calendar v3 discovery document
+DISCOVERY_FILE = 'calendar-v3-discovery.json'
+
+# events().list() paging - PAGE_SIZE is set from --page-size in Main()
+PAGE_SIZE    = 250
+EVENT_FIELDS = ('id,iCalUID,status,summary,location,description,start,end,recurrence,recurringEventId,'
+                'originalStartTime,htmlLink,extendedProperties,reminders,colorId,transparency,visibility,'
+                'attendees(self,responseStatus)')
+
+# open-ended views (no timeMax) expand recurring events this far ahead
+RECURRENCE_HORIZON = 366 * 24 * 60 * 60
+
+# working hours (local) used by --summary and --vibe-check
+WORKDAY_START = 9
+WORKDAY_END   = 17
+
+# private extendedProperties stamped on birthdays and catch-ups
+TAG_TYPE     = 'calboss_type'
+TAG_PERSON   = 'calboss_person'
+
+# max operations per batch request (Calendar API limit is 50)
+BATCH_SIZE   = 50
+
+# set from --no-cache in Main()
+USE_CACHE  = True
+
+# birthday index is rebuilt from the calendar once it is older than this
+BIRTHDAY_INDEX_TTL = 24 * 60 * 60
+
+# catch-ups: default frequency (months) written to new events, first
+# suggestion for someone new, and when the catch-up index is rebuilt
+CATCHUP_FREQUENCY = 18
+CATCHUP_FIRST     = 6
+CATCHUP_INDEX_TTL = 24 * 60 * 60
+CATCHUP_PATTERN   = re.compile(r'frequency:\s*(\d+)\s*month', re.IGNORECASE)
+
+# catch-up slots: evening start hours tried in order (local), length in
+# hours, days either side of the due date, preferred days between two
+# catch-ups booked together
+CATCHUP_HOURS   = (20, 19, 21, 18)
+CATCHUP_LENGTH  = 1
+CATCHUP_JITTER  = 60
+CATCHUP_SPACING = 3
+
+# --search: ranked results shown, bm25 weights for summary/location/description
+SEARCH_LIMIT   = 25
+SEARCH_WEIGHTS = (10.0, 5.0, 1.0)
+
+# --insights: years looked back (unless --since/--until) and busiest weeks listed
+INSIGHTS_YEARS = 5
+INSIGHTS_WEEKS = 5
+
+# calendars merged by --today/--week/--dashboard, set from --calendars or
+# CALENDARS_FILE in Main()
+CALENDARS_FILE = 'calendars.txt'
+CALENDARS      = ['primary']
+
+# daemon mode - SYNC_ON_READ is cleared while the daemon's refresh loop
+# owns syncing; after a DAEMON_WRITES command a running daemon is told to
+# re-sync at once
+DAEMON_SOCKET   = 'calboss.sock'
+DAEMON_REFRESH  = 60
+DAEMON_TIMEOUT  = 30
+DAEMON_COMMANDS = {'today', 'week', 'dashboard', 'summary', 'vibe_check',
+                   'search', 'search_all', 'insights',
+                   'bday_show', 'bday_show_all', 'bday_show_today'}
+DAEMON_OPTIONS  = {'showids', 'page_size', 'since', 'until'}
+DAEMON_WRITES   = {'add', 'remove', 'note', 'bday_add', 'bday_import', 'bday_remove',
+                   'catchup', 'catchup_clear', 'import', 'migrate_tags'}
+SYNC_ON_READ    = True
+
+# --watch: seconds between sync polls, and how far past the view's window
+# the held event set reaches (reloaded once that margin is used up)
+WATCH_INTERVAL = 60
+WATCH_MARGIN   = 24 * 60 * 60
+
+# --export / --import backups: NDJSON, one {"calendarId", "event"} per line,
+# gzip or zstd compressed when the file name ends in .gz or .zst
+EXPORT_FILE = 'calboss-backup.ndjson'
+
+# --import: batches in flight at once
+IMPORT_WORKERS = 4
+
+# every API call goes through Execute(): a client-side token bucket sized
+# to the Calendar per-user quota (600/min) and up to API_RETRIES jittered
+# exponential backoffs (capped at API_BACKOFF_CAP s) on 429/403-rate/5xx
+API_RATE        = 10
+API_BURST       = 50
+API_RETRIES     = 5
+API_BACKOFF_CAP = 32
+
+# requests that create an event - a 5xx or dropped connection may come after
+# the server applied them, so they are retried on rate limits only
+API_CREATES = {'calendar.events.insert', 'calendar.events.import', 'calendar.events.quickAdd'}
+
+# process-wide singletons, see GetCalendarService(), ThreadHttp() and
+# RunThreaded() - the worker pool outlives each call so that the per-thread
+# connections in _threadState are reused by the next one
+_credentials     = None
+_calendarService = None
+_threadState     = threading.local()
+_threadPool      = None
+_threadPoolLock  = threading.Lock()
+
+# token bucket and retry counters shared by every thread, see Execute()
+_apiLock   = threading.Lock()
+_apiBucket = {'tokens': API_BURST, 'stamp': time.monotonic()}
+_apiStats  = {'requests': 0, 'retries': 0, 'backoff': 0.0, 'throttled': 0.0}
+
+# --profile / --trace: PROFILE is set in Main(); finished spans and wire
+# counters are collected here by Span() and InstrumentHttp()
+PROFILE       = False
+_profileStart = time.perf_counter()
+_spans        = []
+_spanLock     = threading.Lock()
+_wireStats    = {'requests': 0, 'sent': 0, 'received': 0}
 
 ###############################################################################
 #
-# Procedure   : GetCalendarService()
+# Procedure   : Span()
 #
-# Description : Authenticate and connect to Google Calendar API.
-#             : - Use credentials.json for first-time access.
-#             : - Store/refresh token in token.pickle.
+# Description : Times the enclosed block when PROFILE is on (no-op
+#             : otherwise). Spans nest per thread, so each one also
+#             : knows its self time (minus the spans inside it).
 #
-# Input       : -none-
+# Input       : name     - string - what is being timed
+#             : category - string - 'phase', 'api', 'http' or 'render'
+#             : args     - extra values shown in the trace viewer
 #
-# Returns     : object - Google Calendar Service
+# Returns     : context manager
 #
 ###############################################################################
 
-def GetCalendarService():
+@contextlib.contextmanager
+def Span(name, category='phase', **args):
 
-    creds = None
+    if not PROFILE:
+        yield
+        return
 
-    # check for saved token
-    if os.path.exists('token.pickle'):
-        with open('token.pickle', 'rb') as token:
-            creds = pickle.load(token)
+    stack = _threadState.__dict__.setdefault('spans', [])
+    inner = [0.0]
+    start = time.perf_counter()
 
-    # if no valid token, start OAuth flow
-    if not creds or not creds.valid:
+    stack.append(inner)
 
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
+    try:
+        yield
 
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                'credentials.json', SCOPES)
-            creds = flow.run_local_server(port=0)
+    finally:
+        duration = time.perf_counter() - start
+        stack.pop()
 
-        # save token for future use
-        with open('token.pickle', 'wb') as token:
-            pickle.dump(creds, token)
+        if stack:
+            stack[-1][0] += duration
 
-    return build('calendar', 'v3', credentials=creds)
+        with _spanLock:
+            _spans.append((name, category, start, duration, duration - inner[0], threading.get_ident(), args))
 
 
 ###############################################################################
 #
-# Procedure   : FetchTodayEvents()
+# Procedure   : Timed()
 #
-# Description : Pulls all Google Calendar events for the current day
-#             : Uses timezone-aware window from now until midnight
+# Description : Decorator form of Span(), named after the function.
 #
-# Input       : service - Google Calendar API service object
+# Input       : category - string - see Span()
 #
-# Returns     : list - all events scheduled for today
+# Returns     : function - decorator
 #
 ###############################################################################
 
-def FetchTodayEvents(service):
-
-    # todo - make this dynamic
-    tz    = pytz.timezone("America/New_York")
-    now   = datetime.now(tz)
-    start = now.isoformat()
-    end   = (now + timedelta(days=1)).isoformat()
-
-    eventResult = service.events().list(
-        calendarId   = 'primary',
-        timeMin      = start,
-        timeMax      = end,
-        singleEvents = True,
-        orderBy      = 'startTime'
-    ).execute()
+def Timed(category='phase'):
 
-    allEvents = eventResult.get('items', [])
+    def Decorate(function):
 
-    # chat gpt hack
-    # filter to events happening *today* (EDT)
-    today          = now.strftime("%Y-%m-%d")
-    filteredEvents = []
+        @functools.wraps(function)
+        def Wrapper(*args, **kwargs):
 
-    for event in allEvents:
+            if not PROFILE:
+                return function(*args, **kwargs)
 
-        startTime = event['start'].get('dateTime', event['start'].get('date'))
+            with Span(function.__name__, category):
+                return function(*args, **kwargs)
 
-        if today in startTime:
-            filteredEvents.append(event)
+        return Wrapper
 
-    return filteredEvents
+    return Decorate
 
 
 ###############################################################################
 #
-# Procedure   : FetchWeekEvents()
+# Procedure   : InstrumentHttp()
 #
-# Description : Pulls Google Calendar events for next 7 days (today + 6).
-#             : Returns dictionary grouped by date.
+# Description : Wraps an httplib2-style connection so every HTTP round
+#             : trip is a Span() and counted in _wireStats (requests,
+#             : bytes sent, bytes received). Batches count as one.
 #
-# Input       : service - Google Calendar API service object
+# Input       : http - object - httplib2.Http / AuthorizedHttp
 #
-# Returns     : dict - key = readable date label, value = list of events
+# Returns     : object - the same connection
 #
 ###############################################################################
 
-def FetchWeekEvents(service):
-
-    tz    = pytz.timezone("America/New_York")
-    now   = datetime.now(tz)
-    start = now.isoformat()
-    end   = (now + timedelta(days=7)).isoformat()
-
-    eventResult = service.events().list(
-        calendarId   = 'primary',
-        timeMin      = start,
-        timeMax      = end,
-        singleEvents = True,
-        orderBy      = 'startTime'
-    ).execute()
-
-    allEvents     = eventResult.get('items', [])
-    groupedEvents = {}
-
-    for event in allEvents:
+def InstrumentHttp(http):
 
-        start = event['start'].get('dateTime', event['start'].get('date'))
-        dt    = datetime.fromisoformat(start) if 'T' in start else datetime.strptime(start, "%Y-%m-%d")
-        dt    = dt.astimezone(tz)
+    request = http.request
 
-        dayLabel = ""
+    def Request(uri, method='GET', body=None, headers=None, *args, **kwargs):
 
-        if dt.date() == now.date():
-            dayLabel = f"Today ({dt.strftime('%b %d')})"
+        with Span(f"{method} {uri.split('?')[0].split('/calendar/v3')[-1]}", 'http'):
+            response, content = request(uri, method, body, headers, *args, **kwargs)
 
-        elif dt.date() == (now + timedelta(days=1)).date():
-            dayLabel = f"Tomorrow ({dt.strftime('%b %d')})"
+        with _spanLock:
+            _wireStats['requests'] += 1
+            _wireStats['sent']     += len(body.encode() if isinstance(body, str) else body or b'')
+            _wireStats['received'] += len(content or b'')
 
-        else:
-            dayLabel = dt.strftime("%A (%b %d)")
+        return response, content
 
-        groupedEvents.setdefault(dayLabel, []).append(event)
+    http.request = Request
 
-    return groupedEvents
+    return http
 
 
 ###############################################################################
 #
-# Procedure   : PrintHelp()
+# Procedure   : PrintProfile()
 #
-# Description : Beautified --help 
+# Description : --profile: time per span name, slowest self time first,
+#             : then what went over the wire.
 #
 # Input       : -none-
 #
-# Returns     : -none- 
+# Returns     : -none-
 #
 ###############################################################################
 
-def PrintHelp():
+def PrintProfile():
 
-    # these came from some random inspirational website on the importance
-    # of having a digital calendar ... lost the url.
-    proTips = [ "📅 Add your events with --date and --starttime to stay in boss mode.",
-      "🔥 Repeating events? Use --repeat and never miss it again.",
-      "🧠 Block off 'focus hours' on your calendar to get sh*t done.",
-      "☕ Schedule your breaks. No one hustles non-stop without burning out.",
-      "📍 Use event notes to track locations, URLs, or secret food spots.",
-      "👀 Check your week every Monday. Be proactive, not reactive.",
-      #"🧼 Keep a backup with --export — you future self will thank you.",
-      "⏰ Reminders aren’t for the forgetful — they’re for the focused.",
-      "📆 If it’s not in the calendar, it’s not happening.",
-      #"🔎 Use --search to find events fast — one should not have to battle a web gui.",
-      #"🧠 Use --search-all to pull past and future events.",
-      "🛑 Book a full day with --allday"]
+    totals = {}
 
-    helpText = """\
-CalBoss: Google calendar integration for the command line. 📅 ✨ 
+    for name, category, start, duration, selfTime, thread, args in _spans:
+        entry     = totals.setdefault((category, name), [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += duration
+        entry[2] += selfTime
 
-Usage:
-  CalBoss [options]
+    print(f"\n⏱️  Profile (wall {(time.perf_counter() - _profileStart) * 1000:.1f} ms)\n")
+    print(f"{'phase':<40} {'calls':>6} {'total ms':>10} {'self ms':>10}")
 
-📆 Event Management:
-  --today                          Show today's schedule.
-  --week                           View full Monday–Sunday overview.
-  --add "<event>"                  Add an event (e.g. "Call with Lisa at 1PM").
-  --date YYYY-MM-DD                Set date for event (required with --add).
-  --starttime HH:MM                Start time (24hr or AM/PM).
-  --endtime HH:MM                  End time (24hr or AM/PM).
-  --allday                         All day event. 
-  --location "<place>"             Include a location with your event.
-  --reminder <duration>            Reminder before event (e.g. 15m, 1h).
-  --remove <event_id>              Delete an event by ID.
-  --note <event_id> "<note>"       Add a note to an existing event.
-  --repeat                         Repeat events (e.g. daily, weekly, monthly, yearly).
+    for (category, name), (calls, total, selfTime) in sorted(totals.items(), key=lambda item: -item[1][2]):
+        print(f"{category + ': ' + name:<40.40} {calls:>6} {total * 1000:>10.1f} {selfTime * 1000:>10.1f}")
 
-🎂 Birthday:
-  --bday-add "<Name> MM/DD"        Add a birthday (auto-repeats yearly).
-  --bday-remove "<Name>"           Remove a birthday.
-  --bday-show                      Show birthdays this month.
-  --bday-show --all                Show all saved birthdays.
+    print(f"\n🌐 {_wireStats['requests']} HTTP requests ({_apiStats['retries']} retries), "
+          f"{_wireStats['sent'] / 1024:.1f} KB sent, {_wireStats['received'] / 1024:.1f} KB received")
 
-👫 Catch-Up Mode:
-  --catchup-suggest "<Name, ...>"  Suggests when to check in with each person.
-  --catchup "<Name>" 
-       --date YYYY-MM-DD           Schedule a personal check-in. Adds a [Catch-Up] event.
-       [--reminder <time>]         (Optional) Set a pre-check-in reminder.
-  --catchup-list                   Show upcoming catch-up events.
-  --catchup-clear "<Name>"         Remove someone from your catch-up list.
-"""
 
+###############################################################################
 #
-# TODO: enable these functions
+# Procedure   : WriteTrace()
 #
-
-#📊 Overview & Planning:
-#  --insights                       Analyze patterns (best/worst days).
-#  --search "<keyword>"             Search upcoming events by keyword in title, notes, or location.
-#  --search-all "<keyword>"         Search your full calendar — past, present, future. Total recall.
-#  --showids                        Display event IDs in schedule output for reference.
+# Description : --trace: writes the spans as a Chrome trace-event file
+#             : (open in chrome://tracing or ui.perfetto.dev).
 #
-#🔧 Other:
-#  --export                         Save all data to calboss-backup.json.
-#  --import <file>                  Load data from a backup.
-#  --version                        Show CalBoss version.
-#  --help                           You’re looking at it.
+# Input       : path - string - output file
+#
+# Returns     : -none-
 #
+###############################################################################
 
-    helpText += """
-Examples:
-  CalBoss --today
-  CalBoss --add "Coffee with Sarah" --date 2025-05-24 --starttime 14:00 --endtime 15:00 --reminder 30m
-  CalBoss --bday-add "Charmaine 07/03"
-  CalBoss --bday-show-all
-  CalBoss --catchup-suggest "Lisa, Nick, Aunt Gina"
+def WriteTrace(path):
 
-✨ Pro Tip:
-"""
-    print(helpText + random.choice(proTips) + "\n")
+    threads = {}
+    events  = []
+
+    for name, category, start, duration, selfTime, thread, args in sorted(_spans, key=lambda span: span[2]):
+        events.append({
+            'name': name,
+            'cat' : category,
+            'ph'  : 'X',
+            'ts'  : (start - _profileStart) * 1e6,
+            'dur' : duration * 1e6,
+            'pid' : os.getpid(),
+            'tid' : threads.setdefault(thread, len(threads)),
+            'args': args
+        })
+
+    with open(path, 'w') as handle:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms',
+                   'otherData': dict(_wireStats, retries=_apiStats['retries'], version=VERSION)}, handle)
+
+    print(f"🧭 [INFO] Trace written to {path} ({len(events)} spans).")
 
 
 ###############################################################################
 #
-# Procedure   : ParseArgs()
+# Procedure   : GetCalendarService()
 #
-# Description : Parses command-line arguments.
+# Description : Authenticate and connect to Google Calendar API.
+#             : - Built once per process and reused by every caller.
+#             : - Uses the discovery document in DISCOVERY_FILE when
+#             :   present, otherwise the copy bundled with the client
+#             :   library - never fetched over the network.
 #
 # Input       : -none-
 #
-# Returns     : object - parsed args
+# Returns     : object - Google Calendar Service
 #
 ###############################################################################
 
-def ParseArgs():
+@Timed()
+def GetCalendarService():
 
-    parser = argparse.ArgumentParser(
-        description="CalBoss: Google calendar integration for the command line.  Stay organized. 📅 ✨",
-        add_help=False,
-        formatter_class=argparse.RawTextHelpFormatter
-    )
+    global _calendarService
 
-    # core features
-    parser.add_argument("--today",     action="store_true", help="Show today's schedule.")
-    parser.add_argument("--week",      action="store_true", help="View full Monday–Sunday overview.")
-    parser.add_argument("--add",       type=str,            help='Add an event (e.g. "Call with Lisa at 1PM").')
-    parser.add_argument("--date",      type=str,            help="Date of event (YYYY-MM-DD)")
-    parser.add_argument("--starttime", type=str,            help="Start time (e.g. 13:00 or 1PM)")
-    parser.add_argument("--endtime",   type=str,            help="End time (e.g. 14:00 or 2PM)")
-    parser.add_argument("--allday",    action="store_true", help="Add an all-day event (no start or end time needed)")
-    parser.add_argument("--location",  type=str,            help="Add a location to your event")
-    parser.add_argument("--reminder",  type=str,            help="Reminder before event (e.g. 15m, 1h)")
-    parser.add_argument("--remove",    type=str,            help="Remove an event by ID.")
-    parser.add_argument("--note",      nargs=2,             help='Add note to an event. Usage: --note <id> "Your note".')
-    parser.add_argument("--repeat", choices=["daily", "weekly", "monthly", "yearly"],
-                                                            help="Set recurrence frequency for repeating events")
+    if _calendarService is None:
 
-    # birthday
-    parser.add_argument("--bday-add",        type=str,            help='Add a birthday (e.g. "Lisa 03/29").')
-    parser.add_argument("--bday-remove",     type=str,            help="Remove a birthday by name.")
-    parser.add_argument("--bday-show",       action="store_true", help="Show birthdays this month.")
-    parser.add_argument("--bday-show-all",   action="store_true", help="Show all saved birthdays.")
-    parser.add_argument("--bday-show-today", action="store_true", help="Show today's birthdays.")
+        with Span('import googleapiclient'):
+            from googleapiclient.discovery import build, build_from_document
 
-    # catch-up
-    parser.add_argument("--catchup", type=str, help="Schedule a catch-up event with someone.")
-    parser.add_argument("--catchup-suggest", metavar="NAMES", type=str, help='Suggest when to catch up with each person (comma-separated). Example: "Lisa, Nick, Aunt Gina"')
-    parser.add_argument("--catchup-list", action="store_true", help="List upcoming catch-up events")
-    parser.add_argument("--catchup-clear", type=str, help="Remove all catch-up events for this person")
+        credentials = GetGoogleCredentials()
 
-    # summary 
-    parser.add_argument("--summary",    action="store_true", help="Show usage summary: hours booked vs free.")
-    parser.add_argument("--focus",      action="store_true", help="Filter for priority events only.")
-    parser.add_argument("--insights",   action="store_true", help="Analyze patterns (best/worst days).")
-    parser.add_argument("--vibe-check", action="store_true", help="Show today's time breakdown + free hours.")
-    parser.add_argument("--search",     type=str,            help="Search events by keyword")
-    parser.add_argument("--showids",    action="store_true", help="Display event IDs for reference and deletion.")
+        with Span('discovery build'):
 
-    # utility
-    parser.add_argument("--export",  action="store_true", help="Save all data to calboss-backup.json.")
-    parser.add_argument("--import",  type=str,            help="Load data from a backup file.")
-    parser.add_argument("--version", action="store_true", help="Show CalBoss version and exit.")
+            if os.path.exists(DISCOVERY_FILE):
+                with open(DISCOVERY_FILE) as document:
+                    _calendarService = build_from_document(document.read(), credentials=credentials)
 
-    # help
-    parser.add_argument("--help", action="store_true", help="Show this help message and exit.")
+            else:
+                _calendarService = build('calendar', 'v3', credentials=credentials,
+                                         static_discovery=True, cache_discovery=False)
 
-    return parser.parse_args()
+        if PROFILE:
+            InstrumentHttp(_calendarService._http)
 
+    return _calendarService
 
-##############################################################################
+
+###############################################################################
 #
-# Procedure   : AddEventToGoogleCalendar()
+# Procedure   : Throttle()
 #
-# Description : Adds an event to Google Calendar via API.
-#             : Supports timed or all-day events.
-#             : Optional reminder in 'Xm' or 'Xh' for popup alerts.
-#             : Optional location for where the event takes place.
-#             : Optional --repeat for recurring events (daily, weekly, etc.).
+# Description : Client-side token bucket: API_RATE requests/second with
+#             : bursts of API_BURST. A caller that overdraws the bucket
+#             : (a big batch) waits for the debt to refill; time spent
+#             : waiting is counted in _apiStats['throttled'].
 #
-# Input       : summary    - string  - Event description
-#             : date       - string  - Event date (YYYY-MM-DD)
-#             : startTime  - string  - Start time (HH:MM, 24hr or AM/PM) [optional if allDay]
-#             : endTime    - string  - End time (HH:MM, 24hr or AM/PM) [optional if allDay]
-#             : reminder   - string  - Optional (e.g. '15m', '1h')
-#             : allDay     - boolean - If True, creates an all-day event.
-#             : location   - string  - Optional (e.g. "Moe's Backyard")
-#             : repeat     - string  - Optional (e.g. 'daily', 'weekly', 'monthly', 'yearly')
+# Input       : cost - int - quota units the request uses (batch size)
 #
 # Returns     : -none-
 #
 ###############################################################################
 
-def AddEventToGoogleCalendar(summary, date, startTime=None, endTime=None, reminder=None, allDay=False, location=None, repeat=None):
-
-    service = GetCalendarService()
+def Throttle(cost=1):
 
-    #
-    # allDay: google makes you specify an end time.
-    #
+    with _apiLock:
 
-    if allDay:
-        event = {
-            "summary": summary,
-            "start"  : {"date": date},
-            "end"    : {"date": date},
-        }
+        now = time.monotonic()
 
-    #
-    # not allDay
-    #
+        _apiBucket['tokens'] = min(API_BURST, _apiBucket['tokens'] + (now - _apiBucket['stamp']) * API_RATE) - cost
+        _apiBucket['stamp']  = now
 
-    else:
-        startTime = f"{date}T{startTime}:00"
-        endTime   = f"{date}T{endTime}:00"
+        wait = max(0.0, -_apiBucket['tokens'] / API_RATE)
+        _apiStats['throttled'] += wait
 
-        event = {
-            "summary": summary,
-            "start"  : {"dateTime": startTime, "timeZone": "America/New_York"},
-            "end"    : {"dateTime": endTime,   "timeZone": "America/New_York"},
-        }
+    if wait:
+        time.sleep(wait)
 
-    #
-    # location
-    #
 
-    if location:
-        location = location.strip()
-        event["location"] = location
-        print(f"\U0001F4CD [INFO] Location set: {location}")
+###############################################################################
+#
+# Procedure   : IsRetryable()
+#
+# Description : True for failures worth retrying: rate limits (429, 403
+#             : rateLimitExceeded/userRateLimitExceeded), server errors
+#             : (5xx) and dropped connections. Requests that are not safe
+#             : to repeat only on rate limits, which the server answers
+#             : without applying the request.
+#
+# Input       : exception  - Exception - failed request
+#             : idempotent - boolean   - safe to send twice [optional]
+#
+# Returns     : boolean
+#
+###############################################################################
 
-        desc_text = f"Location: {location.strip()}"
+def IsRetryable(exception, idempotent=True):
 
-        if "description" in event:
-            event["description"] += f"\n{desc_text}"
-        else:
-            event["description"] = desc_text
+    status = getattr(getattr(exception, 'resp', None), 'status', None)
 
-    #
-    # reminder
-    #
+    if idempotent and (isinstance(exception, (ConnectionError, TimeoutError, socket.timeout)) or (status or 0) >= 500):
+        return True
 
-    if reminder:
-        try:
-            amount  = int(reminder[:-1])
-            unit    = reminder[-1]
-            minutes = amount * 60 if unit == 'h' else amount
+    if status == 429:
+        return True
 
-            event["reminders"] = {
-                "useDefault": False,
-                "overrides" : [{"method": "popup", "minutes": minutes}]
-            }
+    return status == 403 and b'ratelimitexceeded' in (getattr(exception, 'content', b'') or b'').lower()
 
-        except:
-            print(f"\u26A0\uFE0F [WARNING] Invalid reminder format: '{reminder}'. Use '15m' or '1h'.")
 
-    #
-    # repeat
-    #
+###############################################################################
+#
+# Procedure   : IsIdempotent()
+#
+# Description : False for requests that create an event (API_CREATES),
+#             : and for batches holding one.
+#
+# Input       : request - object - googleapiclient HttpRequest / BatchHttpRequest
+#
+# Returns     : boolean
+#
+###############################################################################
 
-    if repeat:
-        event["recurrence"] = [f"RRULE:FREQ={repeat.upper()}"]
-        print(f"🔁 [INFO] Repeat set: {repeat}")
+def IsIdempotent(request):
 
-    # create event using google api
-    createdEvent = service.events().insert(calendarId='primary', body=event).execute()
+    # BatchHttpRequest keeps its parts in _requests (no public accessor)
+    if hasattr(request, '_requests'):
+        return all(map(IsIdempotent, request._requests.values()))
 
-    print(f"✅ [INFO] Event created: {createdEvent.get('htmlLink')}")
+    return getattr(request, 'methodId', None) not in API_CREATES
 
 
 ###############################################################################
 #
-# Procedure   : FormatTime(time_str)
+# Procedure   : Backoff()
 #
-# Description : Takes an ISO 8601 datetime string and makes it human readable. 
+# Description : Sleeps before retry number 'attempt': exponential with
+#             : jitter (half fixed, half random, capped at API_BACKOFF_CAP),
+#             : or longer if the server sent Retry-After.
 #
-# Input       : input - Datetime string (e.g., "2025-05-27T14:00:00Z")
+# Input       : attempt   - int       - 0 for the first retry
+#             : exception - Exception - the failure being retried
 #
-# Returns     : string - time in format of "HH:MM AM/PM"
+# Returns     : -none-
 #
 ###############################################################################
 
-def FormatTime(input):
+def Backoff(attempt, exception):
+
+    base  = min(API_BACKOFF_CAP, 2 ** attempt)
+    delay = base / 2 + random.uniform(0, base / 2)
 
     try:
-        dt = datetime.fromisoformat(input.replace('Z', '+00:00'))
+        delay = max(delay, float(getattr(exception, 'resp', {}).get('retry-after', 0)))
+
+    except (AttributeError, TypeError, ValueError):
+        pass
+
+    with _apiLock:
+        _apiStats['retries'] += 1
+        _apiStats['backoff'] += delay
+
+    time.sleep(delay)
+
+
+###############################################################################
+#
+# Procedure   : Execute()
+#
+# Description : Runs one API request (or batch request); every .execute()
+#             : in CalBoss goes through here.
+#             : - Waits for the token bucket (Throttle()).
+#             : - Retries retryable failures (IsRetryable()) up to
+#             :   API_RETRIES times with Backoff(); anything else, or the
+#             :   last failure, is raised to the caller as before.
+#             : - Requests that create events (IsIdempotent()) are only
+#             :   retried on rate limits, so a retry never duplicates one.
+#
+# Input       : request - object - googleapiclient HttpRequest / BatchHttpRequest
+#             : http    - object - connection to use [optional, for threads]
+#             : cost    - int    - quota units (operations in a batch)
+#
+# Returns     : object - the request's response
+#
+###############################################################################
+
+def Execute(request, http=None, cost=1):
+
+    for attempt in range(API_RETRIES + 1):
+
+        Throttle(cost)
+
+        with _apiLock:
+            _apiStats['requests'] += 1
+
+        try:
+            with Span(getattr(request, 'methodId', None) or 'batch', 'api', attempt=attempt, cost=cost):
+                return request.execute(http=http)
+
+        except Exception as e:
+
+            if attempt == API_RETRIES or not IsRetryable(e, IsIdempotent(request)):
+                raise
+
+            Backoff(attempt, e)
+
+
+###############################################################################
+#
+# Procedure   : FetchEventPages()
+#
+# Description : Streams events().list() results one page at a time.
+#             : - Follows nextPageToken until the listing is exhausted.
+#             : - Sends a fields= mask so only the parts we use are sent.
+#             : - Page size is tunable (--page-size, max 2500).
+#             : Callers that stop iterating early stop fetching too.
+#
+# Input       : service  - Google Calendar API service object
+#             : fields   - string - per-item partial response mask
+#             : pageSize - int    - maxResults per page [optional]
+#             : http     - object - connection to use [optional, for threads]
+#             : params   - events().list() query parameters
+#
+# Returns     : generator - one response dict per page
+#
+###############################################################################
+
+def FetchEventPages(service, fields=EVENT_FIELDS, pageSize=None, http=None, **params):
+
+    request = service.events().list(
+        maxResults = pageSize or PAGE_SIZE,
+        fields     = f"nextPageToken,nextSyncToken,items({fields})",
+        **params
+    )
+
+    while request is not None:
+        page = Execute(request, http)
+        yield page
+        request = service.events().list_next(request, page)
+
+
+###############################################################################
+#
+# Procedure   : FetchEvents()
+#
+# Description : Same as FetchEventPages() but yields individual events.
+#
+# Input       : service  - Google Calendar API service object
+#             : fields   - string - per-item partial response mask
+#             : pageSize - int    - maxResults per page [optional]
+#             : http     - object - connection to use [optional, for threads]
+#             : params   - events().list() query parameters
+#
+# Returns     : generator - event dicts
+#
+###############################################################################
+
+def FetchEvents(service, fields=EVENT_FIELDS, pageSize=None, http=None, **params):
+
+    for page in FetchEventPages(service, fields, pageSize, http, **params):
+        yield from page.get('items', [])
+
+
+###############################################################################
+#
+# Procedure   : CalBossTags()
+#
+# Description : extendedProperties stamped on events CalBoss creates, so
+#             : readers can ask the server for exactly those events with a
+#             : privateExtendedProperty filter.
+#
+# Input       : kind   - string - 'birthday' or 'catchup'
+#             : person - string - person's name
+#
+# Returns     : dict - value for the event's 'extendedProperties'
+#
+###############################################################################
+
+def CalBossTags(kind, person):
+
+    return {'private': {TAG_TYPE: kind, TAG_PERSON: person}}
+
+
+###############################################################################
+#
+# Procedure   : EventTag()
+#
+# Description : Reads one CalBoss tag from an event.
+#
+# Input       : event - dict   - API event
+#             : key   - string - TAG_TYPE or TAG_PERSON
+#
+# Returns     : string - tag value, '' when untagged
+#
+###############################################################################
+
+def EventTag(event, key):
+
+    return event.get('extendedProperties', {}).get('private', {}).get(key, '')
+
+
+###############################################################################
+#
+# Procedure   : LocalTimezone()
+#
+# Description : Timezone used for all-day events and the day/week windows.
+#
+# Input       : -none-
+#
+# Returns     : object - pytz timezone
+#
+###############################################################################
+
+def LocalTimezone():
+
+    import pytz
+
+    return pytz.timezone("America/New_York")
+
+
+###############################################################################
+#
+# Procedure   : EventEpoch()
+#
+# Description : Converts an event 'start' or 'end' field to epoch seconds.
+#             : All-day events ('date') are anchored at local midnight.
+#
+# Input       : edge - dict - event['start'] or event['end']
+#
+# Returns     : float - seconds since the epoch
+#
+###############################################################################
+
+def EventEpoch(edge):
+
+    return EventTime(edge).timestamp()
+
+
+###############################################################################
+#
+# Procedure   : TimeBoundEpoch()
+#
+# Description : Converts a timeMin/timeMax style ISO string to epoch seconds.
+#             : Naive strings are treated as UTC, the same as the API does
+#             : with the 'Z' suffix the callers append.
+#
+# Input       : value - string - ISO 8601 datetime
+#
+# Returns     : float - seconds since the epoch
+#
+###############################################################################
+
+def TimeBoundEpoch(value):
+
+    dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+
+    return dt.timestamp()
+
+
+###############################################################################
+#
+# Class       : Event
+#
+# Description : One event as the views see it, parsed from an API item
+#             : exactly once (ExpandEvents() builds them).
+#             : - start/end      : aware datetimes (all-day events at
+#             :                    local midnight), *Epoch the same in
+#             :                    epoch seconds.
+#             : - kind/person    : CalBoss tags ('' when untagged).
+#             : - transparent    : 'show me as available'.
+#             : - response       : my own RSVP ('' when not invited).
+#             : - summary        : interned - recurring series repeat it.
+#             : __slots__ keeps a large window small in memory.
+#
+# Input       : item - dict - API event (single, instance or exception)
+#
+###############################################################################
+
+class Event:
+
+    __slots__ = ('id', 'summary', 'location', 'description', 'start', 'end',
+                 'startEpoch', 'endEpoch', 'allDay', 'kind', 'person', 'transparent', 'response')
+
+    def __init__(self, item):
+
+        self.id          = item.get('id', '')
+        self.summary     = sys.intern(item.get('summary', '(No Title)'))
+        self.location    = item.get('location', '')
+        self.description = item.get('description', '').strip()
+        self.allDay      = 'dateTime' not in item['start']
+        self.start       = EventTime(item['start'])
+        self.end         = EventTime(item['end'])
+        self.startEpoch  = self.start.timestamp()
+        self.endEpoch    = self.end.timestamp()
+        self.kind        = EventTag(item, TAG_TYPE)
+        self.person      = EventTag(item, TAG_PERSON)
+        self.transparent = item.get('transparency') == 'transparent'
+        self.response    = next((attendee.get('responseStatus', '') for attendee in item.get('attendees', [])
+                                 if attendee.get('self')), '')
+
+
+###############################################################################
+#
+# Procedure   : EventTime()
+#
+# Description : Aware datetime of an event 'start' or 'end' field, in the
+#             : event's own offset; all-day dates at local midnight.
+#
+# Input       : edge - dict - event['start'] or event['end']
+#
+# Returns     : datetime
+#
+###############################################################################
+
+def EventTime(edge):
+
+    if 'dateTime' in edge:
+        return datetime.fromisoformat(edge['dateTime'].replace('Z', '+00:00'))
+
+    return LocalTimezone().localize(datetime.strptime(edge['date'], "%Y-%m-%d"))
+
+
+###############################################################################
+#
+# Procedure   : SeriesZone()
+#
+# Description : tzinfo for a series' IANA zone name, shared by
+#             : ExpandRule() and EventInstance() so a series expands and
+#             : formats through one zone backend.
+#             : - zoneinfo first: it resolves UTC offsets in C, where
+#             :   dateutil's tz spent most of a long expansion.
+#             : - dateutil for names zoneinfo cannot load.
+#
+# Input       : timeZone - string - IANA zone name
+#
+# Returns     : tzinfo - None when the name is unknown
+#
+###############################################################################
+
+@functools.lru_cache(maxsize=None)
+def SeriesZone(timeZone):
+
+    from zoneinfo import ZoneInfo
+
+    try:
+        return ZoneInfo(timeZone)
+
+    except (KeyError, ValueError, OSError):
+        from dateutil import tz
+        return tz.gettz(timeZone)
+
+
+###############################################################################
+#
+# Procedure   : ExpandRule()
+#
+# Description : Start times of a recurring series inside a window.
+#             : - Expanded with dateutil.rrule in the series' own time zone
+#             :   (SeriesZone()), so DST changes keep the wall-clock time;
+#             :   a start inside a DST gap moves forward past it (RFC 5545).
+#             : - Memoized by (rule, series start, window); callers pass
+#             :   day-aligned windows so repeated views hit the cache.
+#
+# Input       : recurrence - tuple   - RRULE/EXDATE/RDATE lines
+#             : dtstart    - string  - series start ('date' or 'dateTime')
+#             : timeZone   - string  - IANA zone of the series [optional]
+#             : lower      - float   - window start (epoch seconds)
+#             : upper      - float   - window end (epoch seconds)
+#
+# Returns     : tuple - occurrence start times as epoch seconds
+#
+###############################################################################
+
+@functools.lru_cache(maxsize=4096)
+def ExpandRule(recurrence, dtstart, timeZone, lower, upper):
+
+    from dateutil.rrule import rrulestr
+
+    if 'T' in dtstart:
+        zone  = SeriesZone(timeZone) if timeZone else None
+        start = datetime.fromisoformat(dtstart.replace('Z', '+00:00'))
+        start = start.astimezone(zone) if zone else start
+        after = datetime.fromtimestamp(lower, start.tzinfo)
+        until = datetime.fromtimestamp(upper, start.tzinfo)
+
+    else:
+        zone  = LocalTimezone()
+        start = datetime.strptime(dtstart, "%Y-%m-%d")
+        after = datetime.fromtimestamp(lower, zone).replace(tzinfo=None)
+        until = datetime.fromtimestamp(upper, zone).replace(tzinfo=None)
+
+    rules = rrulestr("\n".join(recurrence), dtstart=start, forceset=True)
+
+    if start.tzinfo is None:
+        return tuple(zone.localize(occurrence).timestamp() for occurrence in rules.between(after, until, inc=True))
+
+    return tuple(occurrence.timestamp() for occurrence in rules.between(after, until, inc=True))
+
+
+###############################################################################
+#
+# Procedure   : SeriesStarts()
+#
+# Description : Occurrences of a recurring master overlapping [lower, upper),
+#             : before exceptions are applied.
+#
+# Input       : master - dict  - recurring master event
+#             : lower  - float - window start (epoch seconds)
+#             : upper  - float - window end (epoch seconds, finite)
+#
+# Returns     : tuple - (list of start epochs, duration in seconds)
+#
+###############################################################################
+
+def SeriesStarts(master, lower, upper):
+
+    duration = EventEpoch(master['end']) - EventEpoch(master['start'])
+    dayLower = (lower - duration) // 86400 * 86400
+    dayUpper = -(-upper // 86400) * 86400
+
+    starts = ExpandRule(tuple(master['recurrence']),
+                        master['start'].get('dateTime', master['start'].get('date')),
+                        master['start'].get('timeZone'),
+                        dayLower, dayUpper)
+
+    return [startEpoch for startEpoch in starts if startEpoch + duration > lower and startEpoch < upper], duration
+
+
+###############################################################################
+#
+# Procedure   : EventInstance()
+#
+# Description : Builds one occurrence of a recurring master, shaped like
+#             : the instance singleEvents=True would have returned.
+#
+# Input       : master     - dict  - recurring master event
+#             : startEpoch - float - occurrence start (epoch seconds)
+#
+# Returns     : dict - instance event
+#
+###############################################################################
+
+def EventInstance(master, startEpoch):
+
+    instance = dict(master)
+    instance.pop('recurrence', None)
+
+    duration = EventEpoch(master['end']) - EventEpoch(master['start'])
+
+    if 'dateTime' in master['start']:
+        zone  = datetime.fromisoformat(master['start']['dateTime'].replace('Z', '+00:00')).tzinfo
+
+        if master['start'].get('timeZone'):
+            zone = SeriesZone(master['start']['timeZone']) or zone
+
+        start = datetime.fromtimestamp(startEpoch, zone)
+        end   = datetime.fromtimestamp(startEpoch + duration, zone)
+
+        instance['start'] = dict(master['start'], dateTime=start.isoformat())
+        instance['end']   = dict(master['end'],   dateTime=end.isoformat())
+        suffix            = datetime.fromtimestamp(startEpoch, timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+    else:
+        start = datetime.fromtimestamp(startEpoch, LocalTimezone()).date()
+        end   = start + timedelta(days=round(duration / 86400))
+
+        instance['start'] = {'date': start.isoformat()}
+        instance['end']   = {'date': end.isoformat()}
+        suffix            = start.strftime('%Y%m%d')
+
+    instance['id']                = f"{master['id']}_{suffix}"
+    instance['recurringEventId']  = master['id']
+    instance['originalStartTime'] = dict(instance['start'])
+
+    return instance
+
+
+###############################################################################
+#
+# Procedure   : ExpandEvents()
+#
+# Description : Turns recurring masters + exceptions + single events into
+#             : the instances overlapping [lower, upper), sorted by start.
+#             : - Masters are expanded locally (ExpandRule()).
+#             : - Modified instances replace the occurrence they moved.
+#             : - Cancelled instances remove their occurrence.
+#
+# Input       : events - list  - events as listed with singleEvents=False
+#             : lower  - float - window start (epoch seconds)
+#             : upper  - float - window end (epoch seconds)
+#
+# Returns     : list - instance/single events ordered by start time
+#
+###############################################################################
+
+@Timed()
+def ExpandEvents(events, lower, upper):
+
+    masters    = []
+    exceptions = {}
+    expanded   = []
+
+    for event in events:
+
+        if event.get('recurrence'):
+            masters.append(event)
+
+        elif event.get('recurringEventId') and 'originalStartTime' in event:
+            exceptions.setdefault(event['recurringEventId'], {})[round(EventEpoch(event['originalStartTime']))] = event
+
+        elif event.get('status') != 'cancelled':
+            expanded.append(event)
+
+    # open-ended windows stop at the horizon instead of expanding forever
+    if upper == float('inf'):
+        upper = max(lower, time.time()) + RECURRENCE_HORIZON
+
+    for master in masters:
+
+        overrides = exceptions.pop(master['id'], {})
+
+        for startEpoch in SeriesStarts(master, lower, upper)[0]:
+            if round(startEpoch) not in overrides:
+                expanded.append(EventInstance(master, startEpoch))
+
+        for override in overrides.values():
+            if override.get('status') != 'cancelled':
+                expanded.append(override)
+
+    # modified instances whose master was not listed
+    for overrides in exceptions.values():
+        expanded.extend(override for override in overrides.values() if override.get('status') != 'cancelled')
+
+    # parsed once here; everything downstream reads the Event records
+    records = [record for record in map(Event, expanded) if record.endEpoch > lower and record.startEpoch < upper]
+
+    return sorted(records, key=lambda record: record.startEpoch)
+
+
+###############################################################################
+#
+# Procedure   : OpenEventCache()
+#
+# Description : Opens (and creates if needed) the local SQLite event store.
+#             : - events     : recurring masters, their exceptions and single
+#             :                events, raw API json in 'body'.
+#             : - syncState  : last nextSyncToken per calendar.
+#             : - eventsText : full-text index (FTS5) over summary, location
+#             :                and description, rowid = events rowid.
+#             : - birthdays  : birthday index (name, month, day, event id).
+#             : - catchups   : catch-up index (name, last date, frequency,
+#             :                next due date).
+#             : - catchupPlans : --seed suggestions per (name, seed), valid
+#             :                while the person's due date is unchanged.
+#             : - cacheState : when each local index was last rebuilt.
+#
+# Input       : -none-
+#
+# Returns     : object - sqlite3 connection
+#
+###############################################################################
+
+@Timed()
+def OpenEventCache():
+
+    cache = sqlite3.connect(CACHE_FILE, timeout=30)
+
+    # stored event shape changed - drop events so the next sync is a full one
+    if cache.execute("PRAGMA user_version").fetchone()[0] < CACHE_VERSION:
+        cache.execute("DROP TABLE IF EXISTS events")
+        cache.execute("DROP TABLE IF EXISTS eventsText")
+        cache.execute("DROP TABLE IF EXISTS syncState")
+        cache.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+
+    cache.execute("""
+        CREATE TABLE IF NOT EXISTS events (
+            calendarId       TEXT NOT NULL,
+            id               TEXT NOT NULL,
+            recurringEventId TEXT,
+            startEpoch       REAL NOT NULL,
+            endEpoch         REAL NOT NULL,
+            body             TEXT NOT NULL,
+            PRIMARY KEY (calendarId, id)
+        )""")
+
+    cache.execute("CREATE INDEX IF NOT EXISTS eventsByStart ON events (calendarId, startEpoch)")
+    cache.execute("CREATE INDEX IF NOT EXISTS eventsBySeries ON events (calendarId, recurringEventId)")
+
+    # prefix indexes keep 2 and 3 letter 'word*' queries off a full term scan
+    cache.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS eventsText USING fts5 (
+            summary, location, description, prefix = '2 3'
+        )""")
+
+    cache.execute("""
+        CREATE TABLE IF NOT EXISTS syncState (
+            calendarId TEXT PRIMARY KEY,
+            syncToken  TEXT NOT NULL
+        )""")
+
+    cache.execute("""
+        CREATE TABLE IF NOT EXISTS birthdays (
+            id    TEXT PRIMARY KEY,
+            name  TEXT NOT NULL,
+            month INTEGER NOT NULL,
+            day   INTEGER NOT NULL
+        )""")
+
+    cache.execute("CREATE INDEX IF NOT EXISTS birthdaysByName ON birthdays (name)")
+
+    cache.execute("""
+        CREATE TABLE IF NOT EXISTS catchups (
+            name      TEXT PRIMARY KEY,
+            last      TEXT NOT NULL,
+            frequency INTEGER NOT NULL,
+            due       TEXT NOT NULL
+        )""")
+
+    cache.execute("CREATE INDEX IF NOT EXISTS catchupsByDue ON catchups (due)")
+
+    cache.execute("""
+        CREATE TABLE IF NOT EXISTS catchupPlans (
+            name    TEXT NOT NULL,
+            seed    INTEGER NOT NULL,
+            due     TEXT NOT NULL,
+            slot    TEXT,
+            planned REAL NOT NULL,
+            PRIMARY KEY (name, seed)
+        )""")
+
+    cache.execute("""
+        CREATE TABLE IF NOT EXISTS cacheState (
+            key   TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )""")
+
+    return cache
+
+
+###############################################################################
+#
+# Procedure   : StoreEvent()
+#
+# Description : Writes one synced event into the local store.
+#             : - Recurring masters span from their first start onwards.
+#             : - Cancelled instances are kept (at their original start)
+#             :   so expansion can leave that occurrence out.
+#             : - Keeps the event's eventsText row in step; cancelled
+#             :   instances are not searchable.
+#
+# Input       : cache      - sqlite3 connection from OpenEventCache()
+#             : calendarId - string - calendar the event belongs to
+#             : event      - dict   - API event
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def StoreEvent(cache, calendarId, event):
+
+    if event.get('recurrence'):
+        startEpoch = EventEpoch(event['start'])
+        endEpoch   = float('inf')
+
+    elif event.get('status') == 'cancelled':
+        startEpoch = endEpoch = EventEpoch(event['originalStartTime'])
+
+    else:
+        startEpoch = EventEpoch(event['start'])
+        endEpoch   = EventEpoch(event['end'])
+
+    # REPLACE gives the row a new rowid, so drop the old text row first
+    old = cache.execute("SELECT rowid FROM events WHERE calendarId = ? AND id = ?", (calendarId, event['id'])).fetchone()
+
+    if old:
+        cache.execute("DELETE FROM eventsText WHERE rowid = ?", old)
+
+    rowid = cache.execute("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?)",
+                          (calendarId, event['id'], event.get('recurringEventId'), startEpoch, endEpoch, json.dumps(event))).lastrowid
+
+    if event.get('status') != 'cancelled':
+        cache.execute("INSERT INTO eventsText (rowid, summary, location, description) VALUES (?, ?, ?, ?)",
+                      (rowid, event.get('summary', ''), event.get('location', ''), event.get('description', '')))
+
+
+###############################################################################
+#
+# Procedure   : DropEvents()
+#
+# Description : Deletes events, and their eventsText rows, from the store.
+#
+# Input       : cache  - sqlite3 connection from OpenEventCache()
+#             : where  - string - SQL condition on the events table
+#             : params - tuple  - parameters for 'where'
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def DropEvents(cache, where, params):
+
+    cache.execute(f"DELETE FROM eventsText WHERE rowid IN (SELECT rowid FROM events WHERE {where})", params)
+    cache.execute(f"DELETE FROM events WHERE {where}", params)
+
+
+###############################################################################
+#
+# Procedure   : SyncEventCache()
+#
+# Description : Brings the local event store up to date.
+#             : - Recurring events are stored once, as master + exceptions
+#             :   (singleEvents=False), and expanded locally on read.
+#             : - No sync token yet: full sync of the calendar.
+#             : - Otherwise: incremental sync using nextSyncToken, so only
+#             :   events changed since the last run cross the wire.
+#             : - Token expired (HTTP 410): start over with a full sync.
+#             : - Each page is written in its own short transaction, the
+#             :   new sync token with the last one, so the write lock is
+#             :   never held while waiting on the network.
+#             : - A full sync fills a staging copy (SYNC_STAGING) that
+#             :   replaces the old one only in the last transaction;
+#             :   until then readers keep the complete old copy.
+#
+# Input       : service    - Google Calendar API service object
+#             : cache      - sqlite3 connection from OpenEventCache()
+#             : calendarId - string - calendar to sync
+#             : http       - object - connection to use [optional, for threads]
+#
+# Returns     : int - number of changed events applied
+#
+###############################################################################
+
+@Timed()
+def SyncEventCache(service, cache, calendarId='primary', http=None):
+
+    row    = cache.execute("SELECT syncToken FROM syncState WHERE calendarId = ?", (calendarId,)).fetchone()
+    params = {'calendarId': calendarId, 'singleEvents': False}
+
+    if row:
+        params['syncToken'] = row[0]
+
+    changed = 0
+    target  = calendarId if row else SYNC_STAGING + calendarId
+    stale   = not row
+
+    try:
+
+        for page in FetchEventPages(service, http=http, **params):
+
+            # full sync: drop what an interrupted one left, with page 1
+            if stale:
+                DropEvents(cache, "calendarId = ?", (target,))
+                stale = False
+
+            for event in page.get('items', []):
+
+                if event.get('status') == 'cancelled' and not event.get('recurringEventId'):
+                    DropEvents(cache, "calendarId = ? AND (id = ? OR recurringEventId = ?)",
+                               (target, event['id'], event['id']))
+
+                else:
+                    StoreEvent(cache, target, event)
+
+                changed += 1
+
+            if 'nextSyncToken' in page:
+
+                # full sync complete: swap the staging copy in
+                if not row:
+                    DropEvents(cache, "calendarId = ?", (calendarId,))
+                    cache.execute("UPDATE events SET calendarId = ? WHERE calendarId = ?", (calendarId, target))
+
+                cache.execute("INSERT OR REPLACE INTO syncState VALUES (?, ?)", (calendarId, page['nextSyncToken']))
+
+            cache.commit()
+
+    except Exception as e:
+
+        # sync token no longer valid - start over with a full sync (an
+        # HttpError, recognised by its status so googleapiclient's error
+        # module stays unimported)
+        if getattr(getattr(e, 'resp', None), 'status', None) == 410 and row:
+            cache.rollback()
+            cache.execute("DELETE FROM syncState WHERE calendarId = ?", (calendarId,))
+            cache.commit()
+            return SyncEventCache(service, cache, calendarId, http)
+
+        raise
+
+    return changed
+
+
+###############################################################################
+#
+# Procedure   : CachedEvents()
+#
+# Description : Reads events overlapping [timeMin, timeMax) from the local
+#             : store, ordered by start time, recurring events expanded.
+#
+# Input       : cache      - sqlite3 connection from OpenEventCache()
+#             : timeMin    - string - ISO 8601 lower bound (event end)
+#             : timeMax    - string - ISO 8601 upper bound (event start) [optional]
+#             : calendarId - string - calendar to read
+#             : kind       - string - only events tagged with this type [optional]
+#
+# Returns     : list - Event records ordered by start time
+#
+###############################################################################
+
+@Timed()
+def CachedEvents(cache, timeMin, timeMax=None, calendarId='primary', kind=None):
+
+    lower  = TimeBoundEpoch(timeMin)
+    upper  = TimeBoundEpoch(timeMax) if timeMax else float('inf')
+    query  = "SELECT id FROM events WHERE calendarId = ? AND recurringEventId IS NULL AND endEpoch > ? AND startEpoch < ?"
+    params = [calendarId, lower, upper]
+
+    if kind:
+        query += f" AND json_extract(body, '$.extendedProperties.private.{TAG_TYPE}') = ?"
+        params.append(kind)
+
+    # matching single events and masters, plus every exception of those masters
+    rows = cache.execute(
+        f"SELECT body FROM events WHERE calendarId = ? AND (id IN ({query}) OR recurringEventId IN ({query}))",
+        [calendarId] + params + params)
+
+    return ExpandEvents([json.loads(body) for (body,) in rows], lower, upper)
+
+
+###############################################################################
+#
+# Procedure   : SearchQuery()
+#
+# Description : Turns --search text into an FTS5 MATCH expression.
+#             : - "quoted words" stay a phrase.
+#             : - every other word is a prefix term ('lun' finds 'lunch').
+#             : - terms are ANDed.
+#
+# Input       : text - string - search text as typed
+#
+# Returns     : string - MATCH expression ('' if there is nothing to find)
+#
+###############################################################################
+
+def SearchQuery(text):
+
+    terms = []
+
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', text):
+
+        if phrase.strip():
+            terms.append('"' + phrase.replace('"', '""') + '"')
+
+        elif word.strip('"'):
+            terms.append('"' + word.replace('"', '""') + '"*')
+
+    return ' '.join(terms)
+
+
+###############################################################################
+#
+# Procedure   : SearchEvents()
+#
+# Description : Ranked full-text search of the local store (eventsText).
+#             : - Best match first (bm25, summary weighted over location
+#             :   over description).
+#             : - Only events overlapping [lower, upper) are returned.
+#             : - One result per recurring series, at its best match: a
+#             :   matching modified instance as itself, a matching master
+#             :   expanded with its exceptions to its next occurrence in
+#             :   the window (or its last one if all are in the past).
+#
+# Input       : cache     - sqlite3 connection from OpenEventCache()
+#             : text      - string - search text, see SearchQuery()
+#             : lower     - float  - window start (epoch seconds)
+#             : upper     - float  - window end (epoch seconds)
+#             : calendars - list   - calendar IDs to search
+#             : limit     - int    - max results
+#
+# Returns     : list - Event records, best match first
+#
+###############################################################################
+
+@Timed()
+def SearchEvents(cache, text, lower, upper, calendars, limit=SEARCH_LIMIT):
+
+    match = SearchQuery(text)
+
+    if not match:
+        return []
+
+    # best match first; hits are grouped by series below, so read on
+    # until 'limit' groups rather than stopping at 'limit' rows
+    rows = cache.execute(f"""
+        SELECT events.calendarId, events.body FROM eventsText JOIN events ON events.rowid = eventsText.rowid
+        WHERE eventsText MATCH ?
+          AND events.calendarId IN ({', '.join('?' * len(calendars))})
+          AND events.endEpoch > ? AND events.startEpoch < ?
+        ORDER BY bm25(eventsText, ?, ?, ?)""", [match, *calendars, lower, upper, *SEARCH_WEIGHTS])
+
+    now     = time.time()
+    results = []
+    seen    = set()
+
+    for calendarId, body in rows:
+
+        if len(results) >= limit:
+            break
+
+        event  = json.loads(body)
+        series = (calendarId, event.get('recurringEventId') or event['id'])
+
+        if series in seen:
+            continue
+
+        seen.add(series)
+
+        if event.get('recurrence'):
+            events      = [json.loads(row) for (row,) in cache.execute(
+                              "SELECT body FROM events WHERE calendarId = ? AND recurringEventId = ?", series)]
+            events.append(event)
+
+            # exceptions with edited text did not match through the master
+            Text        = lambda record: (record.summary, record.location, record.description)
+            matched     = Text(Event(event))
+            occurrences = [record for record in ExpandEvents(events, max(lower, now), upper) if Text(record) == matched] or \
+                          [record for record in ExpandEvents(events, lower, min(upper, now)) if Text(record) == matched][-1:]
+
+            if occurrences:
+                results.append(occurrences[0])
+
+        else:
+            results.append(Event(event))
+
+    return results
+
+
+###############################################################################
+#
+# Procedure   : RemoteEvents()
+#
+# Description : Reads events overlapping [timeMin, timeMax) straight from
+#             : the API, ordered by start time. Only recurring masters and
+#             : their exceptions are downloaded; instances are expanded
+#             : locally.
+#
+# Input       : service    - Google Calendar API service object
+#             : timeMin    - string - ISO 8601 lower bound
+#             : timeMax    - string - ISO 8601 upper bound [optional]
+#             : calendarId - string - calendar to read
+#             : kind       - string - only events tagged with this type [optional]
+#             : http       - object - connection to use [optional, for threads]
+#
+# Returns     : list - Event records ordered by start time
+#
+###############################################################################
+
+@Timed()
+def RemoteEvents(service, timeMin, timeMax=None, calendarId='primary', kind=None, http=None):
+
+    params = {
+        'calendarId'  : calendarId,
+        'timeMin'     : timeMin,
+        'singleEvents': False
+    }
+
+    if timeMax:
+        params['timeMax'] = timeMax
+
+    if kind:
+        params['privateExtendedProperty'] = f"{TAG_TYPE}={kind}"
+
+    events = list(FetchEvents(service, http=http, **params))
+
+    return ExpandEvents(events, TimeBoundEpoch(timeMin), TimeBoundEpoch(timeMax) if timeMax else float('inf'))
+
+
+###############################################################################
+#
+# Procedure   : LoadEvents()
+#
+# Description : Single read path for every view.
+#             : - Syncs the local store (small delta) and answers from it.
+#             :   Inside the daemon the refresh loop does the syncing.
+#             : - If the sync fails (offline, quota) serves what is cached.
+#             : - With --no-cache, or if the store is unusable, falls back
+#             :   to RemoteEvents().
+#
+# Input       : service    - Google Calendar API service object
+#             : timeMin    - string  - ISO 8601 lower bound
+#             : timeMax    - string  - ISO 8601 upper bound [optional]
+#             : calendarId - string  - calendar to read
+#             : kind       - string  - only events tagged with this type [optional]
+#             : sync       - boolean - False when the store was just synced
+#
+# Returns     : list - Event records ordered by start time
+#
+###############################################################################
+
+def LoadEvents(service, timeMin, timeMax=None, calendarId='primary', kind=None, sync=True):
+
+    if USE_CACHE:
+
+        try:
+            cache = OpenEventCache()
+
+            try:
+                if sync and SYNC_ON_READ:
+                    SyncEventCache(service, cache, calendarId)
+
+            except Exception as e:
+                cache.rollback()
+                print(f"⚠️ [WARNING] Sync failed, showing cached events: {e}")
+
+            try:
+                return CachedEvents(cache, timeMin, timeMax, calendarId, kind)
+
+            finally:
+                cache.close()
+
+        except sqlite3.Error as e:
+            print(f"⚠️ [WARNING] Event cache unavailable ({e}), fetching directly.")
+
+    return RemoteEvents(service, timeMin, timeMax, calendarId, kind)
+
+
+###############################################################################
+#
+# Procedure   : ViewWindows()
+#
+# Description : Time windows read by each view, as LoadEvents() keywords.
+#             : Kept in one place so the dashboard can fetch them together.
+#
+# Input       : -none-
+#
+# Returns     : dict - key = view name, value = {timeMin, timeMax, kind}
+#
+###############################################################################
+
+def ViewWindows():
+
+    # todo - make this dynamic
+    nowLocal = datetime.now(LocalTimezone())
+    now      = datetime.now()
+
+    return {
+        'today'   : {'timeMin': nowLocal.isoformat(), 'timeMax': (nowLocal + timedelta(days=1)).isoformat()},
+        'week'    : {'timeMin': now.isoformat() + 'Z', 'timeMax': (now + timedelta(days=7)).isoformat() + 'Z'},
+        'catchups': {'timeMin': datetime.now(timezone.utc).isoformat(), 'kind': 'catchup'},
+    }
+
+
+###############################################################################
+#
+# Procedure   : ThreadHttp()
+#
+# Description : Authorized HTTP object for the calling thread.
+#             : httplib2 is not thread-safe, so concurrent requests each
+#             : need their own connection; one is kept per worker thread.
+#
+# Input       : -none-
+#
+# Returns     : object - google_auth_httplib2.AuthorizedHttp
+#
+###############################################################################
+
+def ThreadHttp():
+
+    http = getattr(_threadState, 'http', None)
+
+    if http is None:
+
+        import httplib2
+        import google_auth_httplib2
+
+        http = google_auth_httplib2.AuthorizedHttp(GetGoogleCredentials(), http=httplib2.Http())
+        _threadState.http = InstrumentHttp(http) if PROFILE else http
+
+    return http
+
+
+###############################################################################
+#
+# Procedure   : RunThreaded()
+#
+# Description : Runs blocking calls concurrently on worker threads.
+#             : The pool lives for the whole process, so each worker keeps
+#             : its ThreadHttp() connection warm from one call to the next.
+#
+# Input       : calls - list - zero-argument callables
+#
+# Returns     : list - results, in the order of 'calls'
+#
+###############################################################################
+
+def RunThreaded(calls):
+
+    global _threadPool
+
+    with _threadPoolLock:
+        if _threadPool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _threadPool = ThreadPoolExecutor(thread_name_prefix='calboss')
+
+    return list(_threadPool.map(lambda call: call(), calls))
+
+
+###############################################################################
+#
+# Procedure   : SyncCalendars()
+#
+# Description : Syncs the local store for every calendar in CALENDARS,
+#             : all calendars at once, each on its own connection.
+#
+# Input       : service - Google Calendar API service object
+#
+# Returns     : int - events changed since the last sync (failed
+#             :       calendars count as unchanged)
+#
+###############################################################################
+
+@Timed()
+def SyncCalendars(service):
+
+    def Sync(calendarId, http):
+
+        cache = OpenEventCache()
+
+        try:
+            return SyncEventCache(service, cache, calendarId, http)
+
+        except Exception as e:
+            cache.rollback()
+            print(f"⚠️ [WARNING] Sync failed for {calendarId}, showing cached events: {e}")
+            return 0
+
+        finally:
+            cache.close()
+
+    if len(CALENDARS) == 1:
+        return Sync(CALENDARS[0], None)
+
+    return sum(RunThreaded([lambda calendarId=calendarId: Sync(calendarId, ThreadHttp()) for calendarId in CALENDARS]))
+
+
+###############################################################################
+#
+# Procedure   : MergeByStart()
+#
+# Description : k-way merge of per-calendar event lists that are each
+#             : already ordered by start time (heap based, no re-sort).
+#
+# Input       : streams - list - one start-ordered event list per calendar
+#
+# Returns     : list - all events ordered by start time
+#
+###############################################################################
+
+def MergeByStart(streams):
+
+    if len(streams) == 1:
+        return streams[0]
+
+    return list(heapq.merge(*streams, key=lambda event: event.startEpoch))
+
+
+###############################################################################
+#
+# Procedure   : FetchWindows()
+#
+# Description : Fetches several independent views, across every calendar
+#             : in CALENDARS, in about one round trip.
+#             : - Cached: calendars are synced concurrently, then every
+#             :   window is read locally.
+#             : - --no-cache: every (window, calendar) pair is queried
+#             :   concurrently, each thread with its own connection.
+#             : Per-calendar results are merged in start-time order.
+#
+# Input       : service - Google Calendar API service object
+#             : windows - dict - key = name, value = LoadEvents() keywords
+#
+# Returns     : dict - key = name, value = list of events
+#
+###############################################################################
+
+@Timed()
+def FetchWindows(service, windows):
+
+    pairs = [(name, calendarId) for name in windows for calendarId in CALENDARS]
+
+    if USE_CACHE:
+
+        if SYNC_ON_READ:
+            SyncCalendars(service)
+
+        streams = [LoadEvents(service, calendarId=calendarId, sync=False, **windows[name]) for name, calendarId in pairs]
+
+    else:
+        streams = RunThreaded([
+            lambda name=name, calendarId=calendarId: RemoteEvents(service, calendarId=calendarId, http=ThreadHttp(), **windows[name])
+            for name, calendarId in pairs
+        ])
+
+    results = {}
+
+    for (name, calendarId), events in zip(pairs, streams):
+        results.setdefault(name, []).append(events)
+
+    return {name: MergeByStart(results[name]) for name in windows}
+
+
+###############################################################################
+#
+# Procedure   : ReadCalendarList()
+#
+# Description : Calendars shown by --today, --week and --dashboard.
+#             : --calendars wins, then CALENDARS_FILE (one ID per line),
+#             : then just 'primary'.
+#
+# Input       : option - string - --calendars value (comma-separated) [optional]
+#
+# Returns     : list - calendar IDs
+#
+###############################################################################
+
+def ReadCalendarList(option=None):
+
+    if option:
+        calendars = [calendarId.strip() for calendarId in option.split(',')]
+
+    elif os.path.exists(CALENDARS_FILE):
+        with open(CALENDARS_FILE) as handle:
+            calendars = [line.strip() for line in handle if line.strip() and not line.startswith('#')]
+
+    else:
+        calendars = []
+
+    return list(dict.fromkeys(calendarId for calendarId in calendars if calendarId)) or ['primary']
+
+
+###############################################################################
+#
+# Procedure   : FetchTodayEvents()
+#
+# Description : Pulls all Google Calendar events for the current day
+#             : Uses timezone-aware window from now until midnight
+#
+# Input       : service   - Google Calendar API service object
+#             : allEvents - list - prefetched 'today' window [optional]
+#
+# Returns     : list - all events scheduled for today
+#
+###############################################################################
+
+def FetchTodayEvents(service, allEvents=None):
+
+    now = datetime.now(LocalTimezone())
+
+    if allEvents is None:
+        allEvents = LoadEvents(service, **ViewWindows()['today'])
+
+    # filter to events starting *today* (in their own time zone)
+    return [event for event in allEvents if event.start.date() == now.date()]
+
+
+###############################################################################
+#
+# Procedure   : FetchWeekEvents()
+#
+# Description : Pulls Google Calendar events for next 7 days (today + 6).
+#             : Returns dictionary grouped by date.
+#
+# Input       : service - Google Calendar API service object
+#
+# Returns     : dict - key = readable date label, value = list of Event records
+#
+###############################################################################
+
+def FetchWeekEvents(service):
+
+    tz    = LocalTimezone()
+    now   = datetime.now(tz)
+    start = now.isoformat()
+    end   = (now + timedelta(days=7)).isoformat()
+
+    allEvents     = LoadEvents(service, start, end)
+    groupedEvents = {}
+
+    for event in allEvents:
+
+        dt = event.start.astimezone(tz)
+
+        dayLabel = ""
+
+        if dt.date() == now.date():
+            dayLabel = f"Today ({dt.strftime('%b %d')})"
+
+        elif dt.date() == (now + timedelta(days=1)).date():
+            dayLabel = f"Tomorrow ({dt.strftime('%b %d')})"
+
+        else:
+            dayLabel = dt.strftime("%A (%b %d)")
+
+        groupedEvents.setdefault(dayLabel, []).append(event)
+
+    return groupedEvents
+
+
+###############################################################################
+#
+# Procedure   : PrintHelp()
+#
+# Description : Beautified --help 
+#
+# Input       : -none-
+#
+# Returns     : -none- 
+#
+###############################################################################
+
+def PrintHelp():
+
+    # these came from some random inspirational website on the importance
+    # of having a digital calendar ... lost the url.
+    proTips = [ "📅 Add your events with --date and --starttime to stay in boss mode.",
+      "🔥 Repeating events? Use --repeat and never miss it again.",
+      "🧠 Block off 'focus hours' on your calendar to get sh*t done.",
+      "☕ Schedule your breaks. No one hustles non-stop without burning out.",
+      "📍 Use event notes to track locations, URLs, or secret food spots.",
+      "👀 Check your week every Monday. Be proactive, not reactive.",
+      "🧼 Keep a backup with --export — you future self will thank you.",
+      "⏰ Reminders aren’t for the forgetful — they’re for the focused.",
+      "📆 If it’s not in the calendar, it’s not happening.",
+      "🔎 Use --search to find events fast — one should not have to battle a web gui.",
+      "🧠 Use --search-all to pull past and future events.",
+      "🛑 Book a full day with --allday"]
+
+    helpText = """\
+CalBoss: Google calendar integration for the command line. 📅 ✨ 
+
+Usage:
+  CalBoss [options]
+
+📆 Event Management:
+  --today                          Show today's schedule.
+  --week                           View full Monday–Sunday overview.
+  --dashboard                      Today, week, birthdays and catch-ups in one view.
+  --calendars "<id, ...>"          Calendars merged into --today/--week/--dashboard
+                                   (default: calendars.txt, one ID per line, or "primary").
+  --add "<event>"                  Add an event (e.g. "Call with Lisa at 1PM").
+  --date YYYY-MM-DD                Set date for event (required with --add).
+  --starttime HH:MM                Start time (24hr or AM/PM).
+  --endtime HH:MM                  End time (24hr or AM/PM).
+  --allday                         All day event. 
+  --location "<place>"             Include a location with your event.
+  --reminder <duration>            Reminder before event (e.g. 15m, 1h).
+  --remove <event_id> [...]        Delete one or more events by ID.
+  --note <event_id> "<note>"       Add a note to an existing event.
+  --repeat                         Repeat events (e.g. daily, weekly, monthly, yearly).
+
+🎂 Birthday:
+  --bday-add "<Name> MM/DD"        Add a birthday (auto-repeats yearly).
+  --bday-import <file.vcf|csv>     Add every birthday in a contacts export (skips known names).
+  --bday-remove "<Name>"           Remove a birthday.
+  --bday-show                      Show birthdays this month.
+  --bday-show-all                  Show all saved birthdays.
+  --bday-show-today                Show today's birthdays.
+  --bday-reindex                   Rebuild the local birthday index (refreshed daily anyway).
+
+👫 Catch-Up Mode:
+  --catchup-suggest "<Name, ...>"  Suggests a free evening to check in with each person,
+                                   most overdue first.
+  --catchup "<Name, ...>"          Book the next check-in with each person on a free
+                                   evening near when they are due. Never double-books.
+  --catchup "<Name>" 
+       --date YYYY-MM-DD           Schedule a personal check-in. Adds a [Catch-Up] event
+                                   in the first free evening slot that day.
+       [--reminder <time>]         (Optional) Set a pre-check-in reminder.
+  --catchup-list                   Show upcoming catch-up events.
+  --catchup-clear "<Name>"         Remove someone from your catch-up list.
+  --seed <n>                       Same suggestions every run for the same catch-up history
+                                   (remembered, so repeat --catchup-suggest runs are instant).
+
+📊 Overview:
+  --summary                        Hours booked vs free for the next 7 days.
+  --vibe-check                     Today's time breakdown + free slots.
+  --freebusy                       Use Google's free/busy data for the two above (faster,
+                                   no event details).
+  --insights                       Analyze patterns (best/worst days, busiest weeks, trend)
+       [--since YYYY-MM-DD]        over the last 5 years or the given range. Needs numpy.
+       [--until YYYY-MM-DD]
+
+🔎 Search:
+  --search "<keyword>"             Search upcoming events by keyword in title, notes, or location.
+  --search-all "<keyword>"         Search your full calendar — past, present, future. Total recall.
+       [--since YYYY-MM-DD]        Only events on or after this date.
+       [--until YYYY-MM-DD]        Only events on or before this date.
+                                   Words match as prefixes ("lun" finds "lunch"); use
+                                   "double quotes" for an exact phrase. Best match first.
+
+💾 Backup:
+  --export [file]                  Stream every event to an NDJSON backup (default
+                                   calboss-backup.ndjson; add .gz or .zst to compress).
+                                   Interrupted exports resume where they stopped.
+  --import <file>                  Restore a backup. Events already in the calendar are
+                                   skipped, so it is safe to run again.
+
+⚙️  Cache:
+  --no-cache                       Skip the local event cache and query Google directly.
+  --page-size <n>                  Events fetched per API page (default 250, max 2500).
+  --migrate-tags                   One-time: tag birthdays and catch-ups made by older versions.
+  --daemon                         Keep CalBoss running in the background; --today, --week,
+                                   --dashboard and --bday-show answer from it instantly.
+  --watch [seconds]                With --today (default), --week or --dashboard: stay on screen,
+                                   sync every 60s and redraw only when something changed.
+  --watch-port <port>              Also sync at once when a Calendar push notification is
+                                   POSTed to this local port (events.watch webhook).
+  --profile                        Add a per-phase timing breakdown and wire stats to any command.
+  --trace <out.json>               Save the timings as a Chrome trace (chrome://tracing, Perfetto).
+"""
+
+#
+# TODO: enable these functions
+#
+
+#📊 Overview & Planning:
+#  --showids                        Display event IDs in schedule output for reference.
+#
+#🔧 Other:
+#  --version                        Show CalBoss version.
+#  --help                           You’re looking at it.
+#
+
+    helpText += """
+Examples:
+  CalBoss --today
+  CalBoss --add "Coffee with Sarah" --date 2025-05-24 --starttime 14:00 --endtime 15:00 --reminder 30m
+  CalBoss --bday-add "Charmaine 07/03"
+  CalBoss --bday-show-all
+  CalBoss --catchup-suggest "Lisa, Nick, Aunt Gina"
+
+✨ Pro Tip:
+"""
+    print(helpText + random.choice(proTips) + "\n")
+
+
+###############################################################################
+#
+# Procedure   : ParseArgs()
+#
+# Description : Parses command-line arguments.
+#
+# Input       : argv - list - arguments to parse [optional, default sys.argv]
+#
+# Returns     : object - parsed args
+#
+###############################################################################
+
+def ParseArgs(argv=None):
+
+    parser = argparse.ArgumentParser(
+        description="CalBoss: Google calendar integration for the command line.  Stay organized. 📅 ✨",
+        add_help=False,
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+
+    # core features
+    parser.add_argument("--today",     action="store_true", help="Show today's schedule.")
+    parser.add_argument("--week",      action="store_true", help="View full Monday–Sunday overview.")
+    parser.add_argument("--dashboard", action="store_true", help="Today, week, birthdays and catch-ups in one view.")
+    parser.add_argument("--calendars", type=str,            help='Calendars to merge, comma-separated (default: calendars.txt or "primary").')
+    parser.add_argument("--add",       type=str,            help='Add an event (e.g. "Call with Lisa at 1PM").')
+    parser.add_argument("--date",      type=str,            help="Date of event (YYYY-MM-DD)")
+    parser.add_argument("--starttime", type=str,            help="Start time (e.g. 13:00 or 1PM)")
+    parser.add_argument("--endtime",   type=str,            help="End time (e.g. 14:00 or 2PM)")
+    parser.add_argument("--allday",    action="store_true", help="Add an all-day event (no start or end time needed)")
+    parser.add_argument("--location",  type=str,            help="Add a location to your event")
+    parser.add_argument("--reminder",  type=str,            help="Reminder before event (e.g. 15m, 1h)")
+    parser.add_argument("--remove",    nargs="+",           help="Remove one or more events by ID.")
+    parser.add_argument("--note",      nargs=2,             help='Add note to an event. Usage: --note <id> "Your note".')
+    parser.add_argument("--repeat", choices=["daily", "weekly", "monthly", "yearly"],
+                                                            help="Set recurrence frequency for repeating events")
+
+    # birthday
+    parser.add_argument("--bday-add",        type=str,            help='Add a birthday (e.g. "Lisa 03/29").')
+    parser.add_argument("--bday-import",     type=str,            help="Add birthdays from a .vcf or .csv contacts file.")
+    parser.add_argument("--bday-remove",     type=str,            help="Remove a birthday by name.")
+    parser.add_argument("--bday-show",       action="store_true", help="Show birthdays this month.")
+    parser.add_argument("--bday-show-all",   action="store_true", help="Show all saved birthdays.")
+    parser.add_argument("--bday-show-today", action="store_true", help="Show today's birthdays.")
+    parser.add_argument("--bday-reindex",    action="store_true", help="Rebuild the local birthday index from the calendar.")
+
+    # catch-up
+    parser.add_argument("--catchup", type=str, help="Schedule a catch-up event with someone (comma-separated without --date).")
+    parser.add_argument("--catchup-suggest", metavar="NAMES", type=str, help='Suggest when to catch up with each person (comma-separated). Example: "Lisa, Nick, Aunt Gina"')
+    parser.add_argument("--catchup-list", action="store_true", help="List upcoming catch-up events")
+    parser.add_argument("--catchup-clear", type=str, help="Remove all catch-up events for this person")
+    parser.add_argument("--seed", type=int, help="Deterministic --catchup-suggest/--catchup dates (same seed, same answer)")
+
+    # summary 
+    parser.add_argument("--summary",    action="store_true", help="Show usage summary: hours booked vs free.")
+    parser.add_argument("--focus",      action="store_true", help="Filter for priority events only.")
+    parser.add_argument("--insights",   action="store_true", help="Analyze patterns (best/worst days).")
+    parser.add_argument("--vibe-check", action="store_true", help="Show today's time breakdown + free hours.")
+    parser.add_argument("--freebusy",   action="store_true", help="Use the free/busy endpoint for --summary and --vibe-check.")
+    parser.add_argument("--search",     type=str,            help="Search upcoming events by keyword")
+    parser.add_argument("--search-all", type=str,            help="Search past and future events by keyword")
+    parser.add_argument("--since",      type=str,            help="Limit --search/--search-all to events from this date (YYYY-MM-DD)")
+    parser.add_argument("--until",      type=str,            help="Limit --search/--search-all to events up to this date (YYYY-MM-DD)")
+    parser.add_argument("--showids",    action="store_true", help="Display event IDs for reference and deletion.")
+
+    # utility
+    parser.add_argument("--export",  nargs="?", const=EXPORT_FILE, help="Stream all events to a backup file (.gz/.zst to compress).")
+    parser.add_argument("--import",  type=str,            help="Restore events from an --export backup.")
+    parser.add_argument("--version", action="store_true", help="Show CalBoss version and exit.")
+    parser.add_argument("--no-cache", action="store_true", help="Skip the local event cache and query Google directly.")
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE, help="Events fetched per API page (1-2500).")
+    parser.add_argument("--migrate-tags", action="store_true", help="Tag birthdays and catch-ups created by older CalBoss versions.")
+    parser.add_argument("--daemon",   action="store_true", help="Run as a background server answering --today/--week/--dashboard/--bday-show.")
+    parser.add_argument("--watch",    nargs="?", type=int, const=WATCH_INTERVAL, metavar="SECONDS", help="Keep --today/--week/--dashboard on screen, redrawn when it changes.")
+    parser.add_argument("--watch-port", type=int,          help="With --watch: also sync when a push notification is POSTed to this local port.")
+    parser.add_argument("--profile",  action="store_true", help="Print where the command spent its time.")
+    parser.add_argument("--trace",    type=str,            help="Write a Chrome trace-event file of the command (e.g. out.json).")
+
+    # help
+    parser.add_argument("--help", action="store_true", help="Show this help message and exit.")
+
+    return parser.parse_args(argv)
+
+
+##############################################################################
+#
+# Procedure   : AddEventToGoogleCalendar()
+#
+# Description : Adds an event to Google Calendar via API.
+#             : Supports timed or all-day events.
+#             : Optional reminder in 'Xm' or 'Xh' for popup alerts.
+#             : Optional location for where the event takes place.
+#             : Optional --repeat for recurring events (daily, weekly, etc.).
+#
+# Input       : summary    - string  - Event description
+#             : date       - string  - Event date (YYYY-MM-DD)
+#             : startTime  - string  - Start time (HH:MM, 24hr or AM/PM) [optional if allDay]
+#             : endTime    - string  - End time (HH:MM, 24hr or AM/PM) [optional if allDay]
+#             : reminder   - string  - Optional (e.g. '15m', '1h')
+#             : allDay     - boolean - If True, creates an all-day event.
+#             : location   - string  - Optional (e.g. "Moe's Backyard")
+#             : repeat     - string  - Optional (e.g. 'daily', 'weekly', 'monthly', 'yearly')
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def AddEventToGoogleCalendar(summary, date, startTime=None, endTime=None, reminder=None, allDay=False, location=None, repeat=None):
+
+    service = GetCalendarService()
+
+    #
+    # allDay: google makes you specify an end time.
+    #
+
+    if allDay:
+        event = {
+            "summary": summary,
+            "start"  : {"date": date},
+            "end"    : {"date": date},
+        }
+
+    #
+    # not allDay
+    #
+
+    else:
+        startTime = f"{date}T{startTime}:00"
+        endTime   = f"{date}T{endTime}:00"
+
+        event = {
+            "summary": summary,
+            "start"  : {"dateTime": startTime, "timeZone": "America/New_York"},
+            "end"    : {"dateTime": endTime,   "timeZone": "America/New_York"},
+        }
+
+    #
+    # location
+    #
+
+    if location:
+        location = location.strip()
+        event["location"] = location
+        print(f"\U0001F4CD [INFO] Location set: {location}")
+
+        desc_text = f"Location: {location.strip()}"
+
+        if "description" in event:
+            event["description"] += f"\n{desc_text}"
+        else:
+            event["description"] = desc_text
+
+    #
+    # reminder
+    #
+
+    if reminder:
+        try:
+            amount  = int(reminder[:-1])
+            unit    = reminder[-1]
+            minutes = amount * 60 if unit == 'h' else amount
+
+            event["reminders"] = {
+                "useDefault": False,
+                "overrides" : [{"method": "popup", "minutes": minutes}]
+            }
+
+        except:
+            print(f"\u26A0\uFE0F [WARNING] Invalid reminder format: '{reminder}'. Use '15m' or '1h'.")
+
+    #
+    # repeat
+    #
+
+    if repeat:
+        event["recurrence"] = [f"RRULE:FREQ={repeat.upper()}"]
+        print(f"🔁 [INFO] Repeat set: {repeat}")
+
+    # create event using google api
+    createdEvent = Execute(service.events().insert(calendarId='primary', body=event))
+
+    print(f"✅ [INFO] Event created: {createdEvent.get('htmlLink')}")
+
+
+###############################################################################
+#
+# Procedure   : ExecuteBatch()
+#
+# Description : Sends API requests as Google batch requests, BATCH_SIZE
+#             : operations per HTTP round trip.
+#             : One failing item does not fail the rest of the batch.
+#             : Items that fail with a retryable error are re-sent in a
+#             : new batch after a Backoff(), up to API_RETRIES times.
+#
+# Input       : service  - Google Calendar API service object
+#             : requests - list of (key, request) tuples, keys unique
+#             : http     - object - connection to use [optional, for threads]
+#
+# Returns     : dict - key = request key, value = (response, exception)
+#
+###############################################################################
+
+def ExecuteBatch(service, requests, http=None):
+
+    results = {}
+    pending = list(requests)
+
+    def Collect(requestId, response, exception):
+        results[requestId] = (response, exception)
+
+    for attempt in range(API_RETRIES + 1):
+
+        for offset in range(0, len(pending), BATCH_SIZE):
+
+            chunk = pending[offset:offset + BATCH_SIZE]
+            batch = service.new_batch_http_request(callback=Collect)
+
+            for key, request in chunk:
+                batch.add(request, request_id=key)
+
+            try:
+                Execute(batch, http, cost=len(chunk))
+
+            except Exception as e:
+                results.update((key, (None, e)) for key, _ in chunk)
+
+        # items rate-limited inside an otherwise successful batch
+        retry = [(key, request) for key, request in pending
+                 if results[key][1] is not None and IsRetryable(results[key][1], IsIdempotent(request))]
+
+        if not retry or attempt == API_RETRIES:
+            break
+
+        Backoff(attempt, results[retry[0][0]][1])
+        pending = retry
+
+    return results
+
+
+###############################################################################
+#
+# Procedure   : DeleteEvents()
+#
+# Description : Deletes many events through batched requests.
+#             : Reports every failure individually.
+#
+# Input       : service    - Google Calendar API service object
+#             : eventIds   - list of event IDs
+#             : calendarId - string - calendar holding the events
+#             : verbose    - boolean - print a line per deleted event
+#
+# Returns     : int - number of events deleted
+#
+###############################################################################
+
+def DeleteEvents(service, eventIds, calendarId='primary', verbose=False):
+
+    eventIds = list(dict.fromkeys(eventIds))
+    requests = [(eventId, service.events().delete(calendarId=calendarId, eventId=eventId)) for eventId in eventIds]
+    results  = ExecuteBatch(service, requests)
+    deleted  = 0
+
+    for eventId in eventIds:
+
+        response, exception = results.get(eventId, (None, None))
+
+        if exception:
+            print(f"❌ [ERROR] Could not delete event {eventId}: {exception}")
+            continue
+
+        deleted += 1
+
+        if verbose:
+            print(f"🗑️ [INFO] Event {eventId} deleted.")
+
+    return deleted
+
+
+###############################################################################
+#
+# Procedure   : FormatTime(time_str)
+#
+# Description : Takes an ISO 8601 datetime string and makes it human readable. 
+#
+# Input       : input - Datetime string (e.g., "2025-05-27T14:00:00Z"),
+#             :         or a datetime (Event.start / Event.end)
+#
+# Returns     : string - time in format of "HH:MM AM/PM"
+#
+###############################################################################
+
+def FormatTime(input):
+
+    try:
+        dt = input if isinstance(input, datetime) else datetime.fromisoformat(input.replace('Z', '+00:00'))
         return dt.strftime("%I:%M %p")
 
-    except:
-        return "❌ [ERROR] Invalid Time"
+    except:
+        return "❌ [ERROR] Invalid Time"
+
+
+###############################################################################
+#
+# Procedure   : GetGoogleCredentials()
+#
+# Description : Google OAuth2 authentication.
+#             : Returns valid credential object for using Google Calendar API.
+#             : - Use credentials.json for first-time access.
+#             : - Store/refresh token in token.pickle.
+#             : - Kept in memory, so token.pickle is read at most once.
+#
+# Input       : -none-
+#
+# Returns     : credentials - Google object to access Calendar API.
+#
+###############################################################################
+
+@Timed()
+def GetGoogleCredentials():
+
+    global _credentials
+
+    if _credentials and _credentials.valid:
+        return _credentials
+
+    credentials = _credentials
+
+    # check for saved token
+    if not credentials and os.path.exists("token.pickle"):
+        with Span('token unpickle'), open("token.pickle", "rb") as token:
+            credentials = pickle.load(token)
+
+    # if no valid token, start OAuth flow
+    if not credentials or not credentials.valid:
+
+        from google.auth.transport.requests import Request
+        from google_auth_oauthlib.flow      import InstalledAppFlow
+
+        if credentials and credentials.expired and credentials.refresh_token:
+            with Span('token refresh'):
+                credentials.refresh(Request())
+
+        else:
+            flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
+            credentials = flow.run_local_server(port=0)
+
+        # save token for future use
+        with open("token.pickle", "wb") as token:
+            pickle.dump(credentials, token)
+
+    _credentials = credentials
+
+    return _credentials
+
+
+###############################################################################
+#
+# Procedure   : AddNoteToEvent()
+#
+# Description : Updates description field of existing Google Calendar event.
+#
+# Input       : eventId - Unique ID of calendar event.
+#             : note    - Text string to update. 
+#
+# Returns     : True  - Event was successfully updated.
+#             : False - Error occurs. 
+#
+###############################################################################
+
+def AddNoteToEvent(eventId, note):
+
+    try:
+
+        service = GetCalendarService()
+
+        event = Execute(service.events().get(calendarId="primary", eventId=eventId))
+        event["description"] = note
+        Execute(service.events().update(calendarId="primary", eventId=eventId, body=event))
+
+        return True
+
+    except Exception as e:
+
+        print(f"❌ [EXCEPTION] {e}")
+        return False
+
+
+###############################################################################
+#
+# Procedure   : SaveBirthday()
+#
+# Description : Saves a birthday to Google Calendar as a 6 AM reminder.
+#
+# Input       : name  - str : name of person
+#             : month - int : month (1–12)
+#             : day   - int : day (1–31)
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def SaveBirthday(name, month, day):
+
+    service = GetCalendarService()
+    event   = BirthdayEvent(name, month, day)
+
+    try:
+        event = Execute(service.events().insert(calendarId='primary', body=event))
+        print(f"✅ [INFO] Birthday reminder created for {name} on {event['start']['dateTime'][:10]}")
+
+        cache = OpenEventCache()
+
+        try:
+            IndexBirthday(cache, event)
+            cache.commit()
+
+        finally:
+            cache.close()
+
+    except Exception as e:
+        print(f"❌ [ERROR] Failed to create birthday reminder for {name}: {e}")
+
+
+###############################################################################
+#
+# Procedure   : BirthdayEvent()
+#
+# Description : Event body for a birthday: yearly 6 AM reminder, tagged
+#             : so the birthday index can find it.
+#
+# Input       : name  - str : name of person
+#             : month - int : month (1–12)
+#             : day   - int : day (1–31)
+#
+# Returns     : dict - event body for events().insert()
+#
+###############################################################################
+
+def BirthdayEvent(name, month, day):
+
+    now       = datetime.now()
+    eventDate = datetime(now.year, month, day, 6, 0, 0)
+
+    return {
+        'summary': f"🎂 {name}'s Birthday",
+        'start': {
+            'dateTime': eventDate.isoformat(),
+            'timeZone': 'America/New_York'
+        },
+        'end': {
+            'dateTime': (eventDate + timedelta(hours=0)).isoformat(),
+            'timeZone': 'America/New_York'
+        },
+        'recurrence': [
+            'RRULE:FREQ=YEARLY'
+        ],
+        'reminders': {
+            'useDefault': False,
+            'overrides': [
+                {'method': 'popup', 'minutes': 0}
+            ]
+        },
+        'colorId': '7',
+        'extendedProperties': CalBossTags('birthday', name)
+    }
+
+
+###############################################################################
+#
+# Procedure   : ParseBirthday()
+#
+# Description : Month and day from the birthday formats contact exports
+#             : use: YYYY-MM-DD, YYYYMMDD, --MM-DD, --MMDD (vCard without
+#             : year), MM/DD and MM/DD/YYYY.
+#
+# Input       : text - string - birthday as written in the file
+#
+# Returns     : tuple - (month, day), or None if not a valid date
+#
+###############################################################################
+
+def ParseBirthday(text):
+
+    text = text.strip()
+
+    for pattern in (r'(?:\d{4}|--)-?(\d{2})-?(\d{2})', r'(\d{1,2})/(\d{1,2})(?:/\d{2,4})?'):
+
+        match = re.fullmatch(pattern, text.split('T')[0])
+
+        if match:
+            month, day = map(int, match.groups())
+
+            try:
+                datetime(2000, month, day)
+                return month, day
+
+            except ValueError:
+                return None
+
+    return None
+
+
+###############################################################################
+#
+# Procedure   : ReadContacts()
+#
+# Description : Streams (name, birthday) pairs out of a contacts export.
+#             : - .vcf : FN (or N) and BDAY of each card, folded lines
+#             :          unfolded.
+#             : - .csv : a name column (Name / Full Name, or First Name +
+#             :          Last Name) and a Birthday / Birth Date column.
+#             : Contacts without a name or birthday are passed through
+#             : with None so the caller can count them.
+#
+# Input       : path - string - .vcf or .csv file
+#
+# Returns     : generator - (name or None, (month, day) or None)
+#
+###############################################################################
+
+def ReadContacts(path):
+
+    if path.lower().endswith('.csv'):
+
+        import csv
+
+        with open(path, newline='', encoding='utf-8-sig') as handle:
+
+            for row in csv.DictReader(handle):
+
+                row  = {key.strip().lower(): (value or '').strip() for key, value in row.items() if key}
+                name = row.get('name') or row.get('full name') or \
+                       ' '.join(part for part in (row.get('first name'), row.get('last name')) if part)
+                bday = row.get('birthday') or row.get('birth date') or row.get('bday') or ''
+
+                yield name or None, ParseBirthday(bday)
+
+        return
+
+    def Card(lines):
+
+        fields = {}
+
+        for line in lines:
+            key, _, value = line.partition(':')
+            fields.setdefault(key.split(';')[0].upper(), value.strip())
+
+        name = fields.get('FN') or ' '.join(part for part in reversed(fields.get('N', '').split(';')[:2]) if part)
+
+        return name or None, ParseBirthday(fields.get('BDAY', ''))
+
+    with open(path, encoding='utf-8-sig') as handle:
+
+        lines = None
+
+        for raw in handle:
+
+            line = raw.rstrip('\r\n')
+
+            # folded line: continues the previous one
+            if line[:1] in (' ', '\t') and lines:
+                lines[-1] += line[1:]
+                continue
+
+            if line.upper() == 'BEGIN:VCARD':
+                lines = []
+
+            elif line.upper() == 'END:VCARD' and lines is not None:
+                yield Card(lines)
+                lines = None
+
+            elif lines is not None:
+                lines.append(line)
+
+
+###############################################################################
+#
+# Procedure   : ImportBirthdays()
+#
+# Description : --bday-import: adds birthdays in bulk from a .vcf or .csv.
+#             : - The file is streamed, BATCH_SIZE inserts per batch
+#             :   request.
+#             : - Names already in the birthday index (or earlier in the
+#             :   file) are skipped - one set lookup each.
+#             : - New events go straight into the birthday index.
+#
+# Input       : path - string - contacts file
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def ImportBirthdays(path):
+
+    if not os.path.exists(path):
+        print(f"❌ [ERROR] Contacts file not found: {path}")
+        return
+
+    service = GetCalendarService()
+    known   = {name for names in LoadBirthdayIndex()['byDay'].values() for name in names}
+    stats   = {'added': 0, 'skipped': 0, 'invalid': 0, 'failed': 0}
+    cache   = OpenEventCache()
+
+    def Flush(pending):
+
+        requests = [(str(index), service.events().insert(calendarId='primary', body=BirthdayEvent(name, *date)))
+                    for index, (name, date) in enumerate(pending)]
+        results  = ExecuteBatch(service, requests)
+
+        for index, (name, date) in enumerate(pending):
+
+            response, exception = results[str(index)]
+
+            if exception is not None:
+                stats['failed'] += 1
+                print(f"❌ [ERROR] Failed to create birthday reminder for {name}: {exception}")
+                continue
+
+            IndexBirthday(cache, response)
+            stats['added'] += 1
+
+        cache.commit()
+        print(f"🎂 [INFO] {stats['added']} birthdays added ...")
+
+    try:
+        pending = []
+
+        for name, date in ReadContacts(path):
+
+            if not name or not date:
+                stats['invalid'] += 1
+                continue
+
+            if name in known:
+                stats['skipped'] += 1
+                continue
+
+            # Feb 29 has no date this year - SaveBirthday() can't place it either
+            try:
+                BirthdayEvent(name, *date)
+
+            except ValueError:
+                stats['invalid'] += 1
+                continue
+
+            known.add(name)
+            pending.append((name, date))
+
+            if len(pending) == BATCH_SIZE:
+                Flush(pending)
+                pending = []
+
+        if pending:
+            Flush(pending)
+
+        print(f"✅ [INFO] Birthdays imported: {stats['added']} added, {stats['skipped']} already saved, "
+              f"{stats['invalid']} without a usable name/birthday, {stats['failed']} failed.")
+
+    except Exception as e:
+        print(f"❌ [ERROR] Birthday import failed: {e}")
+
+    finally:
+        cache.close()
+
+
+###############################################################################
+#           
+# Procedure   : RemoveBirthday()
+#   
+# Description : Remove a birthday event from Google Calendar.
+#             : The event ID comes from the birthday index, no listing.
+#
+# Input       : name - Name of person
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def RemoveBirthday(name):
+
+    service = GetCalendarService()
+
+    try:
+
+        LoadBirthdayIndex()
+
+        cache = OpenEventCache()
+
+        try:
+            row = cache.execute("SELECT id FROM birthdays WHERE name = ?", (name,)).fetchone()
+
+            if not row:
+                print(f"❌ [INFO] Birthday for {name} not found.")
+                return
+
+            Execute(service.events().delete(calendarId='primary', eventId=row[0]))
+            print(f"🗑️  [INFO] Birthday removed: {name}")
+
+            cache.execute("DELETE FROM birthdays WHERE id = ?", (row[0],))
+            cache.commit()
+
+        finally:
+            cache.close()
+
+    except Exception as e:
+        print(f"❌ [ERROR] Failed to remove birthday: {e}")
+
+
+###############################################################################
+#
+# Procedure   : IndexBirthday()
+#
+# Description : Adds or updates one yearly birthday master in the local
+#             : birthday index.
+#
+# Input       : cache - sqlite3 connection from OpenEventCache()
+#             : event - dict - birthday master event (SaveBirthday() shape)
+#
+# Returns     : boolean - True if the event was a birthday and was indexed
+#
+###############################################################################
+
+def IndexBirthday(cache, event):
+
+    if EventTag(event, TAG_TYPE) != 'birthday' or 'RRULE:FREQ=YEARLY' not in str(event.get('recurrence', '')):
+        return False
+
+    name  = EventTag(event, TAG_PERSON)
+    start = event['start'].get('dateTime', event['start'].get('date'))
+
+    cache.execute("INSERT OR REPLACE INTO birthdays VALUES (?, ?, ?, ?)",
+                  (event['id'], name, int(start[5:7]), int(start[8:10])))
+
+    return True
+
+
+###############################################################################
+#
+# Procedure   : RebuildBirthdayIndex()
+#
+# Description : Rebuilds the birthday index from the yearly master events
+#             : written by SaveBirthday() - one small listing, no
+#             : expansion of a year of instances. Finding none, it checks
+#             : for untagged ones (HintMigrateTags()).
+#
+# Input       : service - Google Calendar API service object
+#             : cache   - sqlite3 connection from OpenEventCache()
+#
+# Returns     : int - number of birthdays indexed
+#
+###############################################################################
+
+def RebuildBirthdayIndex(service, cache):
+
+    masters = FetchEvents(
+        service,
+        fields                  = 'id,summary,start,recurrence,extendedProperties',
+        calendarId              = 'primary',
+        singleEvents            = False,
+        privateExtendedProperty = f"{TAG_TYPE}=birthday"
+    )
+
+    cache.execute("DELETE FROM birthdays")
+
+    indexed = sum(IndexBirthday(cache, event) for event in masters)
+
+    cache.execute("INSERT OR REPLACE INTO cacheState VALUES ('birthdayIndex', ?)", (str(time.time()),))
+    cache.commit()
+
+    if not indexed:
+        HintMigrateTags(service, 'birthday')
+
+    return indexed
+
+
+###############################################################################
+#
+# Procedure   : LoadBirthdayIndex()
+#
+# Description : Loads the local birthday index into month and (month, day)
+#             : buckets. The index is rebuilt first when it has never been
+#             : built, is older than BIRTHDAY_INDEX_TTL, or --no-cache /
+#             : --bday-reindex was given.
+#
+# Input       : rebuild - boolean - force a rebuild from the calendar
+#
+# Returns     : dict - 'byMonth' = {month: [(day, name, id)]}
+#             :        'byDay'   = {(month, day): [name]}
+#
+###############################################################################
+
+@Timed()
+def LoadBirthdayIndex(rebuild=False):
+
+    cache = OpenEventCache()
+
+    try:
+        row = cache.execute("SELECT value FROM cacheState WHERE key = 'birthdayIndex'").fetchone()
+
+        if rebuild or not USE_CACHE or not row or time.time() - float(row[0]) > BIRTHDAY_INDEX_TTL:
+            RebuildBirthdayIndex(GetCalendarService(), cache)
+
+        byMonth = {}
+        byDay   = {}
+
+        for eventId, name, month, day in cache.execute("SELECT id, name, month, day FROM birthdays ORDER BY month, day, name"):
+            byMonth.setdefault(month, []).append((day, name, eventId))
+            byDay.setdefault((month, day), []).append(name)
+
+    finally:
+        cache.close()
+
+    return {'byMonth': byMonth, 'byDay': byDay}
+
+
+###############################################################################
+#
+# Procedure   : BirthdayDate()
+#
+# Description : 'Mon DD' label for a birthday (leap-year safe).
+#
+# Input       : month - int
+#             : day   - int
+#
+# Returns     : string
+#
+###############################################################################
+
+def BirthdayDate(month, day):
+
+    return datetime(2000, month, day).strftime('%b %d')
+
+
+###############################################################################
+#
+# Procedure   : ShowBirthdaysThisMonth()
+#
+# Description : Displays birthdays occurring in the current month.
+#
+# Input       : -none-
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def ShowBirthdaysThisMonth():
+
+    now = datetime.now()
+
+    try:
+        birthdays = LoadBirthdayIndex()['byMonth'].get(now.month, [])
+
+        if not birthdays:
+            print("😴 No birthdays this month.")
+            return
+
+        print("🎉 Birthdays This Month:\n")
+
+        for day, name, eventId in birthdays:
+            print(f"🎂 {name}'s Birthday - {BirthdayDate(now.month, day)}")
+
+    except Exception as e:
+        print(f"❌ [ERROR] Could not retrieve birthdays: {e}")
+
+
+###############################################################################
+#
+# Procedure   : ShowTodaysBirthdays()
+#
+# Description : Displays only birthdays occurring today.
+#
+# Input       : -none-
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def ShowTodaysBirthdays():
+
+    now = datetime.now()
+
+    try:
+        birthdaysToday = LoadBirthdayIndex()['byDay'].get((now.month, now.day), [])
+
+        if not birthdaysToday:
+            print("😴 No birthdays today.")
+        else:
+            print("🎉 Birthdays Today:\n")
+            for name in birthdaysToday:
+                print(f"🎂 {name}'s Birthday")
+
+    except Exception as e:
+        print(f"❌ [ERROR] Could not retrieve today's birthdays: {e}")
+
+
+###############################################################################
+#
+# Procedure   : ShowBirthdaysThisWeek()
+#
+# Description : Shows birthdays occurring in the next 7 days.
+#
+# Input       : -none-
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def ShowBirthdaysThisWeek():
+
+    now = datetime.now()
+
+    try:
+        byDay = LoadBirthdayIndex()['byDay']
+        found = False
+
+        for offset in range(7):
+
+            date = now + timedelta(days=offset)
+
+            for name in byDay.get((date.month, date.day), []):
+
+                if not found:
+                    print("🎉 Birthdays This Week:\n")
+                    found = True
+
+                print(f"🎂 {name}'s Birthday - {date.strftime('%b %d')}")
+
+        if not found:
+            print("🎉 No birthdays in the next 7 days.")
+
+    except Exception as e:
+        print(f"❌ [ERROR] Failed to fetch weekly birthdays: {e}")
+
+
+###############################################################################
+#
+# Procedure   : ShowAllBirthdays()
+#
+# Description : Displays all birthdays on the calendar, grouped by month.
+#
+# Input       : -none-
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def ShowAllBirthdays():
+
+    monthEmojis = {
+        "January":   "❄️",
+        "February":  "💘",
+        "March":     "☘️",
+        "April":     "🌧️",
+        "May":       "🌸",
+        "June":      "🌈",
+        "July":      "🎆",
+        "August":    "🏖️",
+        "September": "🍂",
+        "October":   "🎃",
+        "November":  "🦃",
+        "December":  "🎄",
+    }
+
+    try:
+        monthBuckets = LoadBirthdayIndex()['byMonth']
+
+        if not monthBuckets:
+            print("🎉 No birthdays found.")
+            return
+
+        print("🎉 All Birthdays:")
+
+        for month in sorted(monthBuckets):
+            monthName = datetime(2000, month, 1).strftime('%B')
+            emoji     = monthEmojis.get(monthName, "📅")
+            print(f"\n{emoji} {monthName}:")
+
+            for day, name, eventId in monthBuckets[month]:
+                print(f"🎂 {name}'s Birthday - {BirthdayDate(month, day)}")
+
+    except Exception as e:
+        print(f"❌ [ERROR] Failed to fetch all birthdays: {e}")
+
+
+###############################################################################
+#
+# Procedure   : ShowTodaySchedule()
+#
+# Description : Displays today's events followed by today's birthdays.
+#             : Birthdays come from the local birthday index.
+#
+# Input       : args   - parsed CLI arguments
+#             : events - list - prefetched 'today' window [optional]
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def ShowTodaySchedule(args, events=None):
+
+    now = datetime.now()
+
+    print(f"📅  Today’s Schedule ({now.strftime('%b %d')}):")
+
+    service = GetCalendarService()
+
+    if events is None:
+        events = FetchWindows(service, {'today': ViewWindows()['today']})['today']
+
+    events = FetchTodayEvents(service, events)
+
+    with Span('ShowTodaySchedule', 'render'):
+
+        if not events:
+            print("😴  No events scheduled for today.\n")
+
+        else:
+            for event in events:
+                timeStr = "All Day" if event.allDay else FormatTime(event.start)
+
+                print(f"🕘 {timeStr} - {event.summary}")
+
+                if event.location:
+                    print(f"📍 {event.location}")
+
+                if event.description:
+                    print(f"📝 Note: {event.description}")
+
+                if args.showids and event.id:
+                    print(f"🆔 {event.id}")
+                #print("")
+
+        # now let's show birthdays for today
+
+        birthdaysToday = LoadBirthdayIndex()['byDay'].get((now.month, now.day), [])
+
+        if birthdaysToday:
+
+            print("\n🎉 Birthday(s):")
+
+            for name in birthdaysToday:
+                print(f"🎂 {name}'s Birthday")
+
+
+###############################################################################
+#
+# Procedure   : ShowWeekSchedule()
+#
+# Description : Displays the week's schedule in a compact grouped format.
+#
+# Input       : args   - parsed CLI arguments
+#             : events - list - prefetched 'week' window [optional]
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def ShowWeekSchedule(args, events=None):
+
+    now = datetime.now()
+
+    if events is None:
+        events = FetchWindows(GetCalendarService(), {'week': ViewWindows()['week']})['week']
+
+    with Span('ShowWeekSchedule', 'render'):
+
+        if not events:
+            print("😴  No events scheduled this week.")
+            return
+
+        print(f"\n📆  Weekly Schedule Starting {now.strftime('%b %d')}\n")
+
+        days = {}
+
+        for event in events:
+
+            dateObj = event.start
+            dayStr  = dateObj.strftime('%A (%b %d)')
+
+            if dateObj.date() == (now + timedelta(days=1)).date():
+                dayStr = f"Tomorrow ({dateObj.strftime('%b %d')})"
+
+            if dayStr not in days:
+                days[dayStr] = []
+
+            timeStr = "All Day" if event.allDay else FormatTime(event.start)
+            summary = event.summary
+
+            if summary.startswith('🎂'):
+                summary = f"🎂 {summary[2:]}"
+
+            entry = f"🕘 {timeStr} - {summary}"
+
+            if event.location:
+                entry += f"\n📍 {event.location}"
+
+            if event.description:
+                entry += f"\n📝 Note: {event.description}"
+
+            if args.showids and event.id:
+                entry += f"\n🆔 Event ID: {event.id}"
+            days[dayStr].append(entry)
+
+        for day in sorted(days.keys(), key=lambda d: datetime.strptime(d.split('(')[-1].replace(')', ''), "%b %d")):
+            print(f"📅  {day}")
+            for entry in days[day]:
+                print(entry)
+            print()
+
+
+###############################################################################
+#
+# Procedure   : ShowDashboard()
+#
+# Description : --dashboard: today, the week, this month's birthdays and
+#             : upcoming catch-ups. The event windows are fetched
+#             : concurrently in one go; birthdays come from the index.
+#
+# Input       : args    - parsed CLI arguments
+#             : windows - dict - prefetched ViewWindows() events [optional]
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def ShowDashboard(args, windows=None):
+
+    if windows is None:
+        windows = FetchWindows(GetCalendarService(), ViewWindows())
+
+    ShowTodaySchedule(args, windows['today'])
+    ShowWeekSchedule(args, windows['week'])
+    ShowBirthdaysThisMonth()
+    print()
+    ListCatchUps(windows['catchups'])
+
+
+###############################################################################
+#
+# Procedure   : ShowSearch()
+#
+# Description : --search / --search-all: ranked keyword search over title,
+#             : location and notes of every calendar in CALENDARS.
+#             : - Upcoming events only unless --search-all; --since and
+#             :   --until narrow the window either way.
+#             : - Answered from the local full-text index after a sync;
+#             :   with --no-cache falls back to the API's own 'q' search
+#             :   (whole words), ranked by term hits with SEARCH_WEIGHTS
+#             :   and one result per recurring series, like the index.
+#
+# Input       : args - parsed CLI arguments
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def ShowSearch(args):
+
+    text  = args.search or args.search_all
+    lower = 0.0 if args.search_all else time.time()
+    upper = float('inf')
+
+    try:
+        if args.since:
+            lower = LocalTimezone().localize(datetime.strptime(args.since, "%Y-%m-%d")).timestamp()
+
+        if args.until:
+            upper = LocalTimezone().localize(datetime.strptime(args.until, "%Y-%m-%d") + timedelta(days=1)).timestamp()
+
+    except ValueError:
+        print("❌ [ERROR] --since/--until must be YYYY-MM-DD.")
+        return
+
+    service = GetCalendarService()
+    began   = time.perf_counter()
+    results = None
+
+    if USE_CACHE:
+
+        try:
+            cache = OpenEventCache()
+
+            try:
+                if SYNC_ON_READ:
+                    SyncCalendars(service)
+
+                began   = time.perf_counter()
+                results = SearchEvents(cache, text, lower, upper, CALENDARS)
+
+            finally:
+                cache.close()
+
+        except sqlite3.Error as e:
+            print(f"⚠️ [WARNING] Search index unavailable ({e}), searching Google directly.")
+
+    if results is None:
+
+        hits   = {}
+        terms  = text.lower().split()
+        params = {'q': text, 'singleEvents': True, 'orderBy': 'startTime',
+                  'timeMin': datetime.fromtimestamp(lower, timezone.utc).isoformat()}
+
+        if upper != float('inf'):
+            params['timeMax'] = datetime.fromtimestamp(upper, timezone.utc).isoformat()
+
+        for calendarId in CALENDARS:
+            for event in FetchEvents(service, calendarId=calendarId, **params):
+
+                # instances come in date order - keep each series' next one
+                hits.setdefault((calendarId, event.get('recurringEventId') or event['id']), event)
+
+                if len(hits) >= SEARCH_LIMIT * len(CALENDARS):
+                    break
+
+        def Score(event):
+            fields = (event.get('summary', ''), event.get('location', ''), event.get('description', ''))
+            return sum(weight * field.lower().count(term) for weight, field in zip(SEARCH_WEIGHTS, fields) for term in terms)
+
+        ranked  = sorted(hits.values(), key=lambda event: (-Score(event), EventEpoch(event['start'])))
+        results = [Event(event) for event in ranked[:SEARCH_LIMIT]]
+
+    elapsed = (time.perf_counter() - began) * 1000
+
+    if not results:
+        print(f"🔍 No events match '{text}'.")
+        return
+
+    print(f"🔍 {len(results)} result(s) for '{text}' ({elapsed:.1f} ms):\n")
+
+    for event in results:
+
+        dayStr  = event.start.strftime('%a %b %d, %Y')
+        timeStr = "All Day" if event.allDay else FormatTime(event.start)
+
+        print(f"📅 {dayStr} @ {timeStr} - {event.summary}")
+
+        if event.location:
+            print(f"📍 {event.location}")
+
+        if event.description:
+            print(f"📝 Note: {event.description}")
+
+        if args.showids and event.id:
+            print(f"🆔 {event.id}")
+
+        print()
+
+
+###############################################################################
+#
+# Procedure   : MergeIntervals()
+#
+# Description : Sorts and merges overlapping (start, end) intervals in one
+#             : sweep - O(n log n) for the sort, O(n) for the merge.
+#
+# Input       : intervals - iterable - (start, end) epoch seconds
+#
+# Returns     : list - disjoint [start, end] pairs, ordered by start
+#
+###############################################################################
+
+def MergeIntervals(intervals):
+
+    merged = []
+
+    for start, end in sorted(intervals):
+
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+
+        elif end > start:
+            merged.append([start, end])
+
+    return merged
+
+
+###############################################################################
+#
+# Procedure   : ClipIntervals()
+#
+# Description : Parts of merged intervals that fall inside [lower, upper).
+#             : Binary search for the first candidate, so one day of a
+#             : long range costs O(log n + k).
+#
+# Input       : merged - list  - output of MergeIntervals()
+#             : ends   - list  - [end for start, end in merged]
+#             : lower  - float - range start (epoch seconds)
+#             : upper  - float - range end (epoch seconds)
+#
+# Returns     : list - (start, end) pairs clipped to the range
+#
+###############################################################################
+
+def ClipIntervals(merged, ends, lower, upper):
+
+    clipped = []
+
+    for start, end in merged[bisect.bisect_right(ends, lower):]:
+
+        if start >= upper:
+            break
+
+        clipped.append((max(start, lower), min(end, upper)))
+
+    return clipped
+
+
+###############################################################################
+#
+# Procedure   : FreeSlots()
+#
+# Description : Gaps between busy intervals inside [lower, upper).
+#
+# Input       : busy  - list  - clipped, ordered (start, end) pairs
+#             : lower - float - range start (epoch seconds)
+#             : upper - float - range end (epoch seconds)
+#
+# Returns     : list - free (start, end) pairs
+#
+###############################################################################
+
+def FreeSlots(busy, lower, upper):
+
+    free   = []
+    cursor = lower
+
+    for start, end in busy:
+
+        if start > cursor:
+            free.append((cursor, start))
+
+        cursor = max(cursor, end)
+
+    if cursor < upper:
+        free.append((cursor, upper))
+
+    return free
+
+
+###############################################################################
+#
+# Procedure   : FetchBusyIntervals()
+#
+# Description : Busy time across every calendar in CALENDARS, merged.
+#             : - Default: timed events from the cache / events().list(),
+#             :   minus 'show me as available' and declined ones.
+#             : - useFreeBusy: the freebusy endpoint, which returns only
+#             :   busy ranges (cheaper when event details are not needed).
+#
+# Input       : service     - Google Calendar API service object
+#             : timeMin     - string  - ISO 8601 range start
+#             : timeMax     - string  - ISO 8601 range end
+#             : useFreeBusy - boolean - query the freebusy endpoint
+#
+# Returns     : list - merged [start, end] pairs (epoch seconds)
+#
+###############################################################################
+
+def FetchBusyIntervals(service, timeMin, timeMax, useFreeBusy=False):
+
+    intervals = []
+
+    if useFreeBusy:
+
+        # the endpoint takes at most 50 calendars per query
+        for offset in range(0, len(CALENDARS), 50):
+
+            result = Execute(service.freebusy().query(body={
+                'timeMin': timeMin,
+                'timeMax': timeMax,
+                'items'  : [{'id': calendarId} for calendarId in CALENDARS[offset:offset + 50]]
+            }))
+
+            for calendar in result.get('calendars', {}).values():
+                intervals.extend((TimeBoundEpoch(busy['start']), TimeBoundEpoch(busy['end'])) for busy in calendar.get('busy', []))
+
+    else:
+        events    = FetchWindows(service, {'busy': {'timeMin': timeMin, 'timeMax': timeMax}})['busy']
+        intervals = [(event.startEpoch, event.endEpoch) for event in events
+                     if not event.allDay and not event.transparent and event.response != 'declined']
+
+    return MergeIntervals(intervals)
+
+
+###############################################################################
+#
+# Procedure   : DayLoad()
+#
+# Description : Booked and free time of one day's working hours
+#             : (WORKDAY_START to WORKDAY_END, local time).
+#
+# Input       : merged - list - output of MergeIntervals()
+#             : ends   - list - [end for start, end in merged]
+#             : day    - date - local calendar day
+#
+# Returns     : tuple - (booked seconds, free (start, end) pairs)
+#
+###############################################################################
+
+def DayLoad(merged, ends, day):
+
+    tz    = LocalTimezone()
+    lower = tz.localize(datetime.combine(day, datetime.min.time()).replace(hour=WORKDAY_START)).timestamp()
+    upper = tz.localize(datetime.combine(day, datetime.min.time()).replace(hour=WORKDAY_END)).timestamp()
+
+    busy = ClipIntervals(merged, ends, lower, upper)
+
+    return sum(end - start for start, end in busy), FreeSlots(busy, lower, upper)
+
+
+###############################################################################
+#
+# Procedure   : ShowSummary()
+#
+# Description : --summary: hours booked vs free for each of the next 7 days.
+#
+# Input       : args - parsed CLI arguments
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def ShowSummary(args):
+
+    tz    = LocalTimezone()
+    today = datetime.now(tz).date()
+    start = tz.localize(datetime.combine(today, datetime.min.time()))
+    end   = start + timedelta(days=7)
+
+    try:
+        merged = FetchBusyIntervals(GetCalendarService(), start.isoformat(), end.isoformat(), args.freebusy)
+        ends   = [end for start, end in merged]
+
+        print(f"📊  Booked vs Free ({WORKDAY_START}:00–{WORKDAY_END}:00)\n")
+
+        totalBooked = 0
+        workday     = (WORKDAY_END - WORKDAY_START) * 3600
+
+        for offset in range(7):
+
+            day          = today + timedelta(days=offset)
+            booked, free = DayLoad(merged, ends, day)
+            totalBooked += booked
+
+            print(f"📅  {day.strftime('%a %b %d')}  ⏳ {booked / 3600:4.1f}h booked  🟢 {(workday - booked) / 3600:4.1f}h free")
+
+        print(f"\n🧮  Week: {totalBooked / 3600:.1f}h booked, {(7 * workday - totalBooked) / 3600:.1f}h free")
+
+    except Exception as e:
+        print(f"❌ [ERROR] Could not build summary: {e}")
+
+
+###############################################################################
+#
+# Procedure   : ShowVibeCheck()
+#
+# Description : --vibe-check: today's booked time, free slots and a verdict.
+#
+# Input       : args - parsed CLI arguments
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def ShowVibeCheck(args):
+
+    tz    = LocalTimezone()
+    today = datetime.now(tz).date()
+    start = tz.localize(datetime.combine(today, datetime.min.time()))
+    end   = start + timedelta(days=1)
+
+    try:
+        merged       = FetchBusyIntervals(GetCalendarService(), start.isoformat(), end.isoformat(), args.freebusy)
+        booked, free = DayLoad(merged, [end for start, end in merged], today)
+        ratio        = booked / ((WORKDAY_END - WORKDAY_START) * 3600)
+
+        print(f"🔮  Vibe Check ({today.strftime('%b %d')})\n")
+        print(f"⏳ Booked: {booked / 3600:.1f}h")
+        print(f"🟢 Free:   {sum(slotEnd - slotStart for slotStart, slotEnd in free) / 3600:.1f}h\n")
+
+        for slotStart, slotEnd in free:
+            fromStr = datetime.fromtimestamp(slotStart, tz).strftime('%I:%M %p')
+            toStr   = datetime.fromtimestamp(slotEnd, tz).strftime('%I:%M %p')
+            print(f"🟢 {fromStr} – {toStr} ({(slotEnd - slotStart) / 3600:.1f}h)")
+
+        if ratio >= 0.8:
+            print("\n🔥 Back-to-back day. Guard your breaks.")
+
+        elif ratio >= 0.5:
+            print("\n⚖️  Busy but balanced.")
+
+        else:
+            print("\n😎 Plenty of room. Block some focus time.")
+
+    except Exception as e:
+        print(f"❌ [ERROR] Could not run vibe check: {e}")
+
+
+###############################################################################
+#
+# Procedure   : InsightColumns()
+#
+# Description : Event history as columns for --insights.
+#             : - Timed single events and exceptions come straight from the
+#             :   store's startEpoch/endEpoch columns; recurring series go
+#             :   from the memoized ExpandRule() epochs into arrays, the
+#             :   few fields needed read with json_extract().
+#             : - With --no-cache, or if the store is unusable, reads
+#             :   RemoteEvents() instead.
+#             : - All-day events carry no hours and are left out.
+#
+# Input       : service - Google Calendar API service object
+#             : lower   - float - window start (epoch seconds)
+#             : upper   - float - window end (epoch seconds)
+#
+# Returns     : tuple - numpy arrays (start epoch, duration in hours,
+#             :         calendar index into CALENDARS)
+#
+###############################################################################
+
+@Timed()
+def InsightColumns(service, lower, upper):
+
+    import numpy
+
+    starts    = []
+    ends      = []
+    calendars = []
+
+    def Add(index, pairs):
+
+        pairs = numpy.asarray(pairs, dtype=numpy.float64).reshape(-1, 2)
+
+        starts.append(pairs[:, 0])
+        ends.append(pairs[:, 1])
+        calendars.append(numpy.full(len(pairs), index, dtype=numpy.int16))
+
+    def Columns():
+
+        start = numpy.concatenate(starts)
+        hours = (numpy.minimum(numpy.concatenate(ends), upper) - numpy.maximum(start, lower)) / 3600
+
+        return start, hours, numpy.concatenate(calendars)
+
+    if USE_CACHE:
+
+        try:
+            cache = OpenEventCache()
+
+            try:
+                if SYNC_ON_READ:
+                    SyncCalendars(service)
+
+                for index, calendarId in enumerate(CALENDARS):
+
+                    # single events - masters are the endEpoch = inf rows
+                    Add(index, cache.execute(
+                        "SELECT startEpoch, endEpoch FROM events WHERE calendarId = ? AND recurringEventId IS NULL"
+                        " AND endEpoch > ? AND startEpoch < ? AND endEpoch < ?"
+                        " AND json_extract(body, '$.start.dateTime') IS NOT NULL",
+                        (calendarId, lower, upper, float('inf'))).fetchall())
+
+                    # exceptions - the store keeps their epochs, cancelled ones
+                    # as a zero-length row at the original start
+                    moved = {}
+
+                    for seriesId, original, status, start, end, timed in cache.execute(
+                            "SELECT recurringEventId, json_extract(body, '$.originalStartTime'), json_extract(body, '$.status'),"
+                            " startEpoch, endEpoch, json_extract(body, '$.start.dateTime') IS NOT NULL"
+                            " FROM events WHERE calendarId = ? AND recurringEventId IS NOT NULL", (calendarId,)):
+
+                        if original:
+                            moved.setdefault(seriesId, set()).add(round(EventEpoch(json.loads(original))))
+
+                        if status != 'cancelled' and timed and end > lower and start < upper:
+                            Add(index, [(start, end)])
+
+                    # recurring series - the memoized ExpandRule() epochs go
+                    # straight into arrays, bodies are never decoded
+                    for seriesId, recurrence, dtstart, timeZone, dtend, endZone in cache.execute(
+                            "SELECT id, json_extract(body, '$.recurrence'), json_extract(body, '$.start.dateTime'),"
+                            " json_extract(body, '$.start.timeZone'), json_extract(body, '$.end.dateTime'),"
+                            " json_extract(body, '$.end.timeZone')"
+                            " FROM events WHERE calendarId = ? AND endEpoch = ? AND startEpoch < ? AND recurringEventId IS NULL"
+                            " AND json_extract(body, '$.start.dateTime') IS NOT NULL", (calendarId, float('inf'), upper)):
+
+                        duration = EventEpoch({'dateTime': dtend, 'timeZone': endZone}) - EventEpoch({'dateTime': dtstart, 'timeZone': timeZone})
+                        series   = numpy.asarray(ExpandRule(tuple(json.loads(recurrence)), dtstart, timeZone,
+                                                            (lower - duration) // 86400 * 86400, -(-upper // 86400) * 86400))
+
+                        series = series[(series + duration > lower) & (series < upper)]
+
+                        if seriesId in moved:
+                            series = series[~numpy.isin(numpy.round(series), list(moved[seriesId]))]
+
+                        Add(index, numpy.column_stack((series, series + duration)))
+
+                return Columns()
+
+            finally:
+                cache.close()
+
+        except sqlite3.Error as e:
+            print(f"⚠️ [WARNING] Event cache unavailable ({e}), fetching directly.")
+            starts.clear()
+            ends.clear()
+            calendars.clear()
+
+    timeMin = datetime.fromtimestamp(lower, timezone.utc).isoformat()
+    timeMax = datetime.fromtimestamp(upper, timezone.utc).isoformat()
+
+    for index, calendarId in enumerate(CALENDARS):
+        Add(index, [(event.startEpoch, event.endEpoch)
+                    for event in RemoteEvents(service, timeMin, timeMax, calendarId) if not event.allDay])
+
+    return Columns()
+
+
+###############################################################################
+#
+# Procedure   : ShowInsights()
+#
+# Description : --insights: patterns in the event history (default the
+#             : last INSIGHTS_YEARS years, or --since/--until).
+#             : - hours booked per weekday, lightest and busiest day.
+#             : - weekday x hour heatmap of meeting starts.
+#             : - busiest weeks and the trend of weekly hours.
+#             : Every aggregate is a NumPy group-by (bincount) over the
+#             : columns from InsightColumns() - no per-event Python loop.
+#
+# Input       : args - parsed CLI arguments
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def ShowInsights(args):
+
+    try:
+        import numpy
+
+    except ImportError:
+        print("❌ [ERROR] --insights needs the numpy package (pip install numpy).")
+        return
+
+    tz    = LocalTimezone()
+    upper = time.time()
+    lower = upper - INSIGHTS_YEARS * 365.25 * 86400
+
+    try:
+        if args.since:
+            lower = tz.localize(datetime.strptime(args.since, "%Y-%m-%d")).timestamp()
+
+        if args.until:
+            upper = tz.localize(datetime.strptime(args.until, "%Y-%m-%d") + timedelta(days=1)).timestamp()
+
+    except ValueError:
+        print("❌ [ERROR] --since/--until must be YYYY-MM-DD.")
+        return
+
+    if upper <= lower:
+        print("❌ [ERROR] --since must be before --until.")
+        return
+
+    try:
+        service              = GetCalendarService()
+        began                = time.perf_counter()
+        start, hours, owners = InsightColumns(service, lower, upper)
+
+    except Exception as e:
+        print(f"❌ [ERROR] Could not load event history: {e}")
+        return
+
+    if not len(start):
+        print("📭 No timed events in that range.")
+        return
+
+    with Span('ShowInsights', 'render'):
+
+        # local wall clock - one UTC offset per distinct hour, not per event
+        hourly, slot = numpy.unique(start // 3600, return_inverse=True)
+        offsets      = numpy.array([datetime.fromtimestamp(h * 3600, tz).utcoffset().total_seconds() for h in hourly])
+        local        = start + offsets[slot]
+        localDay     = (local // 86400).astype(numpy.int64)
+        weekday      = (localDay + 3) % 7                  # 1970-01-01 was a Thursday
+        hour         = ((local % 86400) // 3600).astype(numpy.int64)
+
+        # average over how often each weekday occurs in the range
+        calendarDays = numpy.arange((lower + offsets[0]) // 86400, (upper + offsets[-1] - 1) // 86400 + 1, dtype=numpy.int64)
+        occurs       = numpy.bincount((calendarDays + 3) % 7, minlength=7)
+        perWeekday   = numpy.bincount(weekday, weights=hours, minlength=7) / numpy.maximum(occurs, 1)
+        heatmap      = numpy.bincount(weekday * 24 + hour, minlength=7 * 24).reshape(7, 24)
+
+        # Monday-based week numbers; events straddling the range edges count in the edge week
+        firstWeek    = int((lower + offsets[0]) // 86400 + 3) // 7
+        lastWeek     = int((upper + offsets[-1]) // 86400 + 3) // 7
+        week         = numpy.clip((localDay + 3) // 7 - firstWeek, 0, lastWeek - firstWeek)
+        perWeek      = numpy.bincount(week, weights=hours, minlength=lastWeek - firstWeek + 1)
+
+        elapsed      = (time.perf_counter() - began) * 1000
+        names        = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+        fromStr      = datetime.fromtimestamp(lower, tz).strftime('%b %d, %Y')
+        toStr        = datetime.fromtimestamp(upper - 1, tz).strftime('%b %d, %Y')
+
+        print(f"📊  Insights ({fromStr} – {toStr} · {len(start):,} events · {elapsed:.0f} ms)\n")
+
+        if len(CALENDARS) > 1:
+            perCalendar = numpy.bincount(owners, weights=hours, minlength=len(CALENDARS))
+
+            for calendarId, total in zip(CALENDARS, perCalendar):
+                print(f"🗂️  {calendarId}: {total:,.0f}h")
+
+            print()
+
+        print("🗓️  Hours booked per weekday (average day):\n")
+
+        scale = perWeekday.max() or 1
+
+        for name, value in zip(names, perWeekday):
+            print(f"  {name}  {'█' * round(20 * value / scale):<20} {value:4.1f}h")
+
+        workdays = numpy.where(occurs[:5] > 0, perWeekday[:5], numpy.inf)
+
+        if numpy.isfinite(workdays).any():
+            print(f"\n✅ Lightest weekday: {names[int(workdays.argmin())]}   🔥 Busiest: {names[int(perWeekday.argmax())]}")
+
+        print()
+
+        # only the hours anything starts in, so the grid fits a terminal
+        used   = numpy.flatnonzero(heatmap.sum(axis=0))
+        span   = range(used.min(), used.max() + 1)
+        shades = numpy.array(list(" ░▒▓█"))
+        levels = numpy.ceil(heatmap / (heatmap.max() or 1) * (len(shades) - 1)).astype(numpy.int64)
+
+        print("🌡️  When meetings start (local time):\n")
+        print("       " + "".join(f"{h:>3}" for h in span))
+
+        for index, name in enumerate(names):
+            print(f"  {name}  " + "".join(f"  {shade}" for shade in shades[levels[index, span.start:span.stop]]))
+
+        print("\n📅 Busiest weeks:\n")
+
+        for index in numpy.argsort(perWeek, kind='stable')[::-1][:INSIGHTS_WEEKS]:
+            if perWeek[index] > 0:
+                monday = datetime.fromtimestamp(((firstWeek + index) * 7 - 3) * 86400 + 43200, tz)
+                print(f"  Week of {monday.strftime('%b %d, %Y')}  {perWeek[index]:5.1f}h")
+
+        if len(perWeek) >= 4:
+            slope = numpy.polyfit(numpy.arange(len(perWeek)), perWeek, 1)[0] * 52.18 / 12
+            trend = "📈 Getting busier" if slope > 0.05 else "📉 Lightening up" if slope < -0.05 else "➖ Holding steady"
+
+            print(f"\n{trend}: weekly load {slope:+.2f}h per month (avg {perWeek.mean():.1f}h/week).")
+
+
+###############################################################################
+#
+# Procedure   : AddCatchUpEvent() 
+#
+# Description : Add a catch-up event to the calendar, in the first free
+#             : evening slot (CATCHUP_HOURS) of the given day.
+#
+# Input       : name - string - person's name (i.e. John Smith) 
+#             : date - string - event date in format YYYY-MM-DD
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def AddCatchUpEvent(name, date):   
+
+    service = GetCalendarService() 
+
+    try:
+        day   = datetime.strptime(date, "%Y-%m-%d").date()
+        start = PlanCatchUps(service, [(name, day, day, day)])[name]
+
+        if not start:
+            print(f"❌ [ERROR] No free evening on {date}. Leave out --date to let CalBoss find one.")
+            return
+
+        createdEvent = Execute(service.events().insert(calendarId='primary', body=CatchUpEvent(name, start)))
+        print(f"✅ Catch-Up scheduled with {name} on {date} at {FormatTime(start)}.")
+
+        cache = OpenEventCache()
+
+        try:
+            IndexCatchUp(cache, createdEvent)
+            cache.commit()
+
+        finally:
+            cache.close()
+
+    except Exception as e:
+        print(f"❌ [ERROR] Could not schedule catch-up: {e}")
+
+
+###############################################################################
+#
+# Procedure   : CatchUpEvent()
+#
+# Description : Event body for a catch-up, tagged so the catch-up index
+#             : can find it.
+#
+# Input       : name  - string   - person's name
+#             : start - datetime - local start of the slot
+#
+# Returns     : dict - event body for events().insert()
+#
+###############################################################################
+
+def CatchUpEvent(name, start):
+
+    zone = LocalTimezone().zone
+    end  = start + timedelta(hours=CATCHUP_LENGTH)
+
+    return {
+        "summary": f"🤖 Catch-Up: {name}",
+        "start": {
+            "dateTime": start.replace(tzinfo=None).isoformat(),
+            "timeZone": zone
+        },
+        "end": {
+            "dateTime": end.replace(tzinfo=None).isoformat(),
+            "timeZone": zone
+        },
+        "description": f"Frequency: {CATCHUP_FREQUENCY} months",
+        "extendedProperties": CalBossTags('catchup', name)
+    }
+
+
+###############################################################################
+#
+# Procedure   : CatchUpJitter()
+#
+# Description : Days a catch-up target is salted by (+/- CATCHUP_JITTER).
+#             : With a seed it is a hash of (seed, name, last catch-up), so
+#             : the same history always gives the same answer.
+#
+# Input       : name - string - person's name
+#             : last - date   - latest catch-up (None for someone new)
+#             : seed - int    - --seed value [optional]
+#
+# Returns     : int - offset in days
+#
+###############################################################################
+
+def CatchUpJitter(name, last, seed=None):
+
+    if seed is None:
+        return random.randint(-CATCHUP_JITTER, CATCHUP_JITTER)
+
+    import hashlib
+
+    digest = hashlib.blake2b(f"{seed}\0{name}\0{last}".encode(), digest_size=8).digest()
+
+    return int.from_bytes(digest, 'big') % (2 * CATCHUP_JITTER + 1) - CATCHUP_JITTER
+
+
+###############################################################################
+#
+# Procedure   : CatchUpTargets()
+#
+# Description : When each person is due, and the days their next catch-up
+#             : may land on, most overdue first.
+#             : - target  : due date +/- a CATCHUP_JITTER salt, random or
+#             :             from --seed (CatchUpJitter()).
+#             : - window  : CATCHUP_JITTER days either side of the due
+#             :             date, never before tomorrow.
+#             : - Someone without a past catch-up is due CATCHUP_FIRST
+#             :   months from today.
+#
+# Input       : names - list - people to plan for
+#             : index - dict - output of LoadCatchUpIndex()
+#             : seed  - int  - --seed value [optional]
+#
+# Returns     : list - (name, last, frequency, due, target, earliest,
+#             :         latest); last/frequency are None for new people
+#
+###############################################################################
+
+def CatchUpTargets(names, index, seed=None):
+
+    from dateutil.relativedelta import relativedelta
+
+    today    = datetime.now().date()
+    tomorrow = today + timedelta(days=1)
+    targets  = []
+
+    for name in dict.fromkeys(names):
+
+        if name in index:
+            last, frequency, due = index[name]
+
+        else:
+            last, frequency, due = None, None, today + relativedelta(months=CATCHUP_FIRST)
+
+        earliest = max(due - timedelta(days=CATCHUP_JITTER), tomorrow)
+        latest   = max(due, tomorrow) + timedelta(days=CATCHUP_JITTER)
+        target   = min(max(due + timedelta(days=CatchUpJitter(name, last, seed)), earliest), latest)
+
+        targets.append((name, last, frequency, due, target, earliest, latest))
+
+    # most overdue first, ties by name
+    return sorted(targets, key=lambda target: (target[3], target[0]))
+
+
+###############################################################################
+#
+# Procedure   : PlanCatchUps()
+#
+# Description : Places catch-ups for many people at once into free evening
+#             : slots.
+#             : - Busy time comes from the freebusy endpoint, one query per
+#             :   stretch of overlapping windows (a single query when the
+#             :   windows touch).
+#             : - Greedy in priority order: each person takes the free
+#             :   evening nearest their target day, CATCHUP_SPACING days
+#             :   from the ones already placed if possible.
+#             : - Never two catch-ups on one evening, never over a busy
+#             :   slot.
+#
+# Input       : service - Google Calendar API service object
+#             : wanted  - list - (name, target, earliest, latest) dates,
+#             :                  highest priority first
+#             : booked  - list - days already promised to others [optional]
+#
+# Returns     : dict - key = name, value = aware local start or None
+#
+###############################################################################
+
+@Timed()
+def PlanCatchUps(service, wanted, booked=()):
+
+    tz     = LocalTimezone()
+    merged = []
+    taken  = sorted(day.toordinal() for day in booked)
+    plan   = {}
+
+    if not wanted:
+        return plan
+
+    def SlotStart(day, hour=0):
+        return tz.localize(datetime.combine(day, datetime.min.time()).replace(hour=hour))
+
+    spans = MergeIntervals((earliest.toordinal(), latest.toordinal() + 1) for name, target, earliest, latest in wanted)
+
+    for first, last in spans:
+        merged.extend(FetchBusyIntervals(service,
+                                         SlotStart(datetime.fromordinal(first).date()).isoformat(),
+                                         SlotStart(datetime.fromordinal(last).date()).isoformat(), True))
+
+    ends = [end for start, end in merged]
+
+    def FreeEvening(day):
+
+        for hour in CATCHUP_HOURS:
+
+            start = SlotStart(day, hour)
+
+            if not ClipIntervals(merged, ends, start.timestamp(), start.timestamp() + CATCHUP_LENGTH * 3600):
+                return start
+
+        return None
+
+    for name, target, earliest, latest in wanted:
+
+        plan[name] = None
+        offsets    = sorted(range((earliest - target).days, (latest - target).days + 1), key=lambda offset: (abs(offset), offset))
+
+        for spacing in (CATCHUP_SPACING, 1):
+
+            for offset in offsets:
+
+                day     = target + timedelta(days=offset)
+                nearest = bisect.bisect_left(taken, day.toordinal())
+
+                if any(abs(other - day.toordinal()) < spacing for other in taken[max(0, nearest - 1):nearest + 1]):
+                    continue
+
+                plan[name] = FreeEvening(day)
+
+                if plan[name]:
+                    bisect.insort(taken, day.toordinal())
+                    break
+
+            if plan[name]:
+                break
+
+    return plan
+
+
+###############################################################################
+#
+# Procedure   : ScheduleCatchUps()
+#
+# Description : --catchup without --date: books the next catch-up with
+#             : each person into a free evening near their due date
+#             : (PlanCatchUps()), in one batch.
+#
+# Input       : names - list - people to book
+#             : seed  - int  - --seed value [optional]
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def ScheduleCatchUps(names, seed=None):
+
+    service = GetCalendarService()
+
+    try:
+        targets  = CatchUpTargets(names, LoadCatchUpIndex(), seed)
+        plan     = PlanCatchUps(service, [(name, target, earliest, latest) for name, last, frequency, due, target, earliest, latest in targets])
+        requests = [(name, service.events().insert(calendarId='primary', body=CatchUpEvent(name, start)))
+                    for name, start in plan.items() if start]
+        results  = ExecuteBatch(service, requests)
+        cache    = OpenEventCache()
+
+        try:
+            for name, start in plan.items():
+
+                if not start:
+                    print(f"⚠️ [WARNING] No free evening for {name} within {CATCHUP_JITTER} days of their due date.")
+                    continue
+
+                response, exception = results[name]
+
+                if exception:
+                    print(f"❌ [ERROR] Could not schedule catch-up with {name}: {exception}")
+                    continue
+
+                IndexCatchUp(cache, response)
+                print(f"✅ Catch-Up scheduled with {name} on {start.strftime('%a %b %d, %Y')} at {FormatTime(start)}.")
+
+            cache.commit()
+
+        finally:
+            cache.close()
+
+    except Exception as e:
+        print(f"❌ [ERROR] Could not schedule catch-ups: {e}")
+
+
+###############################################################################
+#
+# Procedure   : IndexCatchUp()
+#
+# Description : Folds one catch-up event into the catch-up index; a
+#             : person's row only moves forward to a later catch-up.
+#
+# Input       : cache - sqlite3 connection from OpenEventCache()
+#             : event - dict - catch-up event (AddCatchUpEvent() shape)
+#
+# Returns     : boolean - True if the event was a catch-up and was indexed
+#
+###############################################################################
+
+def IndexCatchUp(cache, event):
+
+    from dateutil.relativedelta import relativedelta
+
+    name = EventTag(event, TAG_PERSON)
+
+    if EventTag(event, TAG_TYPE) != 'catchup' or not name:
+        return False
+
+    match     = CATCHUP_PATTERN.search(event.get('description', ''))
+    frequency = int(match.group(1)) if match else CATCHUP_FREQUENCY
+    last      = EventTime(event['start']).date()
+    due       = last + relativedelta(months=frequency)
+
+    cache.execute("""
+        INSERT INTO catchups VALUES (?, ?, ?, ?)
+        ON CONFLICT (name) DO UPDATE SET last = excluded.last, frequency = excluded.frequency, due = excluded.due
+        WHERE excluded.last >= catchups.last""", (name, last.isoformat(), frequency, due.isoformat()))
+
+    # their history changed - memoized suggestions are stale
+    cache.execute("DELETE FROM catchupPlans WHERE name = ?", (name,))
+
+    return True
+
+
+###############################################################################
+#
+# Procedure   : RebuildCatchUpIndex()
+#
+# Description : Rebuilds the catch-up index from the tagged catch-up events,
+#             : or just one person's row (after ClearCatchUpEvents()).
+#             : A full rebuild finding none checks for untagged ones
+#             : (HintMigrateTags()).
+#
+# Input       : service - Google Calendar API service object
+#             : cache   - sqlite3 connection from OpenEventCache()
+#             : name    - string - only re-index this person [optional]
+#
+# Returns     : int - number of catch-up events indexed
+#
+###############################################################################
+
+def RebuildCatchUpIndex(service, cache, name=None):
+
+    tags = [f"{TAG_TYPE}=catchup"]
+
+    if name:
+        tags.append(f"{TAG_PERSON}={name}")
+
+    events = FetchEvents(
+        service,
+        fields                  = 'id,description,start,extendedProperties',
+        calendarId              = 'primary',
+        singleEvents            = False,
+        privateExtendedProperty = tags
+    )
+
+    if name:
+        cache.execute("DELETE FROM catchups WHERE name = ?", (name,))
+        cache.execute("DELETE FROM catchupPlans WHERE name = ?", (name,))
+
+    else:
+        cache.execute("DELETE FROM catchups")
+
+    indexed = sum(IndexCatchUp(cache, event) for event in events)
+
+    if not name:
+        cache.execute("INSERT OR REPLACE INTO cacheState VALUES ('catchupIndex', ?)", (str(time.time()),))
+
+    cache.commit()
+
+    if not indexed and not name:
+        HintMigrateTags(service, 'catchup')
+
+    return indexed
+
+
+###############################################################################
+#
+# Procedure   : LoadCatchUpIndex()
+#
+# Description : Loads the local catch-up index. Rebuilt first when it has
+#             : never been built, is older than CATCHUP_INDEX_TTL, or
+#             : --no-cache was given.
+#
+# Input       : -none-
+#
+# Returns     : dict - key = name, value = (last date, frequency, due date)
+#
+###############################################################################
+
+@Timed()
+def LoadCatchUpIndex():
+
+    cache = OpenEventCache()
+
+    try:
+        row = cache.execute("SELECT value FROM cacheState WHERE key = 'catchupIndex'").fetchone()
+
+        if not USE_CACHE or not row or time.time() - float(row[0]) > CATCHUP_INDEX_TTL:
+            RebuildCatchUpIndex(GetCalendarService(), cache)
+
+        return {name: (datetime.fromisoformat(last).date(), frequency, datetime.fromisoformat(due).date())
+                for name, last, frequency, due in cache.execute("SELECT name, last, frequency, due FROM catchups ORDER BY due")}
+
+    finally:
+        cache.close()
+
+
+###############################################################################
+#
+# Procedure   : CachedCatchUpPlans()
+#
+# Description : Memoized --seed suggestions that still hold: same seed,
+#             : same due date (the person's history has not changed),
+#             : slot still ahead and planned within CATCHUP_INDEX_TTL.
+#             : Slots memoized by separate runs may share an evening; the
+#             : lower priority one is dropped and planned again.
+#
+# Input       : targets - list - output of CatchUpTargets()
+#             : seed    - int  - --seed value
+#
+# Returns     : dict - key = name, value = aware local start or None
+#
+###############################################################################
+
+def CachedCatchUpPlans(targets, seed):
+
+    cache = OpenEventCache()
+    plans = {}
+    days  = set()
+    now   = time.time()
+
+    try:
+        for name, last, frequency, due, target, earliest, latest in targets:
+
+            row = cache.execute("SELECT slot FROM catchupPlans WHERE name = ? AND seed = ? AND due = ? AND planned > ?",
+                                (name, seed, due.isoformat(), now - CATCHUP_INDEX_TTL)).fetchone()
+
+            if not row:
+                continue
+
+            slot = datetime.fromisoformat(row[0]) if row[0] else None
+
+            if slot is None:
+                plans[name] = slot
+
+            elif slot.timestamp() > now and slot.date() not in days:
+                plans[name] = slot
+                days.add(slot.date())
+
+    finally:
+        cache.close()
+
+    return plans
+
+
+###############################################################################
+#
+# Procedure   : StoreCatchUpPlans()
+#
+# Description : Memoizes --seed suggestions for CachedCatchUpPlans().
+#
+# Input       : targets - list - output of CatchUpTargets()
+#             : plan    - dict - output of PlanCatchUps()
+#             : seed    - int  - --seed value
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def StoreCatchUpPlans(targets, plan, seed):
+
+    cache = OpenEventCache()
+
+    try:
+        cache.executemany("INSERT OR REPLACE INTO catchupPlans VALUES (?, ?, ?, ?, ?)",
+                          [(name, seed, due.isoformat(), plan[name].isoformat() if plan[name] else None, time.time())
+                           for name, last, frequency, due, target, earliest, latest in targets if name in plan])
+        cache.commit()
+
+    finally:
+        cache.close()
+
+
+###############################################################################
+#
+# Procedure   : SuggestCatchUps()
+#
+# Description : Suggests the next catch-up with each person, most overdue
+#             : first, answered from the catch-up index.
+#             : - Each suggestion is a free evening near the due date
+#             :   (PlanCatchUps()), and no two share an evening.
+#             : - If none, suggest a catch-up CATCHUP_FIRST months from today.
+#             : - With --seed the answer is deterministic and memoized, so
+#             :   asking again costs no API call until that person's
+#             :   catch-up history changes.
+#
+# Input       : names - list - names to filter by [optional]
+#             : seed  - int  - --seed value [optional]
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def SuggestCatchUps(names=None, seed=None):
+
+    try:
+        index   = LoadCatchUpIndex()
+        today   = datetime.now().date()
+        targets = CatchUpTargets(names or list(index), index, seed)
+        plan    = CachedCatchUpPlans(targets, seed) if seed is not None else {}
+        fresh   = [(name, target, earliest, latest) for name, last, frequency, due, target, earliest, latest in targets if name not in plan]
+
+        if fresh:
+            planned = PlanCatchUps(GetCalendarService(), fresh, [slot.date() for slot in plan.values() if slot])
+            plan.update(planned)
+
+            if seed is not None:
+                StoreCatchUpPlans(targets, planned, seed)
+
+        print("📬 Suggested Catch-Ups:\n")
+
+        for name, last, frequency, due, target, earliest, latest in targets:
+
+            slot = plan[name]
+            when = f"{slot.strftime('%a %b %d, %Y')} @ {FormatTime(slot)}" if slot else f"no free evening within {CATCHUP_JITTER} days of {due.strftime('%b %d, %Y')}"
+
+            if last is None:
+                print(f"❓ No past catch-up found for {name}.")
+                print(f"👤 {name} — Suggested default catch-up: {when}\n")
+                continue
+
+            overdue = (today - due).days
+            status  = f"⏰ {overdue} days overdue" if overdue > 0 else f"due in {-overdue} days"
+
+            print(f"🔍 Latest catch-up with {name} on {last.strftime('%b %d, %Y')} (every {frequency} months, {status})")
+            print(f"👤 {name} — Next suggested catch-up: {when}\n")
+
+    except Exception as e:
+        print(f"❌ [ERROR] Failed to generate suggestions: {e}")
+
+
+###############################################################################
+#
+# Procedure   : ListCatchUps()
+#
+# Description : Lists upcoming catch-up events.
+#
+# Input       : events - list - prefetched 'catchups' window [optional]
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def ListCatchUps(events=None):
+
+    try:
+        if events is None:
+            events = LoadEvents(GetCalendarService(), **ViewWindows()['catchups'])
+
+
+        if not events:
+            print("📭 No upcoming catch-up events.")
+            return
+
+        print("📅 Upcoming Catch-Up Events:\n")
+
+        for event in events:
+
+            name = event.person or event.summary.replace("🤖 Catch-Up: ", "")
+
+            print(f"👤 {name} — {event.start.strftime('%b %d, %Y @ %I:%M %p')}")
+
+    except Exception as e:
+        print(f"❌ [ERROR] Failed to list catch-ups: {e}")
+
+
+###############################################################################
+#
+# Procedure   : ClearCatchUpEvents()
+#
+# Description : Deletes all future catch-up events for a given name
+#
+# Input       : name (str)
+#
+# Returns     : None
+#
+###############################################################################
+
+def ClearCatchUpEvents(name):
+
+    service = GetCalendarService()
+
+    now = datetime.now(timezone.utc).isoformat()
+
+    try:
+        events = list(FetchEvents(
+            service,
+            fields                  = 'id',
+            calendarId              = 'primary',
+            timeMin                 = now,
+            singleEvents            = True,
+            privateExtendedProperty = [f"{TAG_TYPE}=catchup", f"{TAG_PERSON}={name}"]
+        ))
+
+        if not events:
+            print(f"📭 No upcoming catch-up events found for {name}.")
+            return
+
+        deleted = DeleteEvents(service, [event['id'] for event in events])
+
+        # the latest catch-up may be gone - re-read just this person
+        cache = OpenEventCache()
+
+        try:
+            RebuildCatchUpIndex(service, cache, name)
+
+        finally:
+            cache.close()
+
+        if deleted == len(events):
+            print(f"🗑️ Cleared all catch-up events for {name}.")
+
+        else:
+            print(f"⚠️ [WARNING] Cleared {deleted} of {len(events)} catch-up events for {name}.")
+
+    except Exception as e:
+        print(f"❌ [ERROR] Failed to clear catch-ups: {e}")
 
 
 ###############################################################################
 #
-# Procedure   : GetGoogleCredentials()
+# Procedure   : BackupCodec()
 #
-# Description : Google OAuth2 authentication.
-#             : Returns valid credential object for using Google Calendar API.
-#             : Uses 'token.pickle' for token caching and refresh logic.
+# Description : Compression for a backup file, chosen by its extension.
+#             : Every page is written as its own complete gzip member /
+#             : zstd frame, so a file cut after any page is still valid
+#             : and an interrupted export can simply be appended to.
 #
-# Input       : -none-
+# Input       : path - string - backup file name
 #
-# Returns     : credentials - Google object to access Calendar API.
+# Returns     : function - bytes -> bytes
 #
 ###############################################################################
 
-def GetGoogleCredentials():
+def BackupCodec(path):
 
-    credentials = None
+    if path.endswith('.gz'):
+        import gzip
+        return gzip.compress
 
-    if os.path.exists("token.pickle"):
-        with open("token.pickle", "rb") as token:
-            credentials = pickle.load(token)
+    if path.endswith('.zst'):
+        try:
+            import zstandard
 
-    if not credentials or not credentials.valid:
-        if credentials and credentials.expired and credentials.refresh_token:
-            credentials.refresh(Request())
+        except ImportError:
+            raise RuntimeError(".zst backups need the zstandard package (pip install zstandard)")
 
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
-            credentials = flow.run_local_server(port=0)
+        return zstandard.ZstdCompressor().compress
 
-        with open("token.pickle", "wb") as token:
-            pickle.dump(credentials, token)
+    return lambda data: data
+
+
+###############################################################################
+#
+# Procedure   : ExcludeDates()
+#
+# Description : A recurring master with its cancelled occurrences folded
+#             : in as EXDATE lines, so a backup restores the series as it
+#             : was without the store's cancelled-instance stubs.
+#
+# Input       : master    - dict - recurring master event
+#             : originals - list - 'originalStartTime' of cancelled instances
+#
+# Returns     : dict - master (a copy when anything was added)
+#
+###############################################################################
+
+def ExcludeDates(master, originals):
+
+    if not originals:
+        return master
 
-    return credentials
+    lines = [f"EXDATE;VALUE=DATE:{original['date'].replace('-', '')}" if 'date' in original else
+             f"EXDATE:{datetime.fromtimestamp(EventEpoch(original), timezone.utc).strftime('%Y%m%dT%H%M%SZ')}"
+             for original in originals]
+
+    return dict(master, recurrence=master['recurrence'] + lines)
 
 
 ###############################################################################
 #
-# Procedure   : AddNoteToEvent()
+# Procedure   : CachedExportPages()
 #
-# Description : Updates description field of existing Google Calendar event.
+# Description : Pages of a calendar's events read from the local store,
+#             : in rowid order so a page can be resumed after.
+#             : Cancelled instances go out as EXDATEs on their master
+#             : (ExcludeDates()), not as rows of their own.
 #
-# Input       : eventId - Unique ID of calendar event.
-#             : note    - Text string to update. 
+# Input       : cache      - sqlite3 connection from OpenEventCache()
+#             : calendarId - string - calendar to export
+#             : after      - int    - rowid to resume after [optional]
 #
-# Returns     : True  - Event was successfully updated.
-#             : False - Error occurs. 
+# Returns     : generator - (list of events, resume token or None when done)
 #
 ###############################################################################
 
-def AddNoteToEvent(eventId, note):
+def CachedExportPages(cache, calendarId, after=None):
 
-    try:
+    after = after or 0
 
-        credentials = GetGoogleCredentials() 
-        service     = build("calendar", "v3", credentials=credentials)
+    while True:
 
-        event = service.events().get(calendarId="primary", eventId=eventId).execute()
-        event["description"] = note
-        service.events().update(calendarId="primary", eventId=eventId, body=event).execute()
+        rows = cache.execute("SELECT rowid, body FROM events WHERE calendarId = ? AND rowid > ? ORDER BY rowid LIMIT ?",
+                             (calendarId, after, PAGE_SIZE)).fetchall()
 
-        return True
+        if not rows:
+            return
 
-    except Exception as e:
+        after  = rows[-1][0]
+        events = [json.loads(body) for _, body in rows]
+        series = [event['id'] for event in events if event.get('recurrence')]
+        folded = {}
 
-        print(f"❌ [EXCEPTION] {e}")
-        return False
+        for seriesId, original in cache.execute(
+                "SELECT recurringEventId, json_extract(body, '$.originalStartTime') FROM events"
+                " WHERE calendarId = ? AND recurringEventId IN (SELECT value FROM json_each(?))"
+                " AND json_extract(body, '$.status') = 'cancelled'", (calendarId, json.dumps(series))):
+            folded.setdefault(seriesId, []).append(json.loads(original))
+
+        events = [ExcludeDates(event, folded.get(event['id'])) if event.get('recurrence') else event
+                  for event in events if event.get('status') != 'cancelled']
+
+        yield events, (after if len(rows) == PAGE_SIZE else None)
+
+        if len(rows) < PAGE_SIZE:
+            return
 
 
 ###############################################################################
 #
-# Procedure   : SaveBirthday()
+# Procedure   : RemoteExportPages()
 #
-# Description : Saves a birthday to Google Calendar as a 6 AM reminder.
+# Description : Pages of a calendar's events straight from the API
+#             : (recurring masters and exceptions, not expanded).
+#             : Cancelled instances are left out: unlike the store, a
+#             : page need not hold their master, so they cannot be
+#             : folded into it (a synced export keeps them as EXDATEs).
 #
-# Input       : name  - str : name of person
-#             : month - int : month (1–12)
-#             : day   - int : day (1–31)
+# Input       : service    - Google Calendar API service object
+#             : calendarId - string - calendar to export
+#             : pageToken  - string - API page token to resume at [optional]
+#
+# Returns     : generator - (list of events, resume token or None when done)
+#
+###############################################################################
+
+def RemoteExportPages(service, calendarId, pageToken=None):
+
+    params = {'calendarId': calendarId, 'singleEvents': False}
+
+    if pageToken:
+        params['pageToken'] = pageToken
+
+    for page in FetchEventPages(service, **params):
+        yield [event for event in page.get('items', []) if event.get('status') != 'cancelled'], page.get('nextPageToken')
+
+
+###############################################################################
+#
+# Procedure   : ExportEvents()
+#
+# Description : --export: streams every event of every calendar in
+#             : CALENDARS to an NDJSON backup, one page at a time.
+#             : - Memory use is one page, whatever the calendar size.
+#             : - Read from the local store when it holds the calendar
+#             :   (after a sync), otherwise from the API.
+#             : - After each page the file offset and resume token are
+#             :   saved to '<path>.checkpoint'; a later --export to the
+#             :   same path carries on from there. Removed when complete.
+#
+# Input       : path - string - backup file (.gz / .zst to compress)
 #
 # Returns     : -none-
 #
 ###############################################################################
 
-def SaveBirthday(name, month, day):
+def ExportEvents(path=EXPORT_FILE):
 
-    service = GetCalendarService()
+    checkpointFile = path + '.checkpoint'
+    checkpoint     = {'done': [], 'calendarId': None, 'source': None, 'token': None, 'offset': 0, 'events': 0}
 
-    now       = datetime.now()
-    eventDate = datetime(now.year, month, day, 6, 0, 0)
+    try:
+        compress = BackupCodec(path)
 
-    event = {
-        'summary': f"🎂 {name}'s Birthday",
-        'start': {
-            'dateTime': eventDate.isoformat(),
-            'timeZone': 'America/New_York'
-        },
-        'end': {
-            'dateTime': (eventDate + timedelta(hours=0)).isoformat(),
-            'timeZone': 'America/New_York'
-        },
-        'recurrence': [
-            'RRULE:FREQ=YEARLY'
-        ],
-        'reminders': {
-            'useDefault': False,
-            'overrides': [
-                {'method': 'popup', 'minutes': 0}
-            ]
-        },
-        'colorId': '7'
-    }
+    except RuntimeError as e:
+        print(f"❌ [ERROR] {e}")
+        return
+
+    cache = None
 
     try:
-        event = service.events().insert(calendarId='primary', body=event).execute()
-        print(f"✅ [INFO] Birthday reminder created for {name} on {eventDate.strftime('%Y-%m-%d')}")
+        service = GetCalendarService()
+
+        if os.path.exists(checkpointFile) and os.path.exists(path):
+
+            with open(checkpointFile) as handle:
+                checkpoint = json.load(handle)
+
+            print(f"⏯️  [INFO] Resuming export to {path} after {checkpoint['events']} events.")
+
+        cached = set()
+
+        if USE_CACHE:
+
+            if SYNC_ON_READ:
+                SyncCalendars(service)
+
+            cache  = OpenEventCache()
+            cached = {calendarId for (calendarId,) in cache.execute("SELECT calendarId FROM syncState")}
+
+        began = time.perf_counter()
+
+        with open(path, 'r+b' if checkpoint['offset'] else 'wb') as handle:
+
+            # drop anything written after the last checkpoint
+            handle.truncate(checkpoint['offset'])
+            handle.seek(checkpoint['offset'])
+
+            for calendarId in CALENDARS:
+
+                if calendarId in checkpoint['done']:
+                    continue
+
+                if checkpoint['calendarId'] != calendarId:
+                    checkpoint.update(calendarId=calendarId, token=None,
+                                      source='cache' if calendarId in cached else 'api')
+
+                if checkpoint['source'] == 'cache':
+                    pages = CachedExportPages(cache, calendarId, checkpoint['token'])
+
+                else:
+                    pages = RemoteExportPages(service, calendarId, checkpoint['token'])
+
+                for events, token in pages:
+
+                    lines = ''.join(json.dumps({'calendarId': calendarId, 'event': event}) + '\n' for event in events)
+
+                    handle.write(compress(lines.encode()))
+                    handle.flush()
+
+                    checkpoint.update(token=token, offset=handle.tell(), events=checkpoint['events'] + len(events))
+
+                    if token is None:
+                        checkpoint['done'].append(calendarId)
+
+                    SaveCheckpoint(checkpointFile, checkpoint)
+
+                if calendarId not in checkpoint['done']:
+                    checkpoint['done'].append(calendarId)
+                    SaveCheckpoint(checkpointFile, checkpoint)
+
+        os.remove(checkpointFile)
+
+        elapsed = time.perf_counter() - began
+
+        print(f"💾 [INFO] Exported {checkpoint['events']} events ({checkpoint['offset'] / 1e6:.1f} MB) "
+              f"to {path} in {elapsed:.1f}s.")
 
     except Exception as e:
-        print(f"❌ [ERROR] Failed to create birthday reminder for {name}: {e}")
+        print(f"❌ [ERROR] Export failed, run --export again to resume: {e}")
+
+    finally:
+        if cache:
+            cache.close()
 
 
 ###############################################################################
-#           
-# Procedure   : RemoveBirthday()
-#   
-# Description : Remove a birthday event from Google Calendar.
 #
-# Input       : name - Name of person
+# Procedure   : SaveCheckpoint()
+#
+# Description : Atomically replaces a JSON checkpoint file.
+#
+# Input       : path  - string - checkpoint file
+#             : state - dict   - checkpoint contents
 #
 # Returns     : -none-
 #
 ###############################################################################
 
-def RemoveBirthday(name):
+def SaveCheckpoint(path, state):
 
-    service = GetCalendarService()
+    with open(path + '.tmp', 'w') as handle:
+        json.dump(state, handle)
 
-    targetSummary = f"🎂 {name}'s Birthday"
+    os.replace(path + '.tmp', path)
 
-    try:
 
-        now = datetime.utcnow().isoformat() + 'Z'
+###############################################################################
+#
+# Procedure   : ReadBackup()
+#
+# Description : Streams the events of a --export backup (plain, .gz or
+#             : .zst), one line at a time. Plain NDJSON of bare API
+#             : events is accepted too.
+#
+# Input       : path - string - backup file
+#
+# Returns     : generator - (calendarId or None, event dict)
+#
+###############################################################################
+
+def ReadBackup(path):
 
-        eventsResult = service.events().list(
-            calendarId   = 'primary',
-            timeMin      = now,
-            maxResults   = 250,
-            singleEvents = False
-        ).execute()
+    if path.endswith('.gz'):
+        import gzip
+        handle = gzip.open(path, 'rt', encoding='utf-8')
 
-        events = eventsResult.get('items', [])
+    elif path.endswith('.zst'):
+        try:
+            import zstandard
 
-        found = False
+        except ImportError:
+            raise RuntimeError(".zst backups need the zstandard package (pip install zstandard)")
 
-        for event in events:
-            if event.get('summary') == targetSummary and 'RRULE:FREQ=YEARLY' in str(event.get('recurrence', '')):
-                service.events().delete(calendarId='primary', eventId=event['id']).execute()
-                print(f"🗑️  [INFO] Birthday removed: {name}")
-                found = True
-                break
+        raw    = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), read_across_frames=True, closefd=True)
+        handle = io.TextIOWrapper(raw, encoding='utf-8')
 
-        if not found:
-            print(f"❌ [INFO] Birthday for {name} not found.")
+    else:
+        handle = open(path, encoding='utf-8')
 
-    except Exception as e:
-        print(f"❌ [ERROR] Failed to remove birthday: {e}")
+    with handle:
+        for line in handle:
+
+            if not line.strip():
+                continue
+
+            record = json.loads(line)
+
+            if 'event' in record:
+                yield record.get('calendarId'), record['event']
+
+            else:
+                yield None, record
 
 
 ###############################################################################
 #
-# Procedure   : ShowBirthdaysThisMonth()
+# Procedure   : ImportKey()
 #
-# Description : Displays birthdays occurring in the current month.
+# Description : Identity of an event for --import dedupe: its iCalUID,
+#             : plus the original start for an exception of a series
+#             : (exceptions share the iCalUID of their master).
 #
-# Input       : -none-
+# Input       : event - dict - API event
 #
-# Returns     : -none-
+# Returns     : string - dedupe key
 #
 ###############################################################################
 
-def ShowBirthdaysThisMonth():
+def ImportKey(event):
 
-    service = GetCalendarService()
+    if event.get('recurringEventId') and 'originalStartTime' in event:
+        return f"{event['iCalUID']}@{round(EventEpoch(event['originalStartTime']))}"
 
-    now        = datetime.now()
-    monthStart = datetime(now.year, now.month, 1).isoformat() + 'Z'
-    nextMonth  = (now.replace(day=28) + timedelta(days=4)).replace(day=1)
-    monthEnd   = datetime(nextMonth.year, nextMonth.month, 1).isoformat() + 'Z'
+    return event['iCalUID']
 
-    try:
-        eventsResult = service.events().list(
-            calendarId   = 'primary',
-            timeMin      = monthStart,
-            timeMax      = monthEnd,
-            singleEvents = True,
-            maxResults   = 100,
-            orderBy      = 'startTime'
-        ).execute()
 
-        events = eventsResult.get('items', [])
+###############################################################################
+#
+# Procedure   : ExistingImportKeys()
+#
+# Description : What a calendar already holds, for --import dedupe.
+#             : Read from the local store when it holds the calendar,
+#             : otherwise listed from the API (ids and iCalUIDs only).
+#
+# Input       : service    - Google Calendar API service object
+#             : calendarId - string - target calendar
+#
+# Returns     : tuple - (set of ImportKey()s, {iCalUID: id} of recurring masters)
+#
+###############################################################################
 
-        birthdays = [
-            event for event in events
-            if event.get('summary', '').startswith("🎂 ")
-        ]
+def ExistingImportKeys(service, calendarId):
 
-        if not birthdays:
-            print("😴 No birthdays this month.")
-            return
+    events = None
 
-        print("🎉 Birthdays This Month:\n")
+    if USE_CACHE:
 
-        for event in birthdays:
-            summary = event.get('summary', '')
-            dateStr = event['start'].get('dateTime', event['start'].get('date'))
-            dateFormatted = datetime.fromisoformat(dateStr).strftime('%b %d')
-            print(f"🎂 {summary[2:]} - {dateFormatted}")
+        cache = OpenEventCache()
 
-    except Exception as e:
-        print(f"❌ [ERROR] Could not retrieve birthdays: {e}")
+        try:
+            if cache.execute("SELECT 1 FROM syncState WHERE calendarId = ?", (calendarId,)).fetchone():
+                events = [json.loads(body) for (body,) in cache.execute("SELECT body FROM events WHERE calendarId = ?", (calendarId,))]
+
+        finally:
+            cache.close()
+
+    if events is None:
+        events = FetchEvents(service, fields='id,iCalUID,recurrence,recurringEventId,originalStartTime',
+                             calendarId=calendarId, singleEvents=False)
+
+    keys    = set()
+    masters = {}
+
+    for event in events:
+
+        if not event.get('iCalUID'):
+            continue
+
+        keys.add(ImportKey(event))
+
+        if event.get('recurrence'):
+            masters[event['iCalUID']] = event['id']
+
+    return keys, masters
 
 
 ###############################################################################
 #
-# Procedure   : ShowTodaysBirthdays()
+# Procedure   : ImportBody()
 #
-# Description : Displays only birthdays occurring today.
+# Description : Turns a backed-up event into an events().import_() body.
+#             : - Server-assigned fields are dropped.
+#             : - Events without an iCalUID get a stable one from their
+#             :   old id, so a re-run still recognises them.
+#             : - Exceptions are pointed at their master's new id.
 #
-# Input       : -none-
+# Input       : event   - dict - backed-up event
+#             : masters - dict - {iCalUID: id} of masters in the target calendar
+#
+# Returns     : dict - import body
+#             : None - exception whose master is not in the target calendar
+#
+###############################################################################
+
+def ImportBody(event, masters):
+
+    body = {key: value for key, value in event.items()
+            if key not in ('id', 'htmlLink', 'etag', 'created', 'updated', 'creator', 'recurringEventId')}
+
+    body.setdefault('iCalUID', f"{event['id']}@calboss")
+
+    if event.get('recurringEventId'):
+
+        if body['iCalUID'] not in masters:
+            return None
+
+        body['recurringEventId'] = masters[body['iCalUID']]
+
+    return body
+
+
+###############################################################################
+#
+# Procedure   : ImportEvents()
+#
+# Description : --import: restores a --export backup.
+#             : - Streams the file twice: single events and recurring
+#             :   masters first, then the exceptions of those series.
+#             : - Idempotent: events whose iCalUID (and original start,
+#             :   for exceptions) the target calendar already has are
+#             :   skipped, so an interrupted import can simply be re-run.
+#             : - Inserts go through events().import_() in batches of
+#             :   BATCH_SIZE, IMPORT_WORKERS batches in flight at once;
+#             :   ExecuteBatch() retries the rate-limited ones.
+#             : - Events return to their own calendar when it is listed
+#             :   in CALENDARS, otherwise they go to the first one.
+#
+# Input       : path - string - backup file
 #
 # Returns     : -none-
 #
 ###############################################################################
 
-def ShowTodaysBirthdays():
+def ImportEvents(path):
 
-    service = GetCalendarService()
+    if not os.path.exists(path):
+        print(f"❌ [ERROR] Backup file not found: {path}")
+        return
 
-    now        = datetime.now()
-    todayStart = datetime(now.year, now.month, now.day, 0, 0, 0).isoformat() + 'Z'
-    todayEnd   = datetime(now.year, now.month, now.day, 23, 59, 59).isoformat() + 'Z'
+    service = GetCalendarService()
+    stats   = {'imported': 0, 'skipped': 0, 'failed': 0}
+    errors  = []
 
     try:
-        eventsResult = service.events().list(
-            calendarId   = 'primary',
-            timeMin      = todayStart,
-            timeMax      = todayEnd,
-            singleEvents = True,
-            maxResults   = 20,
-            orderBy      ='startTime'
-        ).execute()
+        if USE_CACHE and SYNC_ON_READ:
+            SyncCalendars(service)
+
+        known = {calendarId: ExistingImportKeys(service, calendarId) for calendarId in CALENDARS}
+        began = time.perf_counter()
+
+        def Progress(end=''):
+            rate = stats['imported'] / max(time.perf_counter() - began, 1e-9)
+            print(f"\r⬆️  {stats['imported']} imported, {stats['skipped']} skipped, {stats['failed']} failed "
+                  f"({rate:.0f} events/s)", end=end, flush=True)
+
+        def Flush(pending):
+
+            batches = []
+
+            for calendarId in dict.fromkeys(target for target, _ in pending):
+                bodies = [body for target, body in pending if target == calendarId]
+                batches.extend((calendarId, bodies[offset:offset + BATCH_SIZE]) for offset in range(0, len(bodies), BATCH_SIZE))
+
+            def Send(calendarId, bodies):
+                requests = [(str(index), service.events().import_(calendarId=calendarId, body=body))
+                            for index, body in enumerate(bodies)]
+                return ExecuteBatch(service, requests, ThreadHttp())
+
+            outcomes = RunThreaded([lambda calendarId=calendarId, bodies=bodies: Send(calendarId, bodies)
+                                    for calendarId, bodies in batches])
+
+            for (calendarId, bodies), results in zip(batches, outcomes):
+                for index, body in enumerate(bodies):
+
+                    response, exception = results[str(index)]
+
+                    if exception is not None:
+                        stats['failed'] += 1
+                        errors.append(f"{body.get('summary', '(No Title)')}: {exception}")
+                        continue
+
+                    stats['imported'] += 1
+
+                    if body.get('recurrence'):
+                        known[calendarId][1][body['iCalUID']] = response['id']
+
+            Progress()
+
+        for exceptions in (False, True):
+
+            pending = []
+
+            for calendarId, event in ReadBackup(path):
+
+                if bool(event.get('recurringEventId')) != exceptions:
+                    continue
+
+                target        = calendarId if calendarId in CALENDARS else CALENDARS[0]
+                keys, masters = known[target]
+                body          = ImportBody(event, masters)
+
+                if body is None:
+                    stats['failed'] += 1
+                    errors.append(f"{event.get('summary', '(No Title)')}: series not found")
+                    continue
+
+                key = ImportKey(body)
+
+                if key in keys:
+                    stats['skipped'] += 1
+                    continue
+
+                keys.add(key)
+                pending.append((target, body))
+
+                if len(pending) >= BATCH_SIZE * IMPORT_WORKERS:
+                    Flush(pending)
+                    pending = []
+
+            if pending:
+                Flush(pending)
+
+        Progress(end='\n')
 
-        events = eventsResult.get('items', [])
+        for error in errors[:10]:
+            print(f"❌ [ERROR] {error}")
 
-        birthdaysToday = [
-            event.get('summary', '')[2:]
-            for event in events
-            if event.get('summary', '').startswith("🎂 ")
-        ]
+        if len(errors) > 10:
+            print(f"❌ [ERROR] ... and {len(errors) - 10} more.")
 
-        if not birthdaysToday:
-            print("😴 No birthdays today.")
-        else:
-            print("🎉 Birthdays Today:\n")
-            for bday in birthdaysToday:
-                print(f"🎂 {bday}")
+        print(f"✅ [INFO] Import finished in {time.perf_counter() - began:.1f}s.")
 
     except Exception as e:
-        print(f"❌ [ERROR] Could not retrieve today's birthdays: {e}")
+        print(f"\n❌ [ERROR] Import failed, run --import again to resume: {e}")
 
 
 ###############################################################################
 #
-# Procedure   : ShowBirthdaysThisWeek()
+# Procedure   : UntaggedEvents()
 #
-# Description : Shows birthdays occurring in the next 7 days.
+# Description : Birthdays and catch-ups created before events were tagged,
+#             : recognised the old way (summary prefix).
 #
-# Input       : -none-
+# Input       : service - Google Calendar API service object
+#             : kinds   - list - 'birthday' and/or 'catchup' [optional]
 #
-# Returns     : -none-
+# Returns     : generator - (event id, tags to stamp on it)
 #
 ###############################################################################
 
-def ShowBirthdaysThisWeek():
-
-    service = GetCalendarService()
+def UntaggedEvents(service, kinds=('birthday', 'catchup')):
 
-    now      = datetime.now()
-    nextWeek = now + timedelta(days=7)
+    queries = {'birthday': "🎂", 'catchup': "🤖 Catch-Up:"}
 
-    timeMin = now.isoformat() + 'Z'
-    timeMax = nextWeek.isoformat() + 'Z'
+    for kind in kinds:
 
-    try:
-        eventsResult = service.events().list(
+        legacy = FetchEvents(
+            service,
+            fields       = 'id,summary,recurrence,extendedProperties',
             calendarId   = 'primary',
-            timeMin      = timeMin,
-            timeMax      = timeMax,
-            singleEvents = True,
-            orderBy      = 'startTime'
-        ).execute()
+            singleEvents = False,
+            q            = queries[kind]
+        )
 
-        events = eventsResult.get('items', [])
-        birthdayEvents = [event for event in events if event.get('summary', '').startswith("🎂")]
+        for event in legacy:
 
-        if not birthdayEvents:
-            print("🎉 No birthdays in the next 7 days.")
-            return
+            summary = event.get('summary', '').strip()
 
-        print("🎉 Birthdays This Week:\n")
-        for event in birthdayEvents:
-            start = event['start'].get('dateTime', event['start'].get('date'))
-            dateObj = datetime.fromisoformat(start)
-            name = event['summary'].replace("🎂 ", "").replace("'s Birthday", "")
-            print(f"🎂 {name}'s Birthday - {dateObj.strftime('%b %d')}")
+            if EventTag(event, TAG_TYPE):
+                continue
 
-    except Exception as e:
-        print(f"❌ [ERROR] Failed to fetch weekly birthdays: {e}")
+            if kind == 'birthday' and summary.startswith("🎂") and 'RRULE:FREQ=YEARLY' in str(event.get('recurrence', '')):
+                yield event['id'], CalBossTags('birthday', summary.replace("🎂 ", "").replace("'s Birthday", "").strip())
+
+            elif kind == 'catchup' and summary.startswith("🤖 Catch-Up:"):
+                yield event['id'], CalBossTags('catchup', summary.replace("🤖 Catch-Up:", "").strip())
 
 
 ###############################################################################
 #
-# Procedure   : ShowAllBirthdays()
+# Procedure   : HintMigrateTags()
 #
-# Description : Displays all birthdays on the calendar, grouped by month.
+# Description : Called when an index rebuild found no tagged events: if
+#             : untagged ones from an older CalBoss exist, they are missing
+#             : from the index, so point the user at --migrate-tags.
 #
-# Input       : -none-
+# Input       : service - Google Calendar API service object
+#             : kind    - string - 'birthday' or 'catchup'
 #
 # Returns     : -none-
 #
 ###############################################################################
 
-def ShowAllBirthdays():
-
-    service = GetCalendarService()                          
+def HintMigrateTags(service, kind):
 
-    now    = datetime.now()
-    future = now.replace(year=now.year + 1)
+    label = {'birthday': "birthdays", 'catchup': "catch-ups"}[kind]
 
-    timeMin = now.isoformat() + 'Z'
-    timeMax = future.isoformat() + 'Z'
+    if next(UntaggedEvents(service, [kind]), None):
+        print(f"🏷️  [INFO] Found {label} from an older CalBoss that are not tagged yet - run CalBoss --migrate-tags once to include them.")
 
-    monthEmojis = {
-        "January":   "❄️",
-        "February":  "💘",
-        "March":     "☘️",
-        "April":     "🌧️",
-        "May":       "🌸",
-        "June":      "🌈",
-        "July":      "🎆",
-        "August":    "🏖️",
-        "September": "🍂",
-        "October":   "🎃",
-        "November":  "🦃",
-        "December":  "🎄",
-    }
 
-    try:
-        eventsResult     = service.events().list(
-            calendarId   = 'primary',
-            timeMin      = timeMin,
-            timeMax      = timeMax,
-            singleEvents = True,
-            orderBy      = 'startTime'
-        ).execute()
+###############################################################################
+#
+# Procedure   : MigrateTags()
+#
+# Description : --migrate-tags: one-shot back-fill of CalBoss tags on
+#             : birthdays and catch-ups created before events were tagged.
+#             : Events are found with UntaggedEvents() and patched in
+#             : batches.
+#
+# Input       : -none-
+#
+# Returns     : -none-
+#
+###############################################################################
 
-        events = eventsResult.get('items', [])
-        birthdayEvents = [event for event in events if event.get('summary', '').startswith("🎂")]
+def MigrateTags():
 
-        if not birthdayEvents:
-            print("🎉 No birthdays found.")
-            return
+    service = GetCalendarService()
 
-        monthBuckets = {}
+    try:
+        patches = [(eventId, service.events().patch(calendarId='primary', eventId=eventId,
+                                                    body={'extendedProperties': tags}))
+                   for eventId, tags in UntaggedEvents(service)]
 
-        for event in birthdayEvents:
+        patches = list(dict(patches).items())
 
-            start     = event['start'].get('dateTime', event['start'].get('date'))
-            dateObj   = datetime.fromisoformat(start)
-            monthName = dateObj.strftime('%B')
-            name      = event['summary'].replace("🎂 ", "").replace("'s Birthday", "").strip()
+        if not patches:
+            print("✅ [INFO] Nothing to migrate, all events are tagged.")
+            return
 
-            if monthName not in monthBuckets:
-                monthBuckets[monthName] = []
+        results = ExecuteBatch(service, patches)
+        failed  = [eventId for eventId, (response, exception) in results.items() if exception]
 
-            monthBuckets[monthName].append((dateObj, name))
+        for eventId in failed:
+            print(f"❌ [ERROR] Could not tag event {eventId}: {results[eventId][1]}")
 
-        print("🎉 All Birthdays:")
+        print(f"🏷️  [INFO] Tagged {len(patches) - len(failed)} of {len(patches)} events.")
 
-        for month in sorted(monthBuckets.keys(), key=lambda m: datetime.strptime(m, "%B").month):
-            emoji = monthEmojis.get(month, "📅")
-            print(f"\n{emoji} {month}:")
+        cache = OpenEventCache()
 
-            sortedBirthdays = sorted(monthBuckets[month], key=lambda x: x[0])
+        try:
+            RebuildBirthdayIndex(service, cache)
+            RebuildCatchUpIndex(service, cache)
 
-            for dateObj, name in sortedBirthdays:
-                print(f"🎂 {name}'s Birthday - {dateObj.strftime('%b %d')}")
+        finally:
+            cache.close()
 
     except Exception as e:
-        print(f"❌ [ERROR] Failed to fetch all birthdays: {e}")
+        print(f"❌ [ERROR] Failed to migrate tags: {e}")
 
 
 ###############################################################################
 #
-# Procedure   : ShowWeekSchedule()
+# Procedure   : IsDaemonCommand()
 #
-# Description : Displays the week's schedule in a compact grouped format.
+# Description : True when the command line is a read-only view the daemon
+#             : can answer (--today, --week, --dashboard, --bday-show).
 #
 # Input       : args - parsed CLI arguments
 #
-# Returns     : -none-
+# Returns     : boolean
 #
 ###############################################################################
 
-def ShowWeekSchedule(args):
+def IsDaemonCommand(args):
 
-    service = GetCalendarService()
-
-    now         = datetime.now()
-    startOfWeek = now
-    endOfWeek   = now + timedelta(days=7)
-
-    eventsResult = service.events().list(
-        calendarId   = 'primary',
-        timeMin      = startOfWeek.isoformat() + 'Z',
-        timeMax      = endOfWeek.isoformat() + 'Z',
-        singleEvents = True,
-        orderBy      = 'startTime'
-    ).execute()
-
-    events = eventsResult.get('items', [])
+    # 'is not False' rather than truthiness, so that --watch 0 still counts
+    active = {name for name, value in vars(args).items() if value is not None and value is not False}
 
-    if not events:
-        print("😴  No events scheduled this week.")
-        return
-
-    print(f"\n📆  Weekly Schedule Starting {now.strftime('%b %d')}\n")
+    return bool(active & DAEMON_COMMANDS) and active <= DAEMON_COMMANDS | DAEMON_OPTIONS
 
-    days = {}
 
-    for event in events:
+###############################################################################
+#
+# Procedure   : DaemonRequest()
+#
+# Description : Forwards a command line to a running CalBoss daemon.
+#             : Without argv it asks the daemon to re-sync now, so changes
+#             : made by a write command show up in its next answer.
+#
+# Input       : argv - list - command-line arguments (without program name)
+#             :               [optional]
+#
+# Returns     : string - command output
+#             : None   - no daemon is running (caller runs the command itself)
+#
+###############################################################################
 
-        start   = event['start'].get('dateTime', event['start'].get('date'))
-        dateObj = datetime.fromisoformat(start)
-        dayStr  = dateObj.strftime('%A (%b %d)')
+def DaemonRequest(argv=None):
 
-        if dateObj.date() == (now + timedelta(days=1)).date():
-            dayStr = f"Tomorrow ({dateObj.strftime('%b %d')})"
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(DAEMON_SOCKET):
+        return None
 
-        if dayStr not in days:
-            days[dayStr] = []
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
 
-        timeStr     = FormatTime(start) if 'T' in start else "All Day"
-        summary     = event.get('summary', '(No Title)')
-        location    = event.get('location', '')
-        description = event.get('description', '').strip()
-        eventId    = event.get('id', '')
+            client.settimeout(DAEMON_TIMEOUT)
+            client.connect(DAEMON_SOCKET)
+            client.sendall(json.dumps({'argv': argv} if argv is not None else {'refresh': True}).encode() + b'\n')
+            client.shutdown(socket.SHUT_WR)
 
-        if summary.startswith('🎂'):
-            summary = f"🎂 {summary[2:]}"
-        else:
-            summary = f"{summary}"
+            chunks = []
 
-        entry = f"🕘 {timeStr} - {summary}"
+            while True:
+                chunk = client.recv(65536)
 
-        if location:
-            entry += f"\n📍 {location}"
+                if not chunk:
+                    break
 
-        if description:
-            entry += f"\n📝 Note: {description}"
+                chunks.append(chunk)
 
-        if args.showids and eventId:
-            entry += f"\n🆔 Event ID: {eventId}"
-        days[dayStr].append(entry)
+    except OSError:
+        return None
 
-    for day in sorted(days.keys(), key=lambda d: datetime.strptime(d.split('(')[-1].replace(')', ''), "%b %d")):
-        print(f"📅  {day}")
-        for entry in days[day]:
-            print(entry)
-        print()
+    return b''.join(chunks).decode()
 
 
 ###############################################################################
 #
-# Procedure   : AddCatchUpEvent() 
+# Procedure   : RunDaemon()
 #
-# Description : Add a catch-up event to the calendar. 
+# Description : --daemon: long-running CalBoss server.
+#             : - Keeps one warm service object and a synced event cache.
+#             : - Re-syncs every DAEMON_REFRESH seconds in the background.
+#             : - Answers read-only commands over a Unix socket, so the
+#             :   CLI skips imports, auth and network entirely.
 #
-# Input       : name - string - person's name (i.e. John Smith) 
-#             : date - string - event date in format YYYY-MM-DD
+# Input       : -none-
 #
 # Returns     : -none-
 #
 ###############################################################################
 
-def AddCatchUpEvent(name, date):   
+def RunDaemon():
 
-    service = GetCalendarService() 
-  
-    startDatetime = datetime.strptime(date + " 20:00", "%Y-%m-%d %H:%M")
-    endDatetime   = startDatetime.replace(hour=21)
+    global SYNC_ON_READ
 
-    event = {
-        "summary": f"🤖 Catch-Up: {name}",
-        "start": {
-            "dateTime": startDatetime.isoformat(),
-            "timeZone": "America/New_York"
-        },
-        "end": {
-            "dateTime": endDatetime.isoformat(),
-            "timeZone": "America/New_York"
-        },
-        "description": "Frequency: 18 months"
-    }
+    if not hasattr(socket, 'AF_UNIX'):
+        print("❌ [ERROR] --daemon needs Unix domain sockets.")
+        return
 
-    try:
-        createdEvent = service.events().insert(calendarId='primary', body=event).execute()
-        print(f"✅ Catch-Up scheduled with {name} on {date} at 8:00 PM.")
+    service      = GetCalendarService()
+    lock         = threading.Lock()
+    SYNC_ON_READ = False
 
-    except Exception as e:
-        print(f"❌ [ERROR] Could not schedule catch-up: {e}")
+    SyncCalendars(service)
 
+    def RefreshLoop():
+        while True:
+            time.sleep(DAEMON_REFRESH)
+            with lock:
+                SyncCalendars(service)
 
-###############################################################################
-#
-# Procedure   : SuggestCatchUps()
-#
-# Description : Scan calendar for existing catch-up events.
-#             : - If person has past catch-up, suggest follow-up +/- 60 days. 
-#             : - If none, suggest a catch-up 6 months from today.
-#             : - Shows history for each person.
-#
-# Input       : names (optional list of names to filter by)
-#
-# Returns     : -none-
-#
-###############################################################################
+    threading.Thread(target=RefreshLoop, daemon=True).start()
 
-def SuggestCatchUps(names=None):
+    if os.path.exists(DAEMON_SOCKET):
+        os.remove(DAEMON_SOCKET)
 
-    service = GetCalendarService()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
 
-    now = datetime.utcnow().isoformat() + 'Z'
+    # owner-only from the moment it exists - no window for other users
+    umask = os.umask(0o077)
 
     try:
-        eventsResult = service.events().list(
-            calendarId   = 'primary',
-            timeMin      = '2000-01-01T00:00:00Z',
-            maxResults   = 2500,
-            singleEvents = True,
-            orderBy      = 'startTime',
-            q            = "🤖 Catch-Up:"
-        ).execute()
-
-        events       = eventsResult.get('items', [])
-        latestEvents = {}
-
-        for event in events:
-
-            summary = event.get('summary', '').strip()
-
-            if not summary.startswith("🤖 Catch-Up:"):
-                continue
-
-            name  = summary.replace("🤖 Catch-Up:", "").strip()
-            start = event['start'].get('dateTime', event['start'].get('date'))
+        server.bind(DAEMON_SOCKET)
 
-            try:
-                dt = datetime.fromisoformat(start)
+    finally:
+        os.umask(umask)
 
-            except:
-                continue
+    server.listen()
 
-            desc = event.get('description', '').lower()
+    print(f"🤖 [INFO] CalBoss daemon listening on {DAEMON_SOCKET} (Ctrl-C to stop).")
 
-            frequency = 18
+    try:
+        while True:
 
-            if 'frequency:' in desc:
+            conn, _ = server.accept()
 
+            with conn:
                 try:
-                    freq_str = desc.split("frequency:")[1].split("months")[0].strip()
-                    frequency = int(freq_str)
+                    request = json.loads(conn.makefile('rb').readline())
+                    output  = io.StringIO()
 
-                except:
-                    pass
+                    with lock, contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                        try:
+                            if request.get('refresh'):
+                                SyncCalendars(service)
 
-            if name not in latestEvents or dt > latestEvents[name]['date']:
-                latestEvents[name] = {'date': dt, 'frequency': frequency}
+                            else:
+                                RunCommand(ParseArgs(request['argv']))
 
-        print("📬 Suggested Catch-Ups:\n")
+                        # argparse has already written its usage and message
+                        except SystemExit:
+                            pass
 
-        if names:
+                        except Exception as e:
+                            print(f"❌ [ERROR] {e}")
 
-            for name in names:
-                if name in latestEvents:
-                    data = latestEvents[name]
-                    print(f"🔍 Found past catch-up with {name} on {data['date'].strftime('%b %d, %Y')}")
-                    salted = data['date'] + relativedelta(months=data['frequency']) + timedelta(days=random.randint(-60, 60))
-                    print(f"👤 {name} — Next suggested catch-up: {salted.strftime('%b %d, %Y')}\n")
+                    conn.sendall(output.getvalue().encode())
 
-                else:
-                    print(f"❓ No past catch-up found for {name}.")
-                    suggested = datetime.now() + relativedelta(months=6)
-                    print(f"👤 {name} — Suggested default catch-up: {suggested.strftime('%b %d, %Y')}\n")
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"⚠️ [WARNING] Bad daemon request: {e}")
 
-        else:
-            for name, data in latestEvents.items():
-                salted = data['date'] + relativedelta(months=data['frequency']) + timedelta(days=random.randint(-60, 60))
-                print(f"👤 {name} — Next suggested catch-up: {salted.strftime('%b %d, %Y')}")
+    except KeyboardInterrupt:
+        print("\n👋 [INFO] CalBoss daemon stopped.")
 
-    except Exception as e:
-        print(f"❌ [ERROR] Failed to generate suggestions: {e}")
+    finally:
+        server.close()
+        os.remove(DAEMON_SOCKET)
 
 
 ###############################################################################
 #
-# Procedure   : ListCatchUps()
+# Procedure   : WatchWebhook()
 #
-# Description : Lists upcoming catch-up events.
+# Description : Local stand-in for an events.watch() push endpoint: any
+#             : POST to 127.0.0.1:<port> (Google's change notification,
+#             : forwarded by a tunnel or proxy) wakes --watch for an
+#             : immediate sync. The initial 'sync' handshake is ignored.
 #
-# Input       : -none-
+# Input       : port - int             - local port to listen on
+#             : wake - threading.Event - set on every change notification
 #
-# Returns     : -none-
+# Returns     : object - the running http.server (serving on a thread)
 #
 ###############################################################################
 
-def ListCatchUps():
+def WatchWebhook(port, wake):
 
-    service = GetCalendarService()
-
-    now = datetime.now(timezone.utc).isoformat()
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
-    try:
-        eventsResult = service.events().list(
-            calendarId   = 'primary',
-            timeMin      = now,
-            maxResults   = 100,
-            singleEvents = True,
-            orderBy      = 'startTime',
-            q            = "🤖 Catch-Up:"
-        ).execute()
+    class Handler(BaseHTTPRequestHandler):
 
-        events = eventsResult.get('items', [])
+        def do_POST(self):
 
-        if not events:
-            print("📭 No upcoming catch-up events.")
-            return
+            self.rfile.read(int(self.headers.get('Content-Length') or 0))
 
-        print("📅 Upcoming Catch-Up Events:\n")
+            if self.headers.get('X-Goog-Resource-State') != 'sync':
+                wake.set()
 
-        for event in events:
+            self.send_response(200)
+            self.end_headers()
 
-            name  = event.get('summary', '').replace("🤖 Catch-Up: ", "")
-            start = event['start'].get('dateTime', event['start'].get('date'))
-            dt    = datetime.fromisoformat(start)
+        def log_message(self, format, *args):
+            pass
 
-            print(f"👤 {name} — {dt.strftime('%b %d, %Y @ %I:%M %p')}")
+    server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
 
-    except Exception as e:
-        print(f"❌ [ERROR] Failed to list catch-ups: {e}")
+    return server
 
 
 ###############################################################################
 #
-# Procedure   : ClearCatchUpEvents()
+# Procedure   : WatchView()
 #
-# Description : Deletes all future catch-up events for a given name
+# Description : --watch: keeps --today (default), --week or --dashboard on
+#             : screen and redraws only when what it shows changes.
+#             : - One service / connection and one parsed event set for
+#             :   the whole session.
+#             : - Every interval (or when the webhook fires) a sync-token
+#             :   delta is fetched; the event set is re-read from the
+#             :   store only if that delta was not empty, the day rolled
+#             :   over or the WATCH_MARGIN look-ahead is used up.
+#             : - The screen is redrawn only when the visible events (or
+#             :   the rendered text) differ from what is on it.
 #
-# Input       : name (str)
+# Input       : args - parsed CLI arguments
 #
-# Returns     : None
+# Returns     : -none-
 #
 ###############################################################################
 
-def ClearCatchUpEvents(name):
+def WatchView(args):
 
-    service = GetCalendarService()
+    global SYNC_ON_READ
 
-    now = datetime.now(timezone.utc).isoformat()
+    if args.dashboard:
+        names, Show = ('today', 'week', 'catchups'), lambda windows: ShowDashboard(args, windows)
 
-    try:
-        eventsResult = service.events().list(
-            calendarId   = 'primary',
-            timeMin      = now,
-            maxResults   = 2500,
-            singleEvents =  True,
-            q            = f"🤖 Catch-Up: {name}",
-            orderBy      = 'startTime'
-        ).execute()
+    elif args.week:
+        names, Show = ('week',), lambda windows: ShowWeekSchedule(args, windows['week'])
 
-        events = eventsResult.get('items', [])
+    else:
+        names, Show = ('today',), lambda windows: ShowTodaySchedule(args, windows['today'])
 
-        if not events:
-            print(f"📭 No upcoming catch-up events found for {name}.")
+    service      = GetCalendarService()
+    wake         = threading.Event()
+    SYNC_ON_READ = False
+    server       = None
+
+    if args.watch_port:
+        try:
+            server = WatchWebhook(args.watch_port, wake)
+
+        except OSError as e:
+            print(f"❌ [ERROR] Could not listen on port {args.watch_port}: {e}")
             return
 
-        for event in events:
-            service.events().delete(calendarId='primary', eventId=event['id']).execute()
+    held     = None
+    loaded   = 0
+    day      = None
+    shown    = None
+    screen   = None
+    interval = max(1, args.watch)
+
+    try:
+        while True:
 
-        print(f"🗑️ Cleared all catch-up events for {name}.")
+            changed = SyncCalendars(service) if USE_CACHE else None
+            now     = time.time()
+            current = {name: ViewWindows()[name] for name in names}
 
-    except Exception as e:
-        print(f"❌ [ERROR] Failed to clear catch-ups: {e}")
+            # re-read (and re-parse) only when something could have moved
+            if held is None or changed != 0 or day != datetime.now().date() or now - loaded > WATCH_MARGIN:
+
+                windows = {}
+
+                for name, window in current.items():
+                    windows[name] = dict(window)
+
+                    if 'timeMax' in window:
+                        windows[name]['timeMax'] = datetime.fromtimestamp(TimeBoundEpoch(window['timeMax']) + WATCH_MARGIN, timezone.utc).isoformat()
+
+                held   = FetchWindows(service, windows)
+                loaded = now
+                day    = datetime.now().date()
+
+            visible = {}
+
+            for name, window in current.items():
+                upper         = TimeBoundEpoch(window['timeMax']) if 'timeMax' in window else float('inf')
+                visible[name] = [event for event in held[name] if event.endEpoch > now and event.startEpoch < upper]
+
+            fingerprint = (day, changed != 0, tuple((event.id, event.startEpoch, event.endEpoch, event.summary, event.location, event.description)
+                                                    for name in names for event in visible[name]))
+
+            if fingerprint != shown:
+
+                output = io.StringIO()
+
+                with contextlib.redirect_stdout(output):
+                    Show(visible)
+
+                if output.getvalue() != screen:
+
+                    screen = output.getvalue()
+
+                    if sys.stdout.isatty():
+                        print("\033[2J\033[H", end='')
+
+                    print(screen, end='')
+                    print(f"\n👀 Watching — updated {datetime.now(LocalTimezone()).strftime('%I:%M:%S %p')}, checking every {interval}s"
+                          f"{f' or on push to port {args.watch_port}' if server else ''} (Ctrl-C to stop).", flush=True)
+
+                shown = fingerprint
+
+            wake.wait(interval)
+            wake.clear()
+
+    except KeyboardInterrupt:
+        print("\n👋 [INFO] Stopped watching.")
+
+    finally:
+        if server:
+            server.shutdown()
 
 
 ###############################################################################
@@ -1183,7 +5284,10 @@ def ClearCatchUpEvents(name):
 
 def Main():
 
-    args = ParseArgs()
+    global PROFILE
+
+    args    = ParseArgs()
+    PROFILE = bool(args.profile or args.trace)
 
     if args.help:
         PrintHelp()
@@ -1195,16 +5299,97 @@ def Main():
         print("📆 CalBoss Version " + VERSION)
         return
 
+    global CALENDARS
+    CALENDARS = ReadCalendarList(args.calendars)
+
+    if args.daemon:
+        RunDaemon()
+        return
+
+    #
+    # read-only views: let a running daemon answer if there is one
+    #
+
+    if IsDaemonCommand(args):
+        output = DaemonRequest(sys.argv[1:])
+
+        if output is not None:
+            print(output, end='')
+            return
+
+    try:
+        with Span('RunCommand'):
+            RunCommand(args)
+
+        # writes went straight to Google - have a running daemon pick them up now
+        if any(getattr(args, name) for name in DAEMON_WRITES):
+            DaemonRequest()
+
+    finally:
+        if args.profile:
+            PrintProfile()
+
+        if args.trace:
+            WriteTrace(args.trace)
+
+    if _apiStats['retries'] or _apiStats['throttled'] >= 1:
+        print(f"⏳ [INFO] Google API: {_apiStats['requests']} requests, {_apiStats['retries']} retries "
+              f"({_apiStats['backoff']:.1f}s backing off), {_apiStats['throttled']:.1f}s throttled.")
+
+
+###############################################################################
+#
+# Procedure   : RunCommand()
+#
+# Description : Executes a parsed command line.
+#             : Shared by Main() and the daemon.
+#
+# Input       : args - parsed CLI arguments
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def RunCommand(args):
+
+    global USE_CACHE, PAGE_SIZE
+    USE_CACHE = not args.no_cache
+    PAGE_SIZE = max(1, min(args.page_size, 2500))
+
     #
     # --bday-show-today 
     # --bday-show-week
     # takes top priority
     #
 
+    if args.migrate_tags:
+        MigrateTags()
+        return
+
+    if args.bday_reindex:
+        cache = OpenEventCache()
+
+        try:
+            indexed = RebuildBirthdayIndex(GetCalendarService(), cache)
+
+        finally:
+            cache.close()
+
+        print(f"🎂 [INFO] Birthday index rebuilt: {indexed} birthdays.")
+        return
+
     if args.bday_show_today:
         ShowTodaysBirthdays()
         return
 
+    #
+    # --bday-show-all
+    #
+
+    elif args.bday_show_all:
+        ShowAllBirthdays()
+        return
+
     #
     # --bday-show
     #
@@ -1214,69 +5399,65 @@ def Main():
         return
 
     #
+    # --watch
     # --today
     #
 
-    if args.today:
-        print(f"📅  Today’s Schedule ({datetime.now().strftime('%b %d')}):")
-
-        service = GetCalendarService()
-        events = FetchTodayEvents(service)
+    if args.watch is not None:
+        WatchView(args)
 
-        if not events:
-            print("😴  No events scheduled for today.\n")
+    elif args.dashboard:
+        ShowDashboard(args)
 
-        else:
-            for event in events:
-                start       = event['start'].get('dateTime', event['start'].get('date'))
-                summary     = event.get('summary', '(No Title)')
-                location    = event.get('location', '')
-                timeStr     = FormatTime(start) if 'T' in start else "All Day"
-                description = event.get("description", "").strip()
+    elif args.today:
+        ShowTodaySchedule(args)
 
-                print(f"🕘 {timeStr} - {summary}")
+    #
+    # --week
+    #
 
-                if location:
-                    print(f"📍 {location}")
+    elif args.week:
+        ShowWeekSchedule(args)
 
-                if description:
-                    print(f"📝 Note: {description}")
+    #
+    # --summary
+    # --vibe-check
+    #
 
-                if args.showids and event.get('id'):
-                    print(f"🆔 {event['id']}")
-                #print("")
+    elif args.summary:
+        ShowSummary(args)
 
-        # now let's show birthdays for today
+    elif args.vibe_check:
+        ShowVibeCheck(args)
 
-        today = datetime.now().date()
+    #
+    # --search
+    # --search-all
+    #
 
-        birthdayEvents   = service.events().list(
-            calendarId   = 'primary',
-            timeMin      = datetime.combine(today, datetime.min.time()).isoformat() + 'Z',
-            timeMax      = datetime.combine(today, datetime.max.time()).isoformat() + 'Z',
-            q            = "🎂",
-            singleEvents = True,
-            orderBy      = 'startTime'
-        ).execute()
+    elif args.search or args.search_all:
+        ShowSearch(args)
 
-        birthdaysToday = birthdayEvents.get('items', [])
+    #
+    # --insights
+    #
 
-        if birthdaysToday:
+    elif args.insights:
+        ShowInsights(args)
 
-            print("\n🎉 Birthday(s):")
+    #
+    # --export
+    #
 
-            for event in birthdaysToday:
-                summary = event.get('summary', '(No Title)')
-                start   = event['start'].get('dateTime', event['start'].get('date'))
-                timeStr = FormatTime(start) if 'T' in start else "All Day"
-                print(f"{summary}")
+    elif args.export:
+        ExportEvents(args.export)
 
     #
-    # --week
+    # --import
     #
 
-    elif args.week:
-        ShowWeekSchedule(args)
+    elif getattr(args, 'import'):
+        ImportEvents(getattr(args, 'import'))
 
     #
     # --add
@@ -1340,8 +5521,7 @@ def Main():
         service = GetCalendarService()
 
         try:
-            service.events().delete(calendarId='primary', eventId=args.remove).execute()
-            print(f"🗑️ [INFO] Event {args.remove} deleted.")
+            DeleteEvents(service, args.remove, verbose=True)
 
         except Exception as e:
             print(f"❌ [ERROR] Could not delete event: {e}")
@@ -1381,6 +5561,13 @@ def Main():
             except ValueError:
                 print("❌ [ERROR] Invalid date format (Use MM/DD)")
 
+    #
+    # --bday-import
+    #
+
+    if args.bday_import:
+        ImportBirthdays(args.bday_import)
+
     #
     # --bday-remove
     #
@@ -1398,9 +5585,13 @@ def Main():
         AddCatchUpEvent(args.catchup, args.date)
         return
 
+    if args.catchup:
+        ScheduleCatchUps([name.strip() for name in args.catchup.split(",")], args.seed)
+        return
+
     if args.catchup_suggest:
         names = [name.strip() for name in args.catchup_suggest.split(",")]
-        SuggestCatchUps(names)
+        SuggestCatchUps(names, args.seed)
         return
 
     if args.catchup_list:
@@ -0,0 +1,687 @@
+#!/usr/bin/python
+
+#
+#     Title    : CalBossBench.py
+#     Version  : 1.0
+#     Date     : 17 October 2026
+#
+#     Function : Benchmarks for CalBoss.
+#              : - startup : cold-start time of each command line, using
+#              :             'python -X importtime' for the import share.
+#              : - suite   : offline end-to-end timings of the main views
+#              :             against an in-process stand-in for the
+#              :             Calendar v3 API, filled with a synthetic
+#              :             calendar (no network, no credentials).
+#
+#     Usage    : CalBossBench.py [--runs N] [--save FILE] [--baseline FILE]
+#              :                 [-- "<calboss args>" ...]
+#              : CalBossBench.py --suite [--events 1000,100000] [--runs N]
+#              :                 [--save FILE] [--baseline FILE]
+#
+
+import io
+import os
+import sys
+import json
+import bisect
+import random
+import argparse
+import tempfile
+import itertools
+import contextlib
+import importlib.util
+import statistics
+import subprocess
+
+from time     import perf_counter
+from datetime import datetime, timedelta, timezone
+
+CALBOSS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'CalBoss.py')
+
+# commands that never touch the network, safe to run anywhere
+STARTUP_COMMANDS = ['--help', '--version']
+
+# --suite: synthetic calendar sizes (SUITE_LARGE added by --large, the
+# scale CalBoss is meant to hold up at), and the share of recurring series
+SUITE_EVENTS    = '1000,10000'
+SUITE_LARGE     = '100000,1000000'
+SUITE_RECURRING = 0.01
+SUITE_PEOPLE    = 50
+
+###############################################################################
+#
+# Procedure   : ImportTime()
+#
+# Description : Sums the cumulative time of top-level imports from the
+#             : stderr of 'python -X importtime'.
+#
+# Input       : stderr - string - captured stderr of the child process
+#
+# Returns     : tuple - (total seconds, {module: seconds}) for top-level imports
+#
+###############################################################################
+
+def ImportTime(stderr):
+
+    modules = {}
+
+    for line in stderr.splitlines():
+
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+
+        _, cumulative, name = line.split('|')
+
+        # nested imports are indented under their parent
+        if not name.startswith('  '):
+            try:
+                modules[name.strip()] = int(cumulative) / 1e6
+
+            except ValueError:
+                continue
+
+    return sum(modules.values()), modules
+
+
+###############################################################################
+#
+# Procedure   : TimeCommand()
+#
+# Description : Runs one CalBoss command line in a fresh interpreter.
+#
+# Input       : argv - list - CalBoss arguments
+#
+# Returns     : tuple - (wall seconds, import seconds, {module: seconds})
+#
+###############################################################################
+
+def TimeCommand(argv):
+
+    start  = perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', CALBOSS] + argv,
+                            capture_output=True, text=True)
+    wall   = perf_counter() - start
+
+    imports, modules = ImportTime(result.stderr)
+
+    return wall, imports, modules
+
+
+###############################################################################
+#
+# Procedure   : BenchStartup()
+#
+# Description : Cold-start benchmark: median wall and import time per
+#             : command line over 'runs' fresh interpreters.
+#
+# Input       : commands - list - command lines (strings)
+#             : runs     - int  - interpreter launches per command
+#             : top      - int  - slowest imports to list per command
+#
+# Returns     : dict - command = {'wall': seconds, 'imports': seconds}
+#
+###############################################################################
+
+def BenchStartup(commands, runs, top):
+
+    results = {}
+
+    print(f"🚀 Cold start ({runs} runs, median)\n")
+    print(f"{'command':<32} {'wall ms':>10} {'import ms':>10}")
+
+    for command in commands:
+
+        samples = [TimeCommand(command.split()) for _ in range(runs)]
+        wall    = statistics.median(sample[0] for sample in samples)
+        imports = statistics.median(sample[1] for sample in samples)
+
+        results[command] = {'wall': wall, 'imports': imports}
+
+        print(f"{command:<32} {wall * 1000:>10.1f} {imports * 1000:>10.1f}")
+
+        slowest = sorted(samples[-1][2].items(), key=lambda item: -item[1])[:top]
+
+        for module, seconds in slowest:
+            print(f"    {module:<28} {seconds * 1000:>10.1f}")
+
+    return results
+
+
+###############################################################################
+#
+# Class       : FakeRequest
+#
+# Description : Stand-in for googleapiclient's HttpRequest: runs 'call'
+#             : on execute() and round-trips the response through JSON,
+#             : so decoding costs what it would on the wire.
+#
+###############################################################################
+
+class FakeRequest:
+
+    def __init__(self, call, params=None):
+        self.call   = call
+        self.params = params or {}
+
+    def execute(self, http=None, num_retries=0):
+        return json.loads(json.dumps(self.call()))
+
+
+###############################################################################
+#
+# Class       : FakeBatch
+#
+# Description : Stand-in for BatchHttpRequest (callback per request).
+#
+###############################################################################
+
+class FakeBatch:
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, callback=None, request_id=None):
+        self.requests.append((request_id or str(len(self.requests)), request, callback or self.callback))
+
+    def execute(self, http=None):
+
+        for requestId, request, callback in self.requests:
+
+            try:
+                response, exception = request.execute(), None
+
+            except Exception as e:
+                response, exception = None, e
+
+            callback(requestId, response, exception)
+
+
+###############################################################################
+#
+# Class       : FakeEvents
+#
+# Description : Stand-in for service.events(): list (paging, sync tokens,
+#             : privateExtendedProperty, q, timeMin/timeMax, fields
+#             : masks), list_next, insert, import_, get, update, patch
+#             : and delete. Recurring masters are never expanded, as
+#             : with singleEvents=False.
+#
+###############################################################################
+
+class FakeEvents:
+
+    def __init__(self, service):
+        self.service = service
+
+    def list(self, calendarId='primary', pageToken=None, syncToken=None, maxResults=250, fields=None, **params):
+
+        service = self.service
+
+        def Call():
+
+            if pageToken:
+                queryId, offset = pageToken.split(':')
+                items, version  = service.queries[queryId]
+
+            else:
+                items, version = service.Query(calendarId, syncToken, params), service.version
+                queryId, offset = str(len(service.queries)), 0
+                service.queries[queryId] = (items, version)
+
+            offset = int(offset)
+            page   = {'items': [service.Mask(item, fields) for item in items[offset:offset + maxResults]]}
+
+            if offset + maxResults < len(items):
+                page['nextPageToken'] = f"{queryId}:{offset + maxResults}"
+
+            else:
+                page['nextSyncToken'] = str(version)
+
+            return page
+
+        return FakeRequest(Call, dict(params, calendarId=calendarId, maxResults=maxResults, fields=fields))
+
+    def list_next(self, request, page):
+
+        if 'nextPageToken' not in page:
+            return None
+
+        return self.list(pageToken=page['nextPageToken'], **request.params)
+
+    def insert(self, calendarId='primary', body=None, **params):
+        return FakeRequest(lambda: self.service.Store(calendarId, dict(body)))
+
+    def import_(self, calendarId='primary', body=None, **params):
+        return self.insert(calendarId, body)
+
+    def get(self, calendarId='primary', eventId=None):
+        return FakeRequest(lambda: self.service.calendars[calendarId][eventId])
+
+    def update(self, calendarId='primary', eventId=None, body=None):
+        return FakeRequest(lambda: self.service.Store(calendarId, dict(body, id=eventId)))
+
+    def patch(self, calendarId='primary', eventId=None, body=None):
+        return FakeRequest(lambda: self.service.Store(calendarId, dict(self.service.calendars[calendarId][eventId], **body)))
+
+    def delete(self, calendarId='primary', eventId=None):
+        return FakeRequest(lambda: self.service.Store(calendarId, dict(self.service.calendars[calendarId][eventId], status='cancelled')) and '')
+
+
+###############################################################################
+#
+# Class       : FakeFreeBusy
+#
+# Description : Stand-in for service.freebusy(): busy ranges of the timed,
+#             : non-recurring events of each calendar asked for.
+#
+###############################################################################
+
+class FakeFreeBusy:
+
+    def __init__(self, service):
+        self.service = service
+
+    def query(self, body):
+
+        def Call():
+
+            lower     = FakeEpoch(body['timeMin'])
+            upper     = FakeEpoch(body['timeMax'])
+            calendars = {}
+
+            for item in body['items']:
+
+                busy = [{'start': event['start']['dateTime'], 'end': event['end']['dateTime']}
+                        for event in self.service.calendars.get(item['id'], {}).values()
+                        if event['status'] != 'cancelled' and 'dateTime' in event['start'] and not event.get('recurrence')
+                        and FakeEpoch(event['end']) > lower and FakeEpoch(event['start']) < upper]
+
+                calendars[item['id']] = {'busy': busy}
+
+            return {'calendars': calendars}
+
+        return FakeRequest(Call)
+
+
+###############################################################################
+#
+# Class       : FakeCalendarService
+#
+# Description : In-process stand-in for the Calendar v3 service object.
+#             : Every change gets a version number; a sync token is the
+#             : version it was issued at, so an incremental list only
+#             : walks the changes since (bisect into the change log).
+#
+###############################################################################
+
+class FakeCalendarService:
+
+    def __init__(self):
+        self.calendars = {}
+        self.changes   = []
+        self.version   = 0
+        self.queries   = {}
+        self.ids       = itertools.count(1)
+
+    def events(self):
+        return FakeEvents(self)
+
+    def freebusy(self):
+        return FakeFreeBusy(self)
+
+    def new_batch_http_request(self, callback=None):
+        return FakeBatch(callback)
+
+    def Store(self, calendarId, event):
+
+        from zoneinfo import ZoneInfo
+
+        # the API answers naive local times with their offset applied
+        for edge in ('start', 'end'):
+            when = event.get(edge, {})
+
+            if 'dateTime' in when and when.get('timeZone') and datetime.fromisoformat(when['dateTime']).tzinfo is None:
+                when['dateTime'] = datetime.fromisoformat(when['dateTime']).replace(tzinfo=ZoneInfo(when['timeZone'])).isoformat()
+
+        event.setdefault('id', f"ev{next(self.ids)}")
+        event.setdefault('iCalUID', f"{event['id']}@fake")
+        event.setdefault('status', 'confirmed')
+        event['htmlLink'] = f"https://calendar.invalid/{event['id']}"
+
+        self.version += 1
+        self.calendars.setdefault(calendarId, {})[event['id']] = event
+        self.changes.append((self.version, calendarId, event['id']))
+
+        return event
+
+    def Query(self, calendarId, syncToken, params):
+
+        events = self.calendars.get(calendarId, {})
+
+        if syncToken:
+            since = bisect.bisect_right(self.changes, (int(syncToken), '\uffff'))
+            ids   = dict.fromkeys(eventId for _, changed, eventId in self.changes[since:] if changed == calendarId)
+            return [events[eventId] for eventId in ids]
+
+        single = params.get('singleEvents')
+        items  = [event for event in events.values()
+                  if event['status'] != 'cancelled' or (event.get('recurringEventId') and not single)]
+
+        filters = params.get('privateExtendedProperty') or []
+
+        for condition in [filters] if isinstance(filters, str) else filters:
+            key, value = condition.split('=', 1)
+            items = [event for event in items if event.get('extendedProperties', {}).get('private', {}).get(key) == value]
+
+        if params.get('q'):
+            text  = params['q'].lower()
+            items = [event for event in items
+                     if text in ' '.join(event.get(key, '') for key in ('summary', 'location', 'description')).lower()]
+
+        if params.get('timeMin'):
+            lower = FakeEpoch(params['timeMin'])
+            items = [event for event in items if event.get('recurrence') or FakeEpoch(event['end']) > lower]
+
+        if params.get('timeMax'):
+            upper = FakeEpoch(params['timeMax'])
+            items = [event for event in items if FakeEpoch(event['start']) < upper]
+
+        return sorted(items, key=lambda event: FakeEpoch(event['start']))
+
+    @staticmethod
+    def Mask(event, fields):
+
+        if not fields or 'items(' not in fields:
+            return event
+
+        # top-level keys only - 'attendees(self,responseStatus)' keeps 'attendees'
+        keys = {key.split('(')[0] for key in fields.split('items(', 1)[1].rstrip(')').split(',')}
+
+        return {key: event[key] for key in keys if key in event}
+
+
+###############################################################################
+#
+# Procedure   : FakeEpoch()
+#
+# Description : Epoch seconds of an ISO string or event start/end field.
+#             : All-day dates count from UTC midnight - close enough for
+#             : the stand-in's window filters.
+#
+# Input       : value - string or dict
+#
+# Returns     : float
+#
+###############################################################################
+
+def FakeEpoch(value):
+
+    if isinstance(value, dict):
+        value = value.get('dateTime') or value['date'] + 'T00:00:00+00:00'
+
+    moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+
+    return moment.timestamp()
+
+
+###############################################################################
+#
+# Procedure   : GenerateCalendar()
+#
+# Description : Fills the stand-in with a synthetic 'primary' calendar.
+#             : - 'count' events over the last two years and next one.
+#             : - SUITE_RECURRING of them recurring (weekly/daily) series.
+#             : - One tagged birthday per 100 events (max 1000).
+#             : - Tagged catch-ups for SUITE_PEOPLE people, past and future.
+#             : Bodies come from CalBoss' own builders where it has them.
+#
+# Input       : calboss - module - CalBoss
+#             : service - FakeCalendarService
+#             : count   - int    - number of ordinary events
+#             : seed    - int    - random seed (same seed, same calendar)
+#
+# Returns     : list - names of the people with catch-ups
+#
+###############################################################################
+
+def GenerateCalendar(calboss, service, count, seed=42):
+
+    rng  = random.Random(seed)
+    zone = 'America/New_York'
+    now  = datetime.now().replace(minute=0, second=0, microsecond=0)
+
+    def Timed(start, minutes):
+        return ({'dateTime': start.isoformat(), 'timeZone': zone},
+                {'dateTime': (start + timedelta(minutes=minutes)).isoformat(), 'timeZone': zone})
+
+    for index in range(count):
+
+        day   = now + timedelta(days=rng.randint(-730, 365))
+        start = day.replace(hour=rng.randint(7, 19), minute=rng.choice((0, 15, 30, 45)))
+        event = {'summary' : f"{rng.choice(('Sync', 'Lunch', 'Review', 'Gym', 'Call', 'Dentist'))} {index}",
+                 'location': rng.choice(('', '', 'Room 4', "Moe's Backyard"))}
+
+        if rng.random() < SUITE_RECURRING:
+            event['start'], event['end'] = Timed(start, 30)
+            event['recurrence']          = [rng.choice(('RRULE:FREQ=WEEKLY', 'RRULE:FREQ=DAILY;COUNT=200'))]
+
+        elif rng.random() < 0.05:
+            event['start'] = {'date': day.strftime('%Y-%m-%d')}
+            event['end']   = {'date': (day + timedelta(days=1)).strftime('%Y-%m-%d')}
+
+        else:
+            event['start'], event['end'] = Timed(start, rng.choice((30, 60, 90)))
+
+        service.Store('primary', event)
+
+    for index in range(min(count // 100, 1000)):
+        month, day = rng.randint(1, 12), rng.randint(1, 28)
+        service.Store('primary', calboss.BirthdayEvent(f"Person {index}", month, day))
+
+    people = [f"Friend {index}" for index in range(SUITE_PEOPLE)]
+
+    for name in people:
+        for offset in (-900, -400, rng.randint(1, 300)):
+
+            start = (now + timedelta(days=offset)).replace(hour=20)
+            service.Store('primary', calboss.CatchUpEvent(name, start))
+
+    return people
+
+
+###############################################################################
+#
+# Procedure   : BenchSuite()
+#
+# Description : Offline end-to-end benchmark of the main CalBoss views
+#             : against FakeCalendarService, per calendar size.
+#             : - 'full sync' : first run with an empty local cache.
+#             : - the views   : warm cache, incremental sync included, as
+#             :                 a real second invocation would run.
+#             : Output of the views is discarded, but any error or warning
+#             : in it fails the run, as does a full sync that did not
+#             : cache every event. API pacing is disabled (there is no
+#             : quota to respect).
+#
+# Input       : sizes - list - calendar sizes (ordinary events)
+#             : runs  - int  - repetitions per measurement
+#
+# Returns     : dict - "view [size]" = {'wall': median seconds}
+#
+###############################################################################
+
+def BenchSuite(sizes, runs):
+
+    sys.path.insert(0, os.path.dirname(CALBOSS))
+
+    import CalBoss
+
+    results = {}
+    home    = os.getcwd()
+
+    print(f"🧪 Offline suite ({runs} runs, median)\n")
+    print(f"{'view':<32} {'events':>8} {'wall ms':>10}")
+
+    for size in sizes:
+
+        with tempfile.TemporaryDirectory() as workdir:
+
+            os.chdir(workdir)
+
+            try:
+                service = FakeCalendarService()
+                people  = GenerateCalendar(CalBoss, service, size)
+
+                CalBoss._calendarService = service
+                CalBoss.API_RATE         = 1e9
+                CalBoss.ExpandRule.cache_clear()
+
+                args  = CalBoss.ParseArgs([])
+                clear = iter(people)
+
+                def FullSync():
+                    if os.path.exists(CalBoss.CACHE_FILE):
+                        os.remove(CalBoss.CACHE_FILE)
+                    CalBoss.SyncCalendars(service)
+
+                cases = [
+                    ('full sync',               FullSync),
+                    ('FetchTodayEvents',        lambda: CalBoss.FetchTodayEvents(service)),
+                    ('ShowWeekSchedule',        lambda: CalBoss.ShowWeekSchedule(args)),
+                    ('ShowAllBirthdays',        lambda: CalBoss.ShowAllBirthdays()),
+                    ('SuggestCatchUps',         lambda: CalBoss.SuggestCatchUps(people[:10])),
+                    ('SuggestCatchUps --seed',  lambda: CalBoss.SuggestCatchUps(people[:10], 1)),
+                    ('ClearCatchUpEvents',      lambda: CalBoss.ClearCatchUpEvents(next(clear))),
+                ]
+
+                if importlib.util.find_spec('numpy'):
+                    cases.insert(-1, ('ShowInsights', lambda: CalBoss.ShowInsights(CalBoss.ParseArgs(['--insights']))))
+
+                for name, call in cases:
+
+                    samples = []
+
+                    for _ in range(min(runs, len(people)) if name == 'ClearCatchUpEvents' else runs):
+
+                        output = io.StringIO()
+                        start  = perf_counter()
+
+                        with contextlib.redirect_stdout(output):
+                            call()
+
+                        samples.append(perf_counter() - start)
+
+                        problems = [line.strip() for line in output.getvalue().splitlines()
+                                    if any(level in line for level in ('[ERROR]', '[EXCEPTION]', '[WARN'))]
+
+                        if problems:
+                            raise RuntimeError(f"{name} [{size}]: {problems[0]}")
+
+                    if name == 'full sync':
+
+                        expected = sum(event.get('status') != 'cancelled'
+                                       for calendarId in CalBoss.CALENDARS
+                                       for event in service.calendars.get(calendarId, {}).values())
+
+                        cache  = CalBoss.OpenEventCache()
+                        cached = cache.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+                        cache.close()
+
+                        if cached != expected:
+                            raise RuntimeError(f"full sync [{size}]: cached {cached} of {expected} events")
+
+                    wall = statistics.median(samples)
+                    results[f"{name} [{size}]"] = {'wall': wall}
+
+                    print(f"{name:<32} {size:>8} {wall * 1000:>10.1f}")
+
+            finally:
+                os.chdir(home)
+
+    return results
+
+
+###############################################################################
+#
+# Procedure   : CompareBaseline()
+#
+# Description : Prints the change against a saved baseline file.
+#
+# Input       : results  - dict   - this run, from a Bench*() procedure
+#             : baseline - string - path of a previous --save file
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def CompareBaseline(results, baseline):
+
+    with open(baseline) as handle:
+        previous = json.load(handle)
+
+    print(f"\n📊 Against {baseline}:\n")
+
+    for name, current in results.items():
+
+        if name not in previous:
+            continue
+
+        before = previous[name]['wall']
+        change = (current['wall'] - before) / before * 100 if before else 0.0
+
+        print(f"{name:<32} {before * 1000:>10.1f} -> {current['wall'] * 1000:>8.1f} ms  ({change:+.1f}%)")
+
+
+###############################################################################
+#
+# Procedure   : Main()
+#
+# Description : Entry point.
+#
+# Input       : -none-
+#
+# Returns     : -none-
+#
+###############################################################################
+
+def Main():
+
+    parser = argparse.ArgumentParser(description="CalBoss benchmarks.")
+
+    parser.add_argument("commands",   nargs="*",
+                        help='CalBoss command lines for the cold-start benchmark, after "--" '
+                             '(default: "--help" "--version"). Network commands such as '
+                             '"--today" need credentials.')
+    parser.add_argument("--suite",    action="store_true", help="Run the offline view benchmarks instead of cold start.")
+    parser.add_argument("--events",   type=str, default=SUITE_EVENTS,
+                        help=f"Synthetic calendar sizes for --suite, comma-separated (default: {SUITE_EVENTS}).")
+    parser.add_argument("--large",    action="store_true",
+                        help=f"Add the large tiers ({SUITE_LARGE} events) to --suite; minutes per run, try --runs 1.")
+    parser.add_argument("--runs",     type=int, default=5, help="Repetitions per measurement.")
+    parser.add_argument("--top",      type=int, default=5, help="Slowest imports to list per command.")
+    parser.add_argument("--save",     type=str, help="Write results as json (a future --baseline).")
+    parser.add_argument("--baseline", type=str, help="Compare against a previous --save file.")
+
+    args = parser.parse_args()
+
+    if args.suite:
+        sizes   = args.events + (',' + SUITE_LARGE if args.large else '')
+        results = BenchSuite(list(dict.fromkeys(int(size) for size in sizes.split(','))), args.runs)
+
+    else:
+        results = BenchStartup(args.commands or STARTUP_COMMANDS, args.runs, args.top)
+
+    if args.baseline:
+        CompareBaseline(results, args.baseline)
+
+    if args.save:
+        with open(args.save, 'w') as handle:
+            json.dump(results, handle, indent=2)
+
+
+if __name__ == "__main__":
+    Main()